@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Hashable, Iterable, Mapping
 
 import ixmp
 import pandas as pd
@@ -26,13 +26,162 @@ def _add_unit(mp: ixmp.Platform, unit: str, comment: str) -> None:
             raise
 
 
+def _element_key(element) -> Hashable:
+    """Return a hashable key for a set `element` given in a :class:`.Spec`.
+
+    :class:`.Code` are represented by their IDs; elements of indexed sets (lists or
+    tuples) by tuples of :class:`str`; anything else by its :class:`str`.
+    """
+    if isinstance(element, Code):
+        return element.id
+    elif isinstance(element, (list, tuple)):
+        return tuple(map(str, element))
+    return str(element)
+
+
+def _set_keys(scenario: Scenario, set_name: str) -> set[Hashable]:
+    """Return the contents of `set_name` in `scenario` as a :class:`set` of keys."""
+    base_set = scenario.set(set_name)
+    if isinstance(base_set, pd.DataFrame):
+        # Unpack a multi-dimensional/indexed set to tuples
+        return set(map(_element_key, base_set.itertuples(index=False)))
+    else:
+        return set(map(str, base_set.tolist()))
+
+
+def diff_spec(
+    scenario: Scenario, spec: Spec | Mapping[str, ScenarioInfo]
+) -> dict[str, dict[str, list]]:
+    """Compute the changes to the sets of `scenario` needed to apply `spec`.
+
+    Each set mentioned by `spec` is read from `scenario` once and indexed by
+    :func:`hash`, so that membership checks take constant time regardless of the size
+    of the set.
+
+    Returns
+    -------
+    dict
+        Keys are set names, in the order in which they must be modified: basic
+        (non-indexed) sets first. Values are :class:`dict` with keys "remove" and "add",
+        each a list of elements from `spec`. "remove" contains only elements that are
+        present in `scenario`; "add" only those that are not.
+
+    Raises
+    ------
+    ValueError
+        if any of the elements from ``spec["require"]`` are missing from `scenario`.
+    """
+    result: dict[str, dict[str, list]] = dict()
+
+    # Sort the list of sets by the number of dimensions; this places basic (non-indexed)
+    # sets first
+    for _, set_name in sorted(
+        (len(scenario.idx_sets(s)), s) for s in scenario.set_list()
+    ):
+        # Check whether this set is mentioned at all in the spec
+        if 0 == sum(map(lambda info: len(info.set[set_name]), spec.values())):
+            continue
+
+        # Base contents of the set
+        base = _set_keys(scenario, set_name)
+
+        # Check for required elements
+        missing = [
+            e for e in spec["require"].set[set_name] if _element_key(e) not in base
+        ]
+        if missing:
+            log.error(f"  {len(missing)} elements not found: {missing!r}")
+            raise ValueError(f"Missing elements of set {set_name!r}: {missing!r}")
+
+        # Elements to remove: only those currently present
+        remove = _unique(
+            e for e in spec["remove"].set[set_name] if _element_key(e) in base
+        )
+        removed = set(map(_element_key, remove))
+
+        # Elements to add: those absent, or removed in the previous step
+        add = _unique(
+            e
+            for e in spec["add"].set[set_name]
+            if _element_key(e) not in base or _element_key(e) in removed
+        )
+
+        result[set_name] = dict(remove=remove, add=add)
+
+    return result
+
+
+def _unique(elements: Iterable) -> list:
+    """Return `elements` without duplicates, preserving order."""
+    seen: set[Hashable] = set()
+    result = []
+    for e in elements:
+        if (key := _element_key(e)) not in seen:
+            seen.add(key)
+            result.append(e)
+    return result
+
+
+def _bulk_key(scenario: Scenario, set_name: str, elements: list):
+    """Convert `elements` to a single `key` argument for bulk add/remove methods."""
+    if len(idx_names := scenario.idx_names(set_name)) == 0:
+        return [_element_key(e) for e in elements]
+    else:
+        return pd.DataFrame(
+            [
+                (key,) if isinstance(key := _element_key(e), str) else key
+                for e in elements
+            ],
+            columns=idx_names,
+        )
+
+
+def _apply_diff(
+    scenario: Scenario,
+    diff: dict[str, dict[str, list]],
+    dry_run: bool,
+    dump: dict[str, pd.DataFrame] | None,
+) -> None:
+    """Apply `diff` from :func:`diff_spec` to `scenario` with 1 call per set and action.
+
+    Used by :func:`apply_spec` with :py:`batch=True`.
+    """
+    # Existing 'region' codes stored on the Platform associated with `scenario`
+    platform_regions = set(scenario.platform.regions()["region"])
+
+    for set_name, d in diff.items():
+        log.info(f"Set {set_name!r}: remove {len(d['remove'])}, add {len(d['add'])}")
+
+        # Remove elements and associated parameter values
+        if len(d["remove"]):
+            if dump is not None and 0 == len(scenario.idx_sets(set_name)):
+                strip_par_data(
+                    scenario, set_name, d["remove"], dry_run=dry_run, dump=dump
+                )
+            elif not dry_run:
+                key = _bulk_key(scenario, set_name, d["remove"])
+                scenario.remove_set(set_name, key)
+
+        if dry_run or 0 == len(d["add"]):
+            continue
+
+        # Add elements
+        scenario.add_set(set_name, _bulk_key(scenario, set_name, d["add"]))
+        log.debug("  " + ellipsize(d["add"]))
+
+        if set_name == "node":
+            for name in map(_element_key, d["add"]):
+                if name not in platform_regions:
+                    scenario.platform.add_region(name, "region")
+
+
 # FIXME Reduce complexity from 14 to ≤13
 def apply_spec(  # noqa: C901
     scenario: Scenario,
     spec: Spec | Mapping[str, ScenarioInfo],
     data: Callable | None = None,
     **options,
-):
+) -> dict[str, dict[str, list]]:
     """Apply `spec` to `scenario`.
 
     Parameters
@@ -43,8 +192,21 @@ def apply_spec(  # noqa: C901
         Function to add data to `scenario`. `data` can either manipulate the scenario
         directly, or return a :class:`dict` compatible with :func:`.add_par_data`.
 
+    Returns
+    -------
+    dict
+        Report of changes to sets. Keys are set names; values are :class:`dict` with
+        keys "remove" and "add", each a list of elements. With :py:`batch=True`, these
+        are the elements actually removed or added (or, with :py:`dry_run=True`, that
+        would be); otherwise, those given by `spec`.
+
     Other parameters
     ----------------
+    batch : bool
+        Compute all changes to sets up front using :func:`diff_spec`, then add or remove
+        elements of each set with a single call to :meth:`~.ixmp.Scenario.add_set` or
+        :meth:`~.ixmp.Scenario.remove_set`. This is much faster for scenarios and specs
+        with many set elements. Default :obj:`False`.
     dry_run : bool
         Don't modify `scenario`; only show what would be done. Default :obj:`False`.
         Exceptions will still be raised if the elements from ``spec['required']`` are
@@ -61,10 +223,12 @@ def apply_spec(  # noqa: C901
     See also
     --------
     .add_par_data
+    .diff_spec
     .strip_par_data
     .Code
     .ScenarioInfo
     """
+    batch = options.get("batch", False)
     dry_run = options.get("dry_run", False)
     fast = options.get("fast", False)
 
@@ -78,11 +242,20 @@ def apply_spec(  # noqa: C901
         maybe_check_out(scenario)
 
     dump: dict[str, pd.DataFrame] = {}  # Removed data
+    report: dict[str, dict[str, list]] = {}  # Changes to sets
+
+    if batch:
+        report = diff_spec(scenario, spec)
+        _apply_diff(scenario, report, dry_run, None if fast else dump)
 
     # Sort the list of sets by the number of dimensions; this places basic (non-indexed)
     # sets first. Elements for these sets must be added before elements for indexed
     # sets that may reference them.
-    sets = sorted((len(scenario.idx_sets(s)), s) for s in scenario.set_list())
+    sets = (
+        []
+        if batch
+        else sorted((len(scenario.idx_sets(s)), s) for s in scenario.set_list())
+    )
 
     # Existing 'region' codes stored on the Platform associated with `scenario`
     platform_regions = set(scenario.platform.regions()["region"])
@@ -141,6 +314,11 @@ def apply_spec(  # noqa: C901
 
         log.info("  ---")
 
+        report[set_name] = dict(
+            remove=list(spec["remove"].set[set_name]),
+            add=list(spec["add"].set[set_name]),
+        )
+
     if not fast:
         N_removed = sum(len(d) for d in dump.values())
         log.info(f"{N_removed} total rows removed")
@@ -165,6 +343,8 @@ def apply_spec(  # noqa: C901
         message=options.get("message", f"{__name__}.apply_spec()"),
     )
 
+    return report
+
 
 def ellipsize(elements: list) -> str:
     """Generate a short string representation of `elements`.
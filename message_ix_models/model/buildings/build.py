@@ -6,7 +6,7 @@ from collections import defaultdict
 from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from copy import deepcopy
 from itertools import product
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import message_ix
 import pandas as pd
@@ -1066,7 +1066,7 @@ def materials(
     result = defaultdict(list)
 
     # Create new input/output for building material intensities
-    common = dict(
+    common: dict[str, Any] = dict(
         time="year",
         time_origin="year",
         time_dest="year",
@@ -8,7 +8,7 @@ for aluminum technologies, demand, trade, and related constraints.
 import os
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import pandas as pd
 from message_ix import make_df
@@ -1110,7 +1110,7 @@ def gen_alumina_trade_tecs(s_info: ScenarioInfo) -> "ParameterData":
     nodes = nodes_ex_world(s_info.N)
     global_region = [i for i in s_info.N if i.endswith("_GLB")][0]
 
-    common = {
+    common: dict[str, Any] = {
         "time": "year",
         "time_origin": "year",
         "time_dest": "year",
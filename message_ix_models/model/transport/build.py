@@ -1,7 +1,9 @@
 """Build MESSAGEix-Transport on a base model."""
 
 import logging
-from copy import copy
+from collections import OrderedDict
+from collections.abc import Callable
+from copy import copy, deepcopy
 from functools import partial
 from importlib import import_module
 from operator import itemgetter
@@ -35,6 +37,8 @@ from .structure import get_commodity_groups, get_technology_groups
 if TYPE_CHECKING:
     from typing import TypedDict
 
+    from genno.core.key import KeyLike
+
     from message_ix_models.tools.exo_data import ExoDataSource
 
     AddTasksKw = TypedDict("AddTasksKw", {"context": Context, "strict": bool})
@@ -348,11 +352,19 @@ def add_structure(c: Computer) -> None:
     - ``t::transport RAIL`` etc.: :class:`dict` mapping "t" to the elements of
       ``t::RAIL``.
     - All of the keys in :data:`.bcast_tcl` and :data:`.bcast_y`.
+
+    If :attr:`.transport.Config.reuse_structure` is :any:`True`, the tasks that do not
+    depend on "config", "context", or "scenario" are computed once for each distinct
+    structure and replaced with their results. Later calls with the same structure—for
+    instance, for builds with other scenario codes on the same base—reuse these.
     """
     from ixmp.report import configure
 
     from .operator import broadcast_t_c_l, broadcast_y_yv_ya
 
+    # Keys existing before this function is called
+    existing = set(c.graph)
+
     # Retrieve configuration and other information
     config: "Config" = c.graph["context"].transport  # .model.transport.Config object
     info = config.base_model_info  # ScenarioInfo describing the base scenario
@@ -502,6 +514,60 @@ def add_structure(c: Computer) -> None:
     # Indexers
     c.add(K.coord.yv_hist, lambda periods: dict(yv=periods), K.y_.historical)
 
+    if config.reuse_structure:
+        _reuse_structure(c, [k for k in c.graph if k not in existing])
+
+
+#: Results of tasks added by :func:`add_structure`, for up to :data:`_STRUCTURE_MAX`
+#: distinct structures, most recently used last. See
+#: :attr:`.transport.Config.reuse_structure`.
+_STRUCTURE: OrderedDict[str, dict] = OrderedDict()
+_STRUCTURE_MAX = 4
+
+
+def _reuse_structure(c: Computer, keys: list) -> int:
+    """Replace tasks for `keys` in `c` with results, reusing those from earlier calls.
+
+    Each computer receives its own copy of the results, so tasks that modify their
+    inputs in place do not affect other computers.
+
+    Returns
+    -------
+    int
+        the number of tasks replaced.
+    """
+    from dask.core import istask, literal
+    from genno.caching import hash_args
+
+    from message_ix_models.report.util import freeze
+
+    config: "Config" = c.graph["context"].transport
+    spec = config.spec
+    h = hash_args(
+        [spec.add, spec.remove, spec.require],
+        config.base_model_info,
+        config.demand_modes,
+        config.with_scenario,
+    )
+
+    if h in _STRUCTURE:
+        log.info(f"Reuse {len(_STRUCTURE[h])} structure tasks")
+        _STRUCTURE.move_to_end(h)
+    else:
+        freeze(c, *keys, dynamic=("config", "context", "scenario"))
+        # Store results, i.e. anything except tasks that remain to be computed
+        _STRUCTURE[h] = {
+            k: value
+            for k in keys
+            if not istask(value := c.graph[k]) or isinstance(value[0], literal)
+        }
+        # Discard the least recently used results
+        while len(_STRUCTURE) > _STRUCTURE_MAX:
+            _STRUCTURE.popitem(last=False)
+
+    c.graph.update(deepcopy(_STRUCTURE[h]))
+    return len(_STRUCTURE[h])
+
 
 @minimum_version("genno 1.28")
 def get_computer(
@@ -525,6 +591,9 @@ def get_computer(
     - "add transport data": a list of keys which, when computed, causes all data for
       MESSAGEix-Transport to be computed and added to the "scenario".
 
+    If :attr:`.transport.Config.cache_size` is not 0, :func:`.cache_tasks` is used so
+    that results of tasks are stored and reused by later calls with the same settings.
+
     Parameters
     ----------
     obj :
@@ -600,19 +669,42 @@ def get_computer(
     c.add("context", context)
     c.add("scenario", scenario)
 
-    # Add structure-related keys
-    add_structure(c)
-    # Add exogenous data
-    add_exogenous_data(c, config.base_model_info)
-
+    steps: list[tuple[str, Any]] = [
+        # Add structure-related keys
+        ("structure", add_structure),
+        # Add exogenous data
+        ("exogenous", partial(add_exogenous_data, info=config.base_model_info)),
+    ]
     # For each module in transport.Config.modules, invoke the function
     # prepare_computer() to add further calculations
     for name in context.transport.modules:
         module = import_module(name if "." in name else f"..{name}", __name__)
-        module.prepare_computer(c)
-
+        steps.append((name, module.prepare_computer))
     # Add tasks for debugging the build
-    add_debug(c)
+    steps.append(("debug", add_debug))
+
+    # Record the module or step that added or replaced each task, for profile()
+    origin = c.graph["config"].setdefault("task module", {})
+    for name, func in steps:
+        before = dict(c.graph)
+        func(c)
+        origin.update({k: name for k, v in c.graph.items() if before.get(k) is not v})
+
+    if config.cache_size:
+        # Store and reuse results of tasks that do not depend on the scenario
+        from message_ix_models.util.cache import cache_tasks
+
+        # Fingerprint of the settings that affect the build: the transport settings,
+        # plus the model settings read by tasks. Other settings, for instance the
+        # target scenario, do not affect the results.
+        fp = [config.fingerprint(), context.model.regions, context.model.years]
+        cache_tasks(
+            c,
+            "add transport data",
+            path=context.core.cache_path.joinpath("transport-build"),
+            max_size=config.cache_size,
+            leaves=dict(config=fp, context=fp),
+        )
 
     if visualize and HAS_GRAPHVIZ:
         path = context.get_local_path("transport", "build.svg")
@@ -623,6 +715,52 @@ def get_computer(
     return c
 
 
+def profile(c: Computer, key: "KeyLike", n: int = 50) -> Any:
+    """Compute `key` in `c` while recording the cost of each task.
+
+    This uses :func:`.report.util.profile`, and labels each task with the module or
+    step of :func:`get_computer` that added it. Two files are written in the local data
+    directory:
+
+    - :file:`transport/profile-module.csv`: total time, size of return values, and
+      number of tasks for each module.
+    - :file:`transport/profile-task.csv`: the `n` tasks that take the most time.
+
+    Returns
+    -------
+    Any
+        the result of :py:`c.get(key)`.
+    """
+    from message_ix_models.report.util import profile
+
+    result, data = profile(c, key)
+
+    # Label tasks with their originating module
+    origin = c.graph["config"].get("task module", {})
+    data.insert(1, "module", data["key"].map(lambda k: origin.get(k, "")))
+
+    by_module = (
+        data.groupby("module")
+        .agg(
+            tasks=("key", "size"),
+            time=("time", "sum"),
+            nbytes=("nbytes", "sum"),
+            memory=("memory", "max"),
+        )
+        .sort_values("time", ascending=False)
+    )
+    log.info(f"Cost of tasks by module:\n{by_module.to_string()}")
+
+    context: Context = c.graph["context"]
+    for name, df, index in (("module", by_module, True), ("task", data.head(n), False)):
+        path = context.get_local_path("transport", f"profile-{name}.csv")
+        path.parent.mkdir(exist_ok=True, parents=True)
+        df.to_csv(path, index=index)
+        log.info(f"Wrote {path}")
+
+    return result
+
+
 def main(
     context: Context,
     scenario: Scenario,
@@ -644,6 +782,8 @@ def main(
     apply_spec
     get_spec
     """
+    from message_ix_models.util.genno import get_parallel
+
     from .emission import strip_emissions_data
     from .util import sum_numeric
 
@@ -662,14 +802,23 @@ def main(
     # - Prepares the "add transport data" key used below
     c = get_computer(context, scenario=scenario, options=options)
 
+    # Compute keys, possibly while profiling or using multiple threads
+    get: Callable[[Computer, "KeyLike"], Any]
+    if context.transport.profile:
+        get = profile
+    elif context.transport.workers > 1:
+        get = partial(get_parallel, workers=context.transport.workers)
+    else:
+        get = Computer.get
+
     def _add_data(s, **kw):
         assert s is c.graph["scenario"]
-        result = c.get("add transport data")
+        result = get(c, "add transport data")
         # For calls to add_par_data(), int() are returned with number of observations
         log.info(f"Added {sum_numeric(result)} total obs")
 
     if context.core.dry_run:
-        return c.get(K.debug)
+        return get(c, K.debug)
 
     # First strip existing emissions data
     strip_emissions_data(scenario, context)
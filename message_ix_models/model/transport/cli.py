@@ -50,6 +50,30 @@ cli.add_command(
                 is_flag=True,
                 help="Skip removing data for removed set elements.",
             ),
+            click.Option(
+                ["--cache-size", "cache_size"],
+                type=int,
+                default=0,
+                help="Store up to N bytes of build results for reuse.",
+                metavar="N",
+            ),
+            click.Option(
+                ["--profile"],
+                is_flag=True,
+                help="Record the cost of build tasks by module.",
+            ),
+            click.Option(
+                ["--reuse-structure"],
+                is_flag=True,
+                help="Compute structure once for all scenario codes.",
+            ),
+            click.Option(
+                ["--workers"],
+                type=int,
+                default=1,
+                help="Compute independent build data using N threads.",
+                metavar="N",
+            ),
             click.Option(
                 ["--model-extra", "target_model_name"],
                 callback=exec_cb("context.core.dest_scenario['model'] = value"),
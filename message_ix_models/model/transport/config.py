@@ -1,8 +1,8 @@
 import logging
 import re
 from collections.abc import Iterator
-from dataclasses import InitVar, dataclass, field, replace
-from typing import TYPE_CHECKING, Any, Literal
+from dataclasses import InitVar, dataclass, field, fields, replace
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from genno import Quantity
 from genno.operator import as_quantity
@@ -59,6 +59,11 @@ class Config(ConfigHelper):
     # Private attribute for `code` property
     _code: "common.Code | None" = None
 
+    #: Maximum size, in bytes, of stored results of tasks in
+    #: :func:`.build.get_computer`. If not 0, results are stored and reused in later
+    #: builds with the same settings; see :func:`.cache_tasks`.
+    cache_size: int = 0
+
     #: Scaling factors for costs.
     #:
     #: ``ldv nga``
@@ -201,6 +206,10 @@ class Config(ConfigHelper):
     #: scenario.
     policy: set["Policy"] = field(default_factory=set)
 
+    #: If :any:`True`, :func:`.build.main` uses :func:`.build.profile` to record the
+    #: time and memory used by each task and module.
+    profile: bool = False
+
     #: Flags for distinct scenario features according to projects. In addition to
     #: providing values directly, this can be set by passing :attr:`futures_scenario` or
     #: :attr:`navigate_scenario` to the constructor, or by calling
@@ -215,6 +224,11 @@ class Config(ConfigHelper):
         )
     )
 
+    #: If :any:`True`, compute the structure added by :func:`.build.add_structure` once,
+    #: and reuse it for later builds with the same structure, for instance for other
+    #: scenario codes on the same base.
+    reuse_structure: bool = False
+
     #: Scaling factors for production function [0]
     scaling: float = 1.0
 
@@ -239,6 +253,10 @@ class Config(ConfigHelper):
     #: Work hours per year, used to compute the value of time.
     work_hours: Quantity = quantity_field("1600 hours / passenger / year")
 
+    #: Number of threads used by :func:`.build.main` to compute independent data for
+    #: MESSAGEix-Transport concurrently. See :func:`.get_parallel`.
+    workers: int = 1
+
     #: Year for share convergence.
     year_convergence: int = 2110
 
@@ -258,6 +276,17 @@ class Config(ConfigHelper):
     #: :attr:`project` via :meth:`.ScenarioFlags.parse_navigate`.
     navigate_scenario: InitVar[str] = None
 
+    # Attributes omitted by fingerprint()
+    _fingerprint_exclude: ClassVar[set[str]] = {
+        "cache_size",
+        "fast",
+        "profile",
+        "reuse_structure",
+        "with_scenario",
+        "with_solution",
+        "workers",
+    }
+
     def __post_init__(self, extra_modules, futures_scenario, navigate_scenario) -> None:
         self.use_modules(extra_modules)
 
@@ -392,6 +421,31 @@ class Config(ConfigHelper):
         if all(map(lambda s: s.value > 0, [s1, s2])):
             raise ValueError(f"Scenario settings {s1} and {s2} are not compatible")
 
+    def fingerprint(self) -> str:
+        """Return a hash of the settings that affect data computed in :mod:`.build`.
+
+        All attributes are included except :attr:`cache_size`, :attr:`fast`,
+        :attr:`profile`, :attr:`reuse_structure`, :attr:`with_scenario`,
+        :attr:`with_solution`, and :attr:`workers`.
+        """
+        from genno.caching import hash_args
+
+        data: dict[str, Any] = dict()
+        for f in fields(self):
+            if f.name in self._fingerprint_exclude:
+                continue
+            value = getattr(self, f.name)
+            if isinstance(value, Spec):
+                data[f.name] = [value.add, value.remove, value.require]
+            elif isinstance(value, ScenarioInfo):
+                data[f.name] = value
+            elif isinstance(value, set):
+                data[f.name] = sorted(map(repr, value))
+            else:
+                data[f.name] = repr(value)
+
+        return hash_args(**data)
+
     def get_target_url(self, context: "Context") -> str:
         """Construct a target URL for a built MESSAGEix-Transport scenario.
 
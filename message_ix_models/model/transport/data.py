@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from functools import cache, partial
 from itertools import chain
 from operator import le
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import genno
 import pandas as pd
@@ -503,7 +503,7 @@ def conversion(
 
     The technologies are named 'transport {service} load factor'.
     """
-    common = dict(
+    common: dict[str, Any] = dict(
         year_vtg=years,
         year_act=years,
         mode="all",
@@ -564,7 +564,7 @@ def dummy_supply(technologies: list["Code"], info, config) -> dict[str, pd.DataF
 
     result: dict[str, pd.DataFrame] = dict()
     common = dict(mode="all", time="year", time_dest="year", unit="GWa")
-    values = dict(output=1.0, var_cost=1.0)
+    values: dict[str, Any] = dict(output=1.0, var_cost=1.0)
 
     # Make one source technology for each (level, commodity)
     for level, c in sorted(level_commodity):
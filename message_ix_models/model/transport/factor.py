@@ -13,16 +13,19 @@ import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
-from functools import partial
+from functools import cache, lru_cache, partial
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+import xarray as xr
 from genno import Computer, Key, Quantity
 from genno import operator as g
 
 from message_ix_models.project.ssp import SSP_2024
 
 if TYPE_CHECKING:
+    from types import CodeType
+
     import genno.core.key
 
 log = logging.getLogger(__name__)
@@ -44,6 +47,10 @@ class Layer(ABC):
     #:   :py:`other ** 1 = other`.
     operation: Callable
 
+    #: Dimensions dropped from the combined result after applying this layer. See
+    #: :meth:`apply`.
+    drop: tuple[str, ...] = ()
+
     def __hash__(self) -> int:
         return hash(repr(self))
 
@@ -212,6 +219,8 @@ class ScenarioSetting(Layer):
 
     operation = operator.mul
 
+    drop = ("setting",)
+
     def __init__(self, setting: dict | None = None, *, default=None, **setting_kw):
         self.setting = setting or setting_kw
         self.default = default
@@ -311,25 +320,44 @@ class Factor:
         The result will have **at least** the dimensions and labels in `coords`, and
         **may** may have additional dimensions not from `coords`.
 
+        The quantification of each layer is memoized for identical `coords`. The
+        quantifications are aligned and broadcast against one another once, and then
+        combined in sequence using each layer's :attr:`.Layer.operation`. This gives the
+        same result as calling :meth:`.Layer.apply` for each layer in turn.
+
         Parameters
         ----------
         coords :
             Target :mod:`xarray`-style coords: dimension IDs mapped to lists of labels.
         """
-        # Base result: quantify the first layer
-        result = self.layers[0].quantify(coords)
-
-        # Handle each layer in sequence
-        for layer in self.layers[1:]:
-            # Compute the quantification of the layer, apply to the previous result
-            result = layer.apply(result, coords)
+        arrays = []
+        for layer in self.layers:
+            array, removed = _quantify(layer, _freeze(coords))
+            # Keys removed by the layer, e.g. "scenario", are not seen by later layers
+            for k in removed:
+                coords.pop(k)
+            arrays.append(array)
+
+        # Align labels along every dimension, as AttrSeries binary operations do, and
+        # broadcast to a common shape
+        aligned = xr.broadcast(*xr.align(*arrays, join="inner"))
+
+        # Combine the layers in sequence
+        data = aligned[0].data
+        for layer, array in zip(self.layers[1:], aligned[1:]):
+            data = layer.operation(data, array.data)
+
+        result = aligned[0].copy(data=data)
+        for layer in self.layers:
+            result = result.isel({d: 0 for d in layer.drop}, drop=True)
 
         # Ensure the result has complete dimensionality and scope
-        assert set(result.coords) >= set(coords), (result.coords, coords)
+        missing = set(coords) - set(result.dims)
+        assert not missing, (result.coords, coords)
         for k, v in coords.items():
-            assert set(v) == set(result.coords[k].data)
+            assert result.sizes[k] == len(set(v)), (k, result.coords[k], v)
 
-        return result
+        return Quantity(result.to_series().dropna(), units="dimensionless")
 
     # genno connection
 
@@ -354,10 +382,43 @@ class Factor:
     ) -> Quantity:
         """Invoke :meth:`quantify`, for use with :mod:`genno`."""
         kw = dict(zip(dims, coords))
-        kw.update(scenario=eval(scenario_expr, dict(config=config)))
+        kw.update(scenario=eval(_compile(scenario_expr), dict(config=config)))
         return self.quantify(**kw)
 
 
+@cache
+def _compile(expr: str) -> "CodeType":
+    """Compile `expr` once for repeated :func:`eval` in :meth:`.Factor.__call__`."""
+    return compile(expr, "<scenario_expr>", "eval")
+
+
+def _freeze(coords: Mapping[str, Any]) -> tuple:
+    """Return a hashable representation of `coords`."""
+    return tuple(
+        (k, tuple(v) if isinstance(v, (list, tuple, pd.Index)) else v)
+        for k, v in coords.items()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _quantify(layer: Layer, coords: tuple) -> tuple[xr.DataArray, tuple[str, ...]]:
+    """Memoized :meth:`.Layer.quantify`.
+
+    Returns the quantification of `layer` as a dense :class:`xarray.DataArray`, and the
+    keys that :meth:`.Layer.quantify` removed from `coords` (for instance, by
+    :class:`.ScenarioSetting`).
+    """
+    kw = {k: list(v) if isinstance(v, tuple) else v for k, v in coords}
+    qty = layer.quantify(kw)
+    removed = tuple(k for k, _ in coords if k not in kw)
+
+    if isinstance(qty, xr.DataArray):
+        return xr.DataArray(qty), removed
+    elif not len(qty.dims):
+        return xr.DataArray(qty.item()), removed
+    return xr.DataArray.from_series(qty.to_series()), removed
+
+
 #: Common settings of ‘L’ow -20%, ‘M’edium = 0%, ‘H’igh = +20%.
 LMH = Map(
     "setting", L=Constant(0.8, "n y"), M=Constant(1.0, "n y"), H=Constant(1.2, "n y")
@@ -3,7 +3,7 @@
 import logging
 from collections.abc import Mapping
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from genno import Computer, Key, Quantity, quote
@@ -241,7 +241,9 @@ def usage_data(
     They are "virtual" in the sense they have no cost, lifetime, or other physical
     properties.
     """
-    common = dict(year_vtg=years, year_act=years, mode="all", time="year")
+    common: dict[str, Any] = dict(
+        year_vtg=years, year_act=years, mode="all", time="year"
+    )
 
     data = []
     for mode in filter(lambda m: m != "LDV", map(str, modes)):
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from contextlib import nullcontext
 from copy import deepcopy
 from functools import partial
@@ -37,6 +38,7 @@ __all__ = [
     "prepare_reporter",
     "register",
     "report",
+    "report_batch",
 ]
 
 
@@ -131,7 +133,9 @@ def iamc(c: Reporter, info):
 
     - Use the MESSAGEix-GLOBIOM custom :func:`.util.collapse` callback to perform
       renaming etc. while collapsing dimensions to the IAMC ones. The "var" key from
-      the entry, if any, is passed to the `var` argument of that function.
+      the entry, if any, is passed to the `var` argument of that function. Other
+      entries in the "collapse" key, such as ``exact: true``, are passed as keyword
+      arguments.
 
     - Provide optional partial sums. The "sums" key of the entry can give a list of
       strings such as ``["x", "y", "x-y"]``; in this case, the conversion to IAMC format
@@ -238,7 +242,8 @@ def report(context: Context, *args, **kwargs):
           retrieve the Scenario to be reported.
 
         - :py:`context.report`, which is an instance of :class:`.report.Config`; see
-          there for available configuration settings.
+          there for available configuration settings. If :attr:`.Config.profile` is
+          :data:`True`, :func:`.report.util.profile` is used to compute the key.
     """
     # Handle deprecated usage that appears in:
     # - .model.cli.new_baseline()
@@ -281,13 +286,129 @@ def report(context: Context, *args, **kwargs):
     ):
         rep, key = prepare_reporter(context)
 
+    _get(context, rep, key)
+
+
+def report_batch(contexts: Iterable[Context]) -> None:
+    """Report (post-process) solution data in multiple :class:`Scenarios <.Scenario>`.
+
+    Like calling :func:`report` for each of `contexts`, except that the
+    :class:`.Reporter` is prepared once, using :func:`prepare_reporter`, and then
+    re-used for subsequent scenarios via :func:`.report.util.rebind`. Tasks that depend
+    on neither the scenario nor the output directory—for instance, groups of codes from
+    code lists, or GWP factors—are computed once, using :func:`.report.util.freeze`.
+
+    All `contexts` **should** have the same :py:`context.report` settings, except for
+    the scenario to be reported. If a scenario has a different structure than the
+    previous one, differs in whether it has a solution, or its context has different
+    :py:`context.model` settings, a new Reporter is prepared.
+
+    If :attr:`.Config.cli_output` is given, the output for each scenario is written to
+    a distinct file: the :attr:`.ScenarioInfo.path` is appended to the file name. For
+    instance, :file:`out.csv` becomes :file:`out_model_scenario_v1.csv`.
+    """
+    from ixmp.report import common
+
+    from .util import freeze
+
+    rep: Reporter | None = None
+    key: "KeyLike | None" = None
+
+    for context in contexts:
+        mark_time()
+
+        if context.report.legacy["use"]:
+            _invoke_legacy_reporting(context)
+            continue
+
+        scenario = context.get_scenario()
+
+        if cli_output := context.report.cli_output:
+            # Distinct file for each scenario
+            si = ScenarioInfo(scenario, empty=True)
+            context.report.cli_output = cli_output.with_name(
+                f"{cli_output.stem}_{si.path}{cli_output.suffix}"
+            )
+
+        if rep is not None and not _rebind(context, rep, key, scenario):
+            rep = None
+
+        if rep is None:
+            with (
+                nullcontext()
+                if context.core.verbose
+                else silence_log("genno message_ix_models")
+            ):
+                rep, key = prepare_reporter(context, scenario=scenario)
+
+            if key and not context.dry_run:
+                # Compute tasks that do not depend on the scenario or output directory
+                dynamic = ["config", "scenario"]
+                dynamic.extend(
+                    common.RENAME_DIMS.get(n, n) for n in scenario.set_list()
+                )
+                freeze(rep, key, dynamic=dynamic)
+
+        _get(context, rep, key)
+
+    mark_time()
+
+
+def _rebind(
+    context: Context, rep: Reporter, key: "KeyLike | None", scenario: Scenario
+) -> bool:
+    """Prepare `rep` from :func:`report_batch` to compute `key` for `scenario`.
+
+    Returns
+    -------
+    bool
+        :data:`False` if `rep` cannot be used, and a new Reporter must be prepared.
+    """
+    from .util import rebind
+
+    if rep.graph["config"]["model"] != context.model:
+        log.info("Different model configuration; prepare a new Reporter")
+        return False
+
+    try:
+        rebind(rep, scenario)
+    except ValueError as e:
+        log.info(f"{e}; prepare a new Reporter")
+        return False
+
+    if context.report.use_scenario_path:
+        # Same output directory as prepare_reporter()
+        si = ScenarioInfo(scenario, empty=True)
+        context.report.set_output_dir(context.report.output_dir.joinpath(si.path))
+    rep.graph["config"]["output_dir"] = context.report.output_dir
+    context.report.mkdir()
+
+    if context.report.cli_output and key:
+        # Same task as prepare_reporter(), with the path for `scenario`
+        rep.add(key, "write_report", rep.graph[key][1], path=context.report.cli_output)
+
+    return True
+
+
+def _get(context: Context, rep: Reporter, key: "KeyLike | None") -> None:
+    """Compute `key` using `rep` and log the result."""
     log_before(context, rep, key)
 
     if context.dry_run:
         return
 
     with discard_on_error(rep.graph["scenario"]):
-        result = rep.get(key)
+        if context.report.profile:
+            from .util import profile
+
+            path = context.report.output_dir.joinpath("profile.csv")
+            result, _ = profile(rep, key, path=path)
+        elif context.report.workers > 1:
+            from message_ix_models.util.genno import get_parallel
+
+            result = get_parallel(rep, key, workers=context.report.workers)
+        else:
+            result = rep.get(key)
 
     # Display information about the result
     log.info(
@@ -358,6 +479,9 @@ def prepare_reporter(
 
         If :attr:`.cli_output` is given, a task with the key "cli-output" is added that
         writes the :attr:`.Config.key` to that path.
+
+        If :attr:`.Config.prune` is :data:`True`, tasks not needed to compute the
+        returned key are removed.
     .Key
         Same as :attr:`.Config.key` if any, but in full resolution; else either
         "default" or "cli-output" according to the other settings.
@@ -403,7 +527,9 @@ def prepare_reporter(
         **deepcopy(context.report.genno_config),
         fail="raise" if has_solution else logging.NOTSET,
     )
-    rep.configure(model=deepcopy(context.model))
+    rep.configure(
+        model=deepcopy(context.model), write_ts=deepcopy(context.report.write_ts)
+    )
 
     # Apply callbacks for other modules which define additional reporting computations
     for callback in context.report.iter_callbacks():
@@ -423,7 +549,10 @@ def prepare_reporter(
             # Add a new task that writes `key` to the specified file
             key = single_key(
                 rep.add(
-                    "cli-output", "write_report", key, path=context.report.cli_output
+                    Key("cli-output"),
+                    "write_report",
+                    key,
+                    path=context.report.cli_output,
                 )
             )
     elif rep.default_key:
@@ -432,6 +561,12 @@ def prepare_reporter(
     else:
         log.info("No key given and no default")
 
+    if key and context.report.prune:
+        from .util import prune
+
+        # Remove tasks not needed for `key`
+        prune(rep, key, keep=("config", "scenario"))
+
     # Create the output directory
     context.report.mkdir()
 
@@ -24,6 +24,19 @@ def _modules_arg(context, param, value):
     show_default=True,
     help="Path or stem for reporting config file.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes to run legacy reporting tables.",
+)
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Prepare reporting once for all scenarios from --urls-from-file.",
+)
 @click.option("--legacy", "-L", is_flag=True, help="Invoke 'legacy' reporting.")
 @click.option(
     "--module",
@@ -42,9 +55,38 @@ def _modules_arg(context, param, value):
     type=click.Path(writable=True, resolve_path=True, path_type=Path),
     help="Write output to PATH instead of console or default locations.",
 )
+@click.option(
+    "--profile", is_flag=True, help="Record time and memory used by each task."
+)
+@click.option("--prune", is_flag=True, help="Remove tasks not needed for KEY.")
+@click.option(
+    "--warm-cache",
+    is_flag=True,
+    help="Only populate caches of structure-only tasks, then exit.",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of threads to compute tasks that do not use the scenario.",
+)
 @click.argument("key", default="message::default")
 @click.pass_obj
-def cli(context, config_file, legacy, cli_output, key, **kwargs):
+def cli(
+    context,
+    config_file,
+    batch,
+    jobs,
+    legacy,
+    cli_output,
+    profile,
+    prune,
+    warm_cache,
+    workers,
+    key,
+    **kwargs,
+):
     """Postprocess results.
 
     KEY defaults to the comprehensive report 'message::default', but may also be the
@@ -54,22 +96,44 @@ def cli(context, config_file, legacy, cli_output, key, **kwargs):
     the stem (i.e. name without .yaml extension) of a file in data/report.
 
     With --urls-from-file, read multiple Scenario identifiers from FILE, and report each
-    one. In this usage, --output-path may only be a directory.
+    one. In this usage, --output-path may only be a directory. With --batch, all the
+    scenarios must have the same structure; the reporting computations are prepared
+    once and reused for each scenario.
 
     If --verbose is given to the top-level CLI, the full description of the steps to
     calculate KEY is printed, as well as the entire result, if any.
+
+    With --profile, the time and memory used by each task are written to a file
+    profile.csv in the output directory.
+
+    With --warm-cache, no scenario is reported. Instead, the caches of tasks that
+    depend only on package data, such as GWP factors and aggregation mappings for all
+    node code lists, are populated for use by later runs.
     """
     from copy import deepcopy
 
     from message_ix_models.util._logging import mark_time
 
-    from . import report
+    from . import report, report_batch
     from .config import Config
 
+    if warm_cache:
+        from .util import warm_cache as _warm_cache
+
+        _warm_cache()
+        return
+
     # Update the reporting configuration from command-line parameters
     context.report = Config(
-        from_file=config_file, key=key, cli_output=cli_output, _legacy=legacy
+        from_file=config_file,
+        key=key,
+        cli_output=cli_output,
+        _legacy=legacy,
+        profile=profile,
+        prune=prune,
+        workers=workers,
     )
+    context.report.legacy.update(jobs=jobs)
 
     # Prepare a list of Context objects, each referring to one Scenario.
     contexts = []
@@ -90,8 +154,11 @@ def cli(context, config_file, legacy, cli_output, key, **kwargs):
         ctx.scenario_info = dict(si)
         contexts.append(ctx)
 
-    for ctx in contexts:
-        mark_time()
-        report(ctx)
+    if batch:
+        report_batch(contexts)
+    else:
+        for ctx in contexts:
+            mark_time()
+            report(ctx)
 
     mark_time()
@@ -92,16 +92,50 @@ class Config(ConfigHelper):
         default_factory=lambda: _local_data_factory().joinpath("report"), kw_only=True
     )
 
+    #: :data:`True` to record the time and memory used by each task while reporting,
+    #: using :func:`.report.util.profile`. The data are written to
+    #: :file:`profile.csv` in :attr:`output_dir`.
+    profile: bool = field(default=False, kw_only=True)
+
+    #: :data:`True` to remove from the :class:`.Reporter`, in
+    #: :func:`~.report.prepare_reporter`, all tasks not needed to compute :attr:`key`.
+    #: See :func:`.report.util.prune`.
+    prune: bool = field(default=False, kw_only=True)
+
     #: :data:`True` to use an output directory based on the scenario's model name and
     #: name.
     use_scenario_path: bool = True
 
+    #: Number of threads used to compute tasks that do not depend on the scenario. See
+    #: :func:`.get_parallel`.
+    workers: int = field(default=1, kw_only=True)
+
     #: Keyword arguments for :func:`.report.legacy.iamc_report_hackathon.report`, plus
     #: the key "use", which should be :any:`True` if legacy reporting is to be used.
     legacy: dict = field(
         default_factory=lambda: dict(use=False, merge_hist=True), kw_only=True
     )
 
+    #: Options for writing time series data to file and storing on the scenario, used
+    #: by :func:`.store_write_ts`:
+    #:
+    #: - "formats": any of "csv", "feather", "parquet", and "xlsx".
+    #: - "incremental": :any:`True` to store only time series data that differ from
+    #:   existing data on the scenario. See :func:`.store_ts_incremental`.
+    #: - "partition": "region", "variable", or :any:`None`. See
+    #:   :func:`.report.operator.write_ts`.
+    #: - "xlsx_max_rows": files in "xlsx" format are only written for data with up to
+    #:   this many rows. Set to :any:`None` to always write.
+    write_ts: dict = field(
+        default_factory=lambda: dict(
+            formats=["csv", "xlsx"],
+            incremental=False,
+            partition=None,
+            xlsx_max_rows=100_000,
+        ),
+        kw_only=True,
+    )
+
     def __post_init__(self, from_file, _legacy) -> None:
         # Handle InitVars
         self.use_file(from_file)
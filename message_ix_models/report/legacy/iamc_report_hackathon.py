@@ -4,15 +4,19 @@ from pathlib import Path
 import pandas as pd
 import yaml
 from yaml.loader import SafeLoader
+
 from message_ix_models import Context
 from message_ix_models.util import package_data_path
-from message_ix_models.util.compat.message_data.get_historical_years import main as get_historical_years
+from message_ix_models.util.compat.message_data.get_historical_years import (
+    main as get_historical_years,
+)
 from message_ix_models.util.compat.message_data.get_nodes import get_nodes
-from message_ix_models.util.compat.message_data.get_optimization_years import main as get_optimization_years
+from message_ix_models.util.compat.message_data.get_optimization_years import (
+    main as get_optimization_years,
+)
 from message_ix_models.util.compat.message_data.utilities import retrieve_region_mapping
 
-from . import postprocess
-from . import pp_utils
+from . import parallel, postprocess, pp_utils
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +39,8 @@ def report(
     lu_hist=None,
     verbose=False,
     *,
+    prefetch=False,
+    jobs=1,
     context: Context | None = None,
 ):
     """Main reporting function.
@@ -90,6 +96,14 @@ def report(
         Historic land-use GHG emissions for regions.
     verbose : str (default: False)
         Option whther to print onscreen messages.
+    prefetch : boolean (default: False)
+        If :data:`True`, retrieve all data for each parameter or variable from `scen`
+        once, instead of once for each subset required by each table. See
+        :class:`.legacy.postprocess.Prefetch`.
+    jobs : int (default: 1)
+        Number of worker processes in which to run reporting tables in parallel. If
+        greater than 1, all data in `scen` are first copied to each worker process. See
+        :func:`.legacy.parallel.run_tables`.
     context : .Context
         Only the ``dry_run`` setting is respected. If :data:`True`, configuration is
         read, but nothing is done.
@@ -185,13 +199,13 @@ def report(
 
     if run_history != "True":
         # Configures reporting tools to retrieve results from optimization (var)
-        pp = postprocess.PostProcess(scen)
+        pp = postprocess.PostProcess(scen, prefetch=prefetch)
         pp_utils.firstmodelyear = scen.firstmodelyear
 
         pp_utils.years = get_optimization_years(scen)
     else:
         # Configures reporting tools to retrieve results from "reference_solution" (par)
-        pp = postprocess.PostProcess(scen, ix=False)
+        pp = postprocess.PostProcess(scen, ix=False, prefetch=prefetch)
         pp_utils.years = get_historical_years(scen) + get_optimization_years(scen)
 
     # Passes all model years to reporting tools
@@ -278,7 +292,7 @@ def report(
     # Run reporting tables
     # --------------------
 
-    dfs = {}
+    tasks = {}
     for i in run_tables:
         if run_tables[i]["active"] is True:
             print("processing Table:", run_tables[i]["root"])
@@ -287,12 +301,16 @@ def report(
                 and eval(run_tables[i]["condition"]) is True
             ):
                 continue
-            dfs[i] = (
-                func_dict[run_tables[i]["function"]]()
-                if "args" not in run_tables[i]
-                else func_dict[run_tables[i]["function"]](**run_tables[i]["args"])
+            tasks[i] = (
+                func_dict[run_tables[i]["function"]],
+                run_tables[i].get("args", {}),
             )
 
+    if jobs > 1:
+        dfs = parallel.run_tables(pp, tasks, jobs)
+    else:
+        dfs = {i: func(**kwargs) for i, (func, kwargs) in tasks.items()}
+
     # ---------------------------------
     # Convert dataframes to IAMC-format
     # ---------------------------------
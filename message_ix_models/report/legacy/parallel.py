@@ -0,0 +1,182 @@
+"""Run legacy reporting tables in parallel worker processes."""
+
+import logging
+import pickle
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from importlib import import_module
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from .postprocess import Prefetch
+
+log = logging.getLogger(__name__)
+
+#: Module-level variables used by table functions. These are set by
+#: :func:`.iamc_report_hackathon.report` in the parent process, and copied to each
+#: worker process by :func:`run_tables`. The variable "pp" is replaced by a
+#: :class:`.PostProcess` that retrieves data from a :class:`Snapshot`. Modules with
+#: alternative table functions are handled like :mod:`.default_tables`.
+STATE = {
+    "message_ix_models.report.legacy.pp_utils": (
+        "all_tecs",
+        "all_years",
+        "firstmodelyear",
+        "globalname",
+        "model_nm",
+        "region_id",
+        "regions",
+        "scen_nm",
+        "unit_conversion",
+        "verbose",
+        "years",
+    ),
+    "message_ix_models.report.legacy.default_tables": (
+        "kyoto_hist_data",
+        "lu_hist_data",
+        "mu",
+        "pp",
+        "run_history",
+        "urban_perc_data",
+    ),
+}
+
+
+class Snapshot:
+    """Read-only copy of all the data in a scenario.
+
+    Only the methods used by :class:`.PostProcess` and :mod:`.pp_utils` are provided:
+    :meth:`par`, :meth:`var`, :meth:`set`, and :meth:`var_list`. The `filters` argument
+    has the same meaning as for :meth:`ixmp.Scenario.par`.
+
+    Parameters
+    ----------
+    ds : ixmp.Scenario or .Prefetch
+        Data for every set, parameter, and variable are retrieved from `ds`. If `ds` is
+        a :class:`.Prefetch`, items it already holds are not retrieved again.
+    """
+
+    def __init__(self, ds):
+        self._data: dict[tuple[str, str], pd.DataFrame | pd.Series | dict] = {}
+        for kind in ("set", "par", "var"):
+            for name in getattr(ds, f"{kind}_list")():
+                self._data[kind, name] = getattr(ds, kind)(name)
+
+    def par(self, name, filters=None):
+        return self._get("par", name, filters)
+
+    def set(self, name, filters=None):
+        return self._get("set", name, filters)
+
+    def var(self, name, filters=None):
+        return self._get("var", name, filters)
+
+    def var_list(self) -> list[str]:
+        return [name for kind, name in self._data if kind == "var"]
+
+    def _get(self, kind, name, filters):
+        data = self._data[kind, name]
+        if not filters or not isinstance(data, pd.DataFrame):
+            return data.copy()
+
+        mask = np.full(len(data), True)
+        for dim, labels in filters.items():
+            if isinstance(labels, str) or not isinstance(labels, Iterable):
+                labels = [labels]
+            mask &= data[dim].isin(labels).to_numpy()
+        return data[mask].reset_index(drop=True)
+
+
+def _state(tasks: dict) -> dict[str, dict]:
+    """Return the values of :data:`STATE` in the current process."""
+    modules = dict(STATE)
+    for func, _ in tasks.values():
+        modules.setdefault(func.__module__, STATE[f"{__package__}.default_tables"])
+
+    result: dict[str, dict] = {}
+    for module_name, names in modules.items():
+        module = import_module(module_name)
+        result[module_name] = {
+            # Replaced in _init_worker()
+            n: (None if n == "pp" else getattr(module, n))
+            for n in names
+            if hasattr(module, n)
+        }
+    return result
+
+
+def _init_worker(path: Path) -> None:
+    """Initialize a worker process using the file at `path`.
+
+    Table functions retrieve data via a :class:`.Prefetch` of a :class:`Snapshot`, so
+    each worker selects subsets of each item in memory, without access to the scenario.
+    """
+    with open(path, "rb") as f:
+        pp, snapshot, state = pickle.load(f)
+
+    pp.ds = Prefetch(snapshot)
+
+    for module_name, values in state.items():
+        module = import_module(module_name)
+        for name, value in values.items():
+            setattr(module, name, pp if name == "pp" else value)
+
+
+def run_tables(pp, tasks: dict, jobs: int) -> dict:
+    """Run the table functions in `tasks` using `jobs` worker processes.
+
+    The parent process first retrieves all data from the scenario into a
+    :class:`Snapshot`, and writes this and the module-level variables listed in
+    :data:`STATE` to a temporary file. Each worker process is started with the "spawn"
+    method—so that the parent, with a running JVM, is not forked—and loads this file.
+    Workers do not access the scenario. Each worker holds a complete copy of the data,
+    so memory use is up to `jobs` + 1 times that of the data in the scenario.
+
+    Parameters
+    ----------
+    pp : .PostProcess
+        Used by the table functions.
+    tasks :
+        Mapping from keys to 2-tuples of (table function, keyword arguments). The
+        table functions must be importable by name from a module.
+
+    Returns
+    -------
+    dict
+        Mapping from the keys of `tasks`, in the same order, to the return values of
+        the table functions.
+    """
+    log.info("Retrieve all data from the scenario for worker processes")
+    ds = pp.ds if isinstance(pp.ds, Prefetch) else Prefetch(pp.ds)
+    snapshot = Snapshot(ds)
+
+    # Copy of `pp` without the reference to the scenario
+    pp_worker = copy(pp)
+    pp_worker.ds = None
+
+    with TemporaryDirectory() as tmp:
+        path = Path(tmp, "snapshot.pkl")
+        with open(path, "wb") as f:
+            pickle.dump(
+                (pp_worker, snapshot, _state(tasks)), f, pickle.HIGHEST_PROTOCOL
+            )
+
+        log.info(f"Run {len(tasks)} tables using {jobs} processes")
+        with ProcessPoolExecutor(
+            jobs,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(path,),
+        ) as pool:
+            futures = {
+                key: pool.submit(func, **kwargs)
+                for key, (func, kwargs) in tasks.items()
+            }
+
+        # Results in the same order as `tasks`, regardless of order of completion
+        return {key: future.result() for key, future in futures.items()}
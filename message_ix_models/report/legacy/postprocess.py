@@ -1,9 +1,100 @@
+import logging
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
 from . import pp_utils
 
+log = logging.getLogger(__name__)
 
-class PostProcess(object):
-    def __init__(self, ds, ix=True):
+
+class Prefetch:
+    """Wrap a :class:`.Scenario` `ds` to retrieve each item from it at most once.
+
+    The first call to :meth:`par` or :meth:`var` for a given item retrieves all of its
+    data from `ds`. This and later calls return the subset of this data selected by
+    `filters`, which have the same meaning as for :meth:`ixmp.Scenario.par`. The
+    positions of the rows for each label are indexed, so repeated selection (for
+    instance, of different technologies) is fast.
+
+    All other attributes and methods are those of `ds`.
+    """
+
+    def __init__(self, ds):
         self.ds = ds
+        self._data: dict[tuple[str, str], pd.DataFrame] = {}
+        self._index: dict[tuple[str, str, str], dict] = {}
+
+    def __getattr__(self, name):
+        return getattr(self.ds, name)
+
+    def par(self, name, filters=None, **kwargs):
+        """Return data for parameter `name`, selected by `filters`."""
+        return self._get("par", name, filters, **kwargs)
+
+    def var(self, name, filters=None, **kwargs):
+        """Return data for variable `name`, selected by `filters`."""
+        return self._get("var", name, filters, **kwargs)
+
+    def _get(self, kind, name, filters, **kwargs):
+        if kwargs:
+            # Other arguments, not handled here
+            return getattr(self.ds, kind)(name, filters, **kwargs)
+
+        key = (kind, name)
+        if key not in self._data:
+            log.debug(f"Retrieve {kind} {name!r}")
+            self._data[key] = getattr(self.ds, kind)(name)
+
+        data = self._data[key]
+        if not isinstance(data, pd.DataFrame):
+            return data.copy()  # Scalar; dict
+        elif not filters:
+            return data.copy()
+
+        # Intersection of positions for the labels along each dimension
+        positions = None
+        for dim, labels in filters.items():
+            p = self._positions(key, dim, labels)
+            positions = p if positions is None else np.intersect1d(positions, p)
+
+        result = data.take(positions)
+        if not len(result):
+            # Same as ixmp: types of empty columns are not set
+            result = result.astype(
+                {c: object for c in result.columns if result[c].dtype.kind in "iu"}
+            )
+        return result
+
+    def _positions(self, key, dim, labels) -> np.ndarray:
+        """Return sorted positions of rows of data for `key` with `labels` on `dim`."""
+        data = self._data[key]
+        if dim not in data.columns:
+            raise KeyError(dim)
+
+        try:
+            index = self._index[key + (dim,)]
+        except KeyError:
+            index = self._index[key + (dim,)] = data.groupby(dim, sort=False).indices
+
+        if isinstance(labels, str) or not isinstance(labels, Iterable):
+            labels = [labels]
+
+        # Convert labels to the type of the column
+        convert = int if data[dim].dtype.kind in "iu" else str
+
+        p = [index[convert(label)] for label in labels if convert(label) in index]
+        return np.sort(np.concatenate(p)) if p else np.array([], dtype=int)
+
+
+class PostProcess(object):
+    def __init__(self, ds, ix=True, prefetch=False):
+        """Functions to retrieve data from `ds`.
+
+        If `prefetch` is :any:`True`, `ds` is wrapped in :class:`.Prefetch`.
+        """
+        self.ds = Prefetch(ds) if prefetch else ds
         self.ix = ix
 
     # Functions which retrieve a single input parameter
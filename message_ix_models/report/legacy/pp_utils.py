@@ -1219,6 +1219,46 @@ def _retr_act_data(ds, ix, param, filter, units, convert=1):
     return df.sort_index()
 
 
+def _fill_year_act_vtg(df):
+    """Return rows of `df` where "year_act" == "year_vtg", filling missing years.
+
+    For each combination of "node_loc", "technology", and "year_act" that has no row
+    with "year_vtg" equal to "year_act", the rows with the latest "year_vtg" are used,
+    with "year_vtg" set to "year_act". This must be done separately for each region
+    and technology, as more than one technology may be in `df` and these have differing
+    lifetimes.
+
+    The rows for filled years appear after all others, ordered by the first appearance
+    in `df` of their region, technology, and year_act.
+    """
+    key = ["node_loc", "technology", "year_act"]
+    diag = df.year_act == df.year_vtg
+
+    # Combinations of (node_loc, technology, year_act) with at least 1 diagonal row
+    has_diag = (
+        diag.groupby([df[k] for k in key], sort=False).transform("any").astype(bool)
+    )
+    fill = df[~has_diag]
+
+    if len(fill):
+        # Rows with the latest year_vtg for each combination
+        latest = fill.groupby(key, sort=False)["year_vtg"].transform("max")
+        fill = fill[fill.year_vtg == latest].assign(year_vtg=lambda d: d.year_act)
+
+        # Order by first appearance in `df` of region, region/technology, and
+        # region/technology/year_act
+        order = pd.DataFrame(
+            {
+                i: pd.factorize(pd.MultiIndex.from_frame(df[key[: i + 1]]))[0]
+                for i in range(len(key))
+            },
+            index=df.index,
+        ).loc[fill.index]
+        fill = fill.loc[order.sort_values(list(order.columns), kind="stable").index]
+
+    return pd.concat([df[diag], fill], sort=True).reset_index(drop=True)
+
+
 def _retr_io_data(ds, ix, param, filter, formatting="standard"):
     """Retrieves commodity - input or commodity - output coefficients for a
     single or set of technolgies.
@@ -1271,30 +1311,9 @@ def _retr_io_data(ds, ix, param, filter, formatting="standard"):
             group = ["node_loc", "technology", "unit", "year_act", "year_vtg", "mode"]
 
         else:
-            # Filter out all entries where year_act == year_vtg
-            tmp = df[df.year_act == df.year_vtg]
-            # Fill years where year_act is greater than the latest
-            # year_vtg. This must be done for each region and technology
-            # as more than one technology may be in a datframe and these have
-            # differing lifetimes.
-            for reg in df.node_loc.unique():
-                for t in df[df.node_loc == reg].technology.unique():
-                    tmp_df = df[(df.node_loc == reg) & (df.technology == t)]
-                    yr_miss = [
-                        y
-                        for y in tmp_df.year_act.unique()
-                        if y
-                        not in tmp[
-                            (tmp.node_loc == reg) & (tmp.technology == t)
-                        ].year_vtg.unique()
-                    ]
-                    tmp_df = tmp_df[tmp_df.year_act.isin(yr_miss)]
-                    for y in yr_miss:
-                        tmp_df2 = tmp_df[tmp_df.year_act == y]
-                        tmp_df2 = tmp_df2[tmp_df2.year_vtg == tmp_df2.year_vtg.max()]
-                        tmp_df2.year_vtg = tmp_df2.year_act
-                        tmp = pd.concat([tmp, tmp_df2], sort=True)
-            tmp = tmp.reset_index().drop("index", axis=1)
+            # Filter out all entries where year_act == year_vtg, and fill years where
+            # year_act is greater than the latest year_vtg
+            tmp = _fill_year_act_vtg(df)
 
             df = tmp
             if param == "input":
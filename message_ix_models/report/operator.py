@@ -11,6 +11,7 @@ from collections.abc import (
     MutableMapping,
     Sequence,
 )
+from copy import deepcopy
 from functools import cache, reduce
 from itertools import filterfalse, product
 from typing import TYPE_CHECKING, Any, Literal
@@ -27,7 +28,9 @@ from message_ix_models.model.structure import get_codelist
 from message_ix_models.util import (
     MappingAdapter,
     WildcardAdapter,
+    _concat,
     add_par_data,
+    cached,
     nodes_ex_world,
 )
 from message_ix_models.util.sdmx import leaf_ids
@@ -75,7 +78,9 @@ __all__ = [
     "select_allow_empty",
     "select_expand",
     "share_curtailment",
+    "store_ts_incremental",
     "summarize",
+    "write_ts",
     "zeros_like",
 ]
 
@@ -195,7 +200,6 @@ def filter_ts(df: pd.DataFrame, expr: re.Pattern, *, column="variable") -> pd.Da
     )
 
 
-@cache
 def get_commodity_groups() -> dict[Literal["c"], dict[str, list[str]]]:
     """Return groups of commodities for aggregation.
 
@@ -209,8 +213,15 @@ def get_commodity_groups() -> dict[Literal["c"], dict[str, list[str]]]:
     dict
         with one top-level key, 'c', and at the second level mapping from group IDs to
         their components. This is suitable for use as the :py:`groups` argument to
-        :func:`genno.operator.aggregate`.
+        :func:`genno.operator.aggregate`. The result is memoized, but each call returns
+        a new object, which callers may modify.
     """
+    return deepcopy(_get_commodity_groups())
+
+
+@cache
+def _get_commodity_groups() -> dict[Literal["c"], dict[str, list[str]]]:
+    """Memoized implementation of :func:`get_commodity_groups`."""
     cl = get_codelist("commodity")
     return {"c": {c.id: leaf_ids(c) for c in filter(lambda c: len(c.child), cl)}}
 
@@ -243,7 +254,19 @@ def gwp_factors() -> "AnyQuantity":
     - 'e': emissions species, as in MESSAGE. The entry 'HFC' is added as an alias for
       the species 'HFC134a' from iam_units.
     - 'e equivalent': GWP-equivalent species, always 'CO2'.
+
+    The result is cached on disk for each version of :mod:`iam_units`, and in memory.
+    Each call returns a copy, which callers may modify.
     """
+    from importlib.metadata import version
+
+    return _gwp_factors(version("iam-units")).copy()
+
+
+@cache
+@cached
+def _gwp_factors(iam_units_version: str) -> "AnyQuantity":
+    """Implementation of :func:`gwp_factors`."""
     dims = ["gwp metric", "e", "e equivalent"]
     metric = ["SARGWP100", "AR4GWP100", "AR5GWP100"]
     species_to = ["CO2"]  # Add to this list to perform additional conversions
@@ -412,7 +435,7 @@ def merge_data(*others: "ParameterData") -> "ParameterData":
     """
     keys: set[str] = reduce(lambda x, y: x | y.keys(), others, set())
     return {
-        k: pd.concat([o.get(k, None) for o in others], ignore_index=True) for k in keys
+        k: _concat([o.get(k, None) for o in others], ignore_index=True) for k in keys
     }
 
 
@@ -438,10 +461,19 @@ def nodes_world_agg(
     This mapping should be used with :func:`.genno.operator.aggregate`, giving the
     argument :py:`keep=False`, because it includes 1:1 mapping from each region name to
     itself.
+
+    The result is memoized on the values of :py:`config["regions"]`, `dim`, and `name`.
+    Each call returns a new object, which callers may modify.
     """
-    from message_ix_models.model.structure import get_codelist
+    return deepcopy(_nodes_world_agg(config["regions"], dim, name))
 
-    cl = get_codelist(f"node/{config['regions']}")
+
+@cache
+def _nodes_world_agg(
+    regions: str, dim: Hashable, name: str | None
+) -> Mapping[Hashable, Mapping[Hashable, list[str]]]:
+    """Memoized implementation of :func:`nodes_world_agg`."""
+    cl = get_codelist(f"node/{regions}")
 
     # "World" node should have be top-level (its parent is the `cl` itself) and have
     # some children. Countries (from pycountry) that are omitted from a mapping have no
@@ -454,7 +486,7 @@ def nodes_world_agg(
     if name:
         # FIXME Remove. This is a hack to suit the legacy reporting, which expects
         #       global aggregates at *_GLB rather than "World".
-        name = name.format(config["regions"])
+        name = name.format(regions)
         log.info(f"Aggregates for {node!r} will be labelled {name!r}")
     else:
         name = node.id
@@ -665,6 +697,105 @@ def share_curtailment(curt, *parts):
     return parts[0] - curt * (parts[0] / sum(parts))
 
 
+def _ts_long(df) -> pd.DataFrame:
+    """Return time series data `df` in long format with IAMC column names."""
+    import pyam
+    from ixmp.util import to_iamc_layout
+
+    if isinstance(df, pyam.IamDataFrame):
+        df = df.as_pandas(meta_cols=False)
+    df = to_iamc_layout(df.drop(columns=["model", "scenario"], errors="ignore"))
+
+    id_cols = ["region", "variable", "unit", "subannual"]
+    if "year" not in df.columns:
+        # Reshape from wide to long format
+        df = df.melt(id_vars=id_cols, var_name="year", value_name="value")
+
+    return df[id_cols + ["year", "value"]].astype({"year": int, "value": float})
+
+
+def store_ts_incremental(
+    scenario: ixmp.TimeSeries,
+    *data,
+    strict: bool = False,
+    rtol: float = 1e-9,
+    meta: bool = False,
+) -> None:
+    """Store time series `data` on `scenario`, changing only the rows that differ.
+
+    Like :func:`ixmp.report.operator.store_ts`, except:
+
+    1. Existing time series data on `scenario` for the variables in `data` are
+       retrieved, and compared to `data` by (region, variable, unit, subannual, year).
+    2. Rows with the same value (within the relative tolerance `rtol`) are not stored
+       again. Rows that are new, or whose values differ, are added.
+    3. Existing rows with the same (region, variable, subannual, year) as a row in
+       `data`, but a different unit, are removed. All other existing rows—for
+       instance, for other regions or years, including historical data—are kept.
+
+    If there are no differences, `scenario` is not checked out. Otherwise, changes are
+    made in a single transaction, which is discarded on any error.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame or pyam.IamDataFrame
+        1 or more objects containing data to store. If more than one contain the same
+        (region, variable, unit, subannual, year), the last is used.
+    strict : bool
+        If :data:`True` (default :data:`False`), raise an exception if `data` are not
+        successfully stored. Otherwise, log on level :ref:`ERROR <python:levels>`.
+    meta : bool
+        Passed to :meth:`ixmp.TimeSeries.add_timeseries`.
+    """
+    id_cols = ["region", "variable", "unit", "subannual", "year"]
+
+    new = pd.concat(map(_ts_long, data), ignore_index=True).drop_duplicates(
+        subset=id_cols, keep="last"
+    )
+    existing = _ts_long(
+        scenario.timeseries(variable=sorted(new["variable"].unique()), subannual=True)
+        if len(new)
+        else pd.DataFrame(columns=id_cols + ["value"])
+    )
+
+    # Compare new and existing data
+    merged = new.merge(
+        existing, how="outer", on=id_cols, suffixes=("", "_existing"), indicator=True
+    )
+    same = (merged["_merge"] == "both") & np.isclose(
+        merged["value"], merged["value_existing"], rtol=rtol, atol=0
+    )
+    to_add = merged.loc[(merged["_merge"] != "right_only") & ~same, id_cols + ["value"]]
+
+    # Existing rows replaced by rows in `new` with a different unit
+    key_cols = ["region", "variable", "subannual", "year"]
+    replaced = pd.MultiIndex.from_frame(merged[key_cols]).isin(
+        pd.MultiIndex.from_frame(new[key_cols])
+    )
+    to_remove = merged.loc[(merged["_merge"] == "right_only") & replaced, id_cols]
+
+    log.info(
+        f"Store time series data on '{scenario.url}': {same.sum()} rows unchanged; "
+        f"add {len(to_add)}; remove {len(to_remove)}"
+    )
+    if not (len(to_add) or len(to_remove)):
+        return
+
+    scenario.check_out(timeseries_only=True)
+    try:
+        if len(to_remove):
+            scenario.remove_timeseries(to_remove)
+        if len(to_add):
+            scenario.add_timeseries(to_add, meta=meta)
+    except Exception as e:
+        scenario.discard_changes()
+        log.error(f"Failed with {e!r}")
+        if strict:
+            raise
+    else:
+        scenario.commit(f"Data updated using {__name__}")
+
+
 def summarize(*args: Any) -> str:
     """Return a summary of mixed `args`.
 
@@ -744,6 +875,77 @@ def summarize(*args: Any) -> str:
     return "\n".join(lines)
 
 
+def write_ts(
+    data: pd.DataFrame,
+    path: "Path",
+    *,
+    partition: Literal["region", "variable"] | None = None,
+    max_rows: int | None = None,
+) -> "Path | None":
+    """Write time series `data` to `path`.
+
+    The file format is determined by the suffix of `path`:
+
+    - :file:`.csv` or :file:`.xlsx`: using :func:`genno.operator.write_report`.
+    - :file:`.feather` or :file:`.parquet`: using :mod:`pyarrow`.
+
+    Parameters
+    ----------
+    data :
+        Time series data in the IAMC structure; that is, the format used by
+        :meth:`ixmp.TimeSeries.add_timeseries`.
+    partition :
+        For :file:`.csv`, :file:`.feather`, or :file:`.parquet`, write `data` in parts,
+        one for each distinct "region" or for each distinct first component of the
+        "variable" (before "|"). The parts are written in succession to the same file,
+        so that only one part at a time is converted. For :file:`.feather` and
+        :file:`.parquet`, each part is one record batch or row group, respectively.
+    max_rows :
+        If given and `data` has more rows, nothing is written, and a message is logged.
+
+    Returns
+    -------
+    pathlib.Path
+        `path`, if written; otherwise :any:`None`.
+    """
+    from genno.operator import write_report
+
+    if max_rows is not None and len(data) > max_rows:
+        log.warning(f"Skip writing {len(data)} > {max_rows = } rows to {path}")
+        return None
+
+    if partition is None or path.suffix == ".xlsx" or data.empty:
+        parts: Iterable[pd.DataFrame] = [data]
+    else:
+        by = data[partition].astype(str)
+        by = by.str.split("|", n=1).str[0] if partition == "variable" else by
+        parts = (df for _, df in data.groupby(by, sort=False, observed=True))
+
+    if path.suffix in (".csv", ".xlsx"):
+        for i, df in enumerate(parts):
+            if i == 0:
+                write_report(df, path)
+            else:
+                df.to_csv(path, mode="a", header=False, index=False)
+    elif path.suffix in (".feather", ".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.Schema.from_pandas(data, preserve_index=False)
+        with (
+            pq.ParquetWriter(path, schema)
+            if path.suffix == ".parquet"
+            else pa.ipc.new_file(path, schema)
+        ) as writer:
+            for df in parts:
+                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                writer.write_table(table)
+    else:
+        raise NotImplementedError(f"Write time series data to {path.suffix!r}")
+
+    return path
+
+
 def zeros_like(qty: "TQuantity", *, drop: Collection[str] = []) -> "TQuantity":
     """Return a quantity with the same coords as `qty`, filled with zeros."""
     coords, shape = {}, []
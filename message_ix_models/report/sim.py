@@ -1,11 +1,13 @@
 """Simulated solution data for testing :mod:`~message_ix_models.report`."""
 
 import logging
+import os
 from collections import ChainMap, defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from copy import deepcopy
 from dataclasses import dataclass
-from functools import cache, lru_cache, partial
+from functools import cache, cached_property, lru_cache, partial
+from hashlib import blake2b
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -34,28 +36,96 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+#: Maximum total size, in bytes, of the files stored by :func:`_cached`.
+CACHE_MAX_SIZE = 2**30
+
+
+def _cached(
+    path: Path, read: Callable[[], pd.DataFrame], part: str = ""
+) -> pd.DataFrame:
+    """Return the result of `read`, which reads data from `path`, using a cache.
+
+    On a first call, the data returned by `read` are also stored in Apache Arrow IPC
+    (Feather) format, in a file under :attr:`.Config.cache_path`. The name of this file
+    is derived from `path`, its modification time and size, and `part`—for instance, the
+    name of one sheet in an Excel file. On subsequent calls, if `path` is unchanged, the
+    cached data are read using a memory map, and `read` is not called.
+
+    After a file is stored, the least recently used files are deleted so that the total
+    size of the files does not exceed :data:`CACHE_MAX_SIZE`.
+
+    When :attr:`.Config.cache_skip` is :any:`True`, `read` is always called.
+    """
+    import pyarrow.feather
+
+    from message_ix_models import Context
+    from message_ix_models.util.cache import _evict
+
+    context = Context.get_instance(-1)
+    if context.core.cache_skip:
+        return read()
+
+    stat = path.stat()
+    h = blake2b(
+        f"{path.resolve()} {stat.st_mtime_ns} {stat.st_size} {part}".encode(),
+        digest_size=10,
+    )
+    cache_path = context.get_cache_path(
+        "report-sim", f"{path.name.split('.')[0]}-{h.hexdigest()}.arrow"
+    )
+
+    if cache_path.exists():
+        cache_path.touch()  # Mark as recently used
+        return pyarrow.feather.read_table(cache_path, memory_map=True).to_pandas()
+
+    data = read()
+
+    # Write to a temporary file, then rename, so other processes never see a partial
+    # file
+    tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        data.to_feather(tmp, compression="uncompressed")
+    except (TypeError, ValueError) as e:  # For instance, non-str column names
+        log.debug(f"Not cached: {e}")
+    else:
+        tmp.replace(cache_path)
+        _evict(cache_path.parent, CACHE_MAX_SIZE, "*.arrow")
+
+    return data
+
 
 @dataclass
 class MockScenario:
     """Object to mock a :class:`.Scenario` with data from a :file:`.xlsx` file.
 
-    For use with :func:`.reporter_from_excel`.
+    For use with :func:`.reporter_from_excel`. The file is only opened, and each sheet
+    only read, when the data it contains are first requested. The contents of each
+    sheet are cached; see :func:`_cached`.
     """
 
     _info: "ScenarioInfo"
-    _file: "ExcelFile"
+    _path: Path
+
+    @cached_property
+    def _file(self) -> "ExcelFile":
+        return pd.ExcelFile(self._path)
+
+    @cache
+    def _sheet(self, name: str) -> pd.DataFrame:
+        # NB self._file is only accessed if `name` is not cached
+        return _cached(
+            self._path, lambda: pd.read_excel(self._file, sheet_name=name), name
+        )
 
     @cache
     def cat(self, name: str, cat: str):
         return (
-            pd.read_excel(self._file, sheet_name=f"cat_{name}")
-            .query(f"type_{name} == {cat!r}")[name]
-            .to_list()
+            self._sheet(f"cat_{name}").query(f"type_{name} == {cat!r}")[name].to_list()
         )
 
     @cache
     def par(self, name):
-        return pd.read_excel(self._file, sheet_name=name)
+        return self._sheet(name)
 
     def _par_as_qty(self, name, dims):
         return genno.Quantity(
@@ -64,7 +134,7 @@ class MockScenario:
 
     @cache
     def set(self, name):
-        df = pd.read_excel(self._file, sheet_name=name)
+        df = self._sheet(name)
         return df.iloc[:, 0].to_list() if 1 == len(df.columns) else df
 
     def has_solution(self):
@@ -76,24 +146,20 @@ class MockScenario:
     @cache
     def par_list(self):
         return (
-            pd.read_excel(self._file, sheet_name="ix_type_mapping")
-            .query("ix_type == 'par'")["item"]
-            .to_list()
+            self._sheet("ix_type_mapping").query("ix_type == 'par'")["item"].to_list()
         )
 
     @cache
     def set_list(self):
         return (
-            pd.read_excel(self._file, sheet_name="ix_type_mapping")
-            .query("ix_type == 'set'")["item"]
-            .to_list()
+            self._sheet("ix_type_mapping").query("ix_type == 'set'")["item"].to_list()
         )
 
     def __getattr__(self, name):
         return getattr(self._info, name)
 
     def __hash__(self):
-        return hash(self._file)
+        return hash(self._path)
 
 
 def dims_of(info: "Item") -> dict[str, str]:
@@ -121,14 +187,14 @@ def reporter_from_excel(path: "Path") -> "Reporter":
 
     The file must be of the format generated by :meth:`.Scenario.to_excel`.
 
+    Data are read from the file only as needed to compute the keys requested from the
+    returned Reporter; see :class:`MockScenario`.
+
     .. todo:: Move upstream to a new method :meth:`ixmp.Reporter.from_excel`.
     """
-    import pandas as pd
-
     rep = Reporter()
     info = rep.graph["scenario info"] = ScenarioInfo(model="m", scenario="s")
-    ef = rep.graph["_file"] = pd.ExcelFile(path)
-    mock = rep.graph["scenario"] = MockScenario(info, ef)
+    mock = rep.graph["scenario"] = MockScenario(info, path)
 
     # Add tasks to retrieve sets from file
     for set_name in mock.set_list():
@@ -204,6 +270,8 @@ def data_from_file(path: Path, *, name: str, dims: Sequence[str]) -> "AnyQuantit
 
     For parameters, the file **must** have columns corresponding to `dims` followed by
     "value" and "unit". The "value" column is returned.
+
+    The contents of the file are cached; see :func:`_cached`.
     """
     if name.isupper():
         # Construct a list of the columns
@@ -213,7 +281,7 @@ def data_from_file(path: Path, *, name: str, dims: Sequence[str]) -> "AnyQuantit
         cols = list(dims) + ["Val", "Marginal", "Lower", "Upper", "Scale"]
 
         return genno.Quantity(
-            pd.read_csv(path, engine="pyarrow")
+            _cached(path, partial(pd.read_csv, path, engine="pyarrow"))
             .set_axis(cols, axis=1)
             .set_index(cols[:-5])["Val"],
             name=name,
@@ -221,7 +289,7 @@ def data_from_file(path: Path, *, name: str, dims: Sequence[str]) -> "AnyQuantit
     else:
         cols = list(dims) + ["value", "unit"]
         tmp = (
-            pd.read_csv(path, engine="pyarrow")
+            _cached(path, partial(pd.read_csv, path, engine="pyarrow"))
             # Drop a leading index column that appears in some files
             # TODO Adjust .snapshot.unpack() to avoid generating this column; update
             # data; then remove this call
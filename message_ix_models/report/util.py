@@ -1,8 +1,17 @@
 import logging
-from collections.abc import Iterable
+import re
+import sys
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import count
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 from dask.core import quote
 from genno import Computer, Key, Keys
@@ -11,6 +20,10 @@ from genno.core.key import single_key
 from message_ix import Reporter
 from sdmx.model.common import Code
 
+if TYPE_CHECKING:
+    from genno.core.key import KeyLike
+    from message_ix import Scenario
+
 log = logging.getLogger(__name__)
 
 
@@ -100,6 +113,9 @@ class IAMCConversion:
     #: If :any:`True`, ensure data is present for ``R##_GLB``.
     GLB_zeros: bool = False
 
+    #: Passed as the :py:`exact` argument to :func:`collapse`.
+    exact: bool = False
+
     def __post_init__(self) -> None:
         # Ensure base is a Key
         self.base = Key(self.base)
@@ -198,7 +214,7 @@ class IAMCConversion:
                 | dict(
                     base=k.base[1].drop(*dims),
                     variable=f"{label} {i}",
-                    collapse=dict(callback=collapse, var=var_parts),
+                    collapse=dict(callback=collapse, var=var_parts, exact=self.exact),
                 ),
             )
             keys.append(f"{label} {i}::iamc")
@@ -207,7 +223,90 @@ class IAMCConversion:
         c.graph[all_iamc] += tuple(keys)
 
 
-def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
+#: Characters with special meaning in regular expressions.
+_RE_SPECIAL = set(r".^$*+?{}[]\|()")
+
+
+class _Replacer:
+    """Apply regular-expression `replacements` to individual :class:`str` labels.
+
+    The result is the same as :meth:`pandas.Series.replace` with :py:`regex=True`: each
+    pattern that matches the original label is substituted, in order. Patterns that are
+    literal strings anchored at both ends, for instance "^Foo$", are handled as exact
+    matches using a :class:`dict`, instead of a regular expression. If `exact` is
+    :any:`True`, so are literal strings anchored only at the end, such as "Foo$".
+
+    Results are stored, so replacements are determined once for each distinct label.
+    """
+
+    def __init__(self, replacements: Mapping[str, str], exact: bool = False) -> None:
+        # Indices of literal patterns, keyed by the label that they match
+        self.literal: dict[str, list[int]] = defaultdict(list)
+        # Indices of other patterns
+        self.regex: list[int] = []
+        self.steps: list[tuple[str | re.Pattern, str]] = []
+        self.cache: dict[str, str] = {}
+
+        for i, (pattern, repl) in enumerate(replacements.items()):
+            if pattern.startswith("^") and pattern.endswith("$"):
+                literal = pattern[1:-1]
+            elif exact and pattern.endswith("$"):
+                literal = pattern[:-1]
+            else:
+                literal = None
+
+            if literal is None or _RE_SPECIAL & set(literal) or "\\" in repl:
+                self.regex.append(i)
+                self.steps.append((re.compile(pattern), repl))
+            else:
+                self.literal[literal].append(i)
+                self.steps.append((literal, repl))
+
+    def __call__(self, value):
+        if not isinstance(value, str):
+            return value
+        try:
+            return self.cache[value]
+        except KeyError:
+            pass
+
+        # Patterns that match the original value
+        matched = self.literal.get(value, []) + [
+            i for i in self.regex if self.steps[i][0].search(value)
+        ]
+
+        result = value
+        for pattern, repl in map(self.steps.__getitem__, sorted(matched)):
+            if isinstance(pattern, str):
+                result = repl if result == pattern else result
+            else:
+                result = pattern.sub(repl, result)
+
+        self.cache[value] = result
+        return result
+
+
+@lru_cache
+def _replacer(items: tuple[tuple[str, str], ...], exact: bool) -> _Replacer:
+    """Return a :class:`_Replacer` for the replacements in `items`."""
+    return _Replacer(dict(items), exact)
+
+
+def _map_unique(s: pd.Series, func: Callable) -> pd.Series:
+    """Apply `func` to each distinct value in `s`."""
+    codes, uniques = pd.factorize(s, use_na_sentinel=False)
+    values = np.array([func(u) for u in uniques], dtype=object)
+    return pd.Series(values[codes], index=s.index, name=s.name)
+
+
+def _replace(s: pd.Series, replacements: Mapping[str, str], exact: bool) -> pd.Series:
+    """Apply `replacements` to `s`, like :meth:`pandas.Series.replace`."""
+    if not len(replacements):
+        return s
+    return _map_unique(s, _replacer(tuple(replacements.items()), exact))
+
+
+def collapse(df: pd.DataFrame, var=[], *, exact: bool = False) -> pd.DataFrame:
     """Callback for the `collapse` argument to :meth:`~.Reporter.convert_pyam`.
 
     Replacements from :data:`REPLACE_DIMS` and :data:`REPLACE_VARS` are applied.
@@ -217,6 +316,10 @@ def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
 
     Adapted from :func:`genno.compat.pyam.collapse`.
 
+    Replacements are determined once for each distinct label, and then used for all
+    rows with that label. The results are the same as from
+    :meth:`pandas.DataFrame.replace` with :py:`regex=True`.
+
     Parameters
     ----------
     var : list of str, optional
@@ -224,6 +327,12 @@ def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
         usually a :class:`str` used to populate the column; others may be fixed strings
         or the IDs of dimensions in the input data. The components are joined using the
         pipe ('|') character.
+    exact : bool, optional
+        If :any:`True`, patterns in :data:`REPLACE_DIMS` that are literal strings
+        anchored only at the end—such as those added by :func:`add_replacements`—match
+        only entire labels. For instance "Coal$" replaces "Coal", but not "Hard Coal".
+        Set via :attr:`IAMCConversion.exact` or, in the ``iamc:`` section of a reporting
+        configuration file, :py:`collapse: {exact: true}`.
 
     See also
     --------
@@ -234,7 +343,7 @@ def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
     """
     # Convert some dimension labels to title-case strings
     for dim in filter(lambda d: d in df.columns, "clt"):
-        df[dim] = df[dim].astype(str).str.title()
+        df[dim] = _map_unique(df[dim], lambda v: str(v).title())
 
     if "l" in df.columns:
         # Level: to title case, add the word 'energy'
@@ -244,14 +353,16 @@ def collapse(df: pd.DataFrame, var=[]) -> pd.DataFrame:
         log.info(f"Collapse GWP info for {var[0]}")
         df, var = collapse_gwp_info(df, var)
 
-    # - Apply replacements to individual dimensions.
+    # Apply replacements to individual dimensions
+    for dim, replacements in REPLACE_DIMS.items():
+        if dim in df.columns:
+            df[dim] = _replace(df[dim], replacements, exact)
+
     # - Use the genno built-in to assemble the variable column.
     # - Apply replacements to assembled columns.
-    return (
-        df.replace(REPLACE_DIMS, regex=True)
-        .pipe(genno_collapse, columns=dict(variable=var))
-        .replace(dict(variable=REPLACE_VARS), regex=True)
-    )
+    df = genno_collapse(df, columns=dict(variable=var))
+    df["variable"] = _replace(df["variable"], REPLACE_VARS, False)
+    return df
 
 
 def collapse_gwp_info(df, var):
@@ -350,7 +461,7 @@ def add_replacements(dim: str, codes: Iterable[Code]) -> None:
 
 
 # FIXME Type as "Computer" str alias, when supported by genno.Computer.apply()
-def store_write_ts(c: Computer, base_key: Key) -> Key:
+def store_write_ts(c: Computer, base_key: Key, **kwargs) -> Key:
     """Add tasks to store and write files with time-series data from `base_key`.
 
     `base_key` **should** refer to a task that returns time-series data in the IAMC
@@ -362,7 +473,7 @@ def store_write_ts(c: Computer, base_key: Key) -> Key:
        Both of:
 
        "foo::iamc+file"
-          Both of:
+          All of, according to the "formats" option (below):
 
           "foo::iamc+csv"
              Write data in `base_key` to a file named :file:`foo.csv` in CSV format,
@@ -370,19 +481,36 @@ def store_write_ts(c: Computer, base_key: Key) -> Key:
           "foo::iamc+xlsx"
              Write the data in `base_key` to a file named :file:`foo.xlsx` in Excel
              format.
+          "foo::iamc+feather", "foo::iamc+parquet"
+             Write the data in `base_key` to a file named :file:`foo.feather` or
+             :file:`foo.parquet` in the respective formats.
 
-          The two files are created in a subdirectory created with
+          The files are created in a subdirectory created with
           :func:`make_output_path`, including a path component constructed from the
-          scenario URL.
+          scenario URL, using :func:`.report.operator.write_ts`.
 
        "foo::iamc+store"
           Store the data in `base_key` as time series data on the
           :class:`.Scenario` identified by the key "scenario", using
-          :func:`ixmp.report.operator.store_ts`.
+          :func:`ixmp.report.operator.store_ts` or, if the "incremental" option is
+          set, :func:`.report.operator.store_ts_incremental`.
 
-    Other code **may** then :meth:`~.Reporter.get` one of the 3 keys, as needed, to
+    Other code **may** then :meth:`~.Reporter.get` one of these keys, as needed, to
     perform some or all of these tasks.
 
+    Options are taken from the "write_ts" configuration key of `c`—see
+    :attr:`.report.Config.write_ts`—and then from `kwargs`:
+
+    - "formats": file formats to write. Default: :py:`["csv", "xlsx"]`.
+    - "incremental": if :any:`True`, store only changed time series data. Default:
+      :any:`False`.
+    - "partition": passed to :func:`~.report.operator.write_ts` for the
+      :file:`.csv`, :file:`.feather`, and :file:`.parquet` files. Default:
+      :any:`None`.
+    - "xlsx_max_rows": passed as the `max_rows` argument to
+      :func:`~.report.operator.write_ts` for the :file:`.xlsx` file. Default:
+      :any:`None`.
+
     Returns
     -------
     Key
@@ -397,20 +525,312 @@ def store_write_ts(c: Computer, base_key: Key) -> Key:
     """
     k = Key(base_key)
 
+    options: dict[str, Any] = dict(
+        formats=["csv", "xlsx"], incremental=False, partition=None, xlsx_max_rows=None
+    )
+    options.update(c.graph.get("config", {}).get("write_ts", {}))
+    options.update(kwargs)
+
     file_keys = []
-    for suffix in ("csv", "xlsx"):
+    for suffix in options["formats"]:
         # Create the path
         name = f"{k.name}.{suffix}"
         path = c.add(k[f"{suffix} path"], "make_output_path", "config", name=name)
         # Write `key` to the path
-        file_keys.append(c.add(k[suffix], "write_report", base_key, path))
+        if suffix == "xlsx":
+            kw = dict(max_rows=options["xlsx_max_rows"])
+        else:
+            kw = dict(partition=options["partition"])
+        file_keys.append(c.add(k[suffix], "write_ts", base_key, path, **kw))
 
     # Write all files
     c.add(k["file"], "summarize", *file_keys)
 
     # Store data on "scenario"
-    c.add(k["store"], "store_ts", "scenario", base_key)
+    store = "store_ts_incremental" if options["incremental"] else "store_ts"
+    c.add(k["store"], store, "scenario", base_key)
 
     # Both write and store
     c.add(k["all"], "summarize", k["store"], *file_keys)
     return k["all"]
+
+
+def prune(c: Computer, *keys: "KeyLike", keep: Iterable[str] = ("config",)) -> int:
+    """Remove from `c` all tasks that are not needed to compute any of `keys`.
+
+    The items in `keep`, for instance "config", are never removed.
+
+    Returns
+    -------
+    int
+        the number of tasks removed.
+    """
+    from dask.optimization import cull
+
+    # Protect 'config' dict, as in genno.Computer.get()
+    config = c.graph.get("config", dict())
+    c.graph["config"] = quote(config)
+    try:
+        dsk, _ = cull(c.graph, [str(k) for k in keys])
+    finally:
+        c.graph["config"] = config
+
+    needed = set(map(str, dsk)) | set(keep)
+    unneeded = [k for k in c.graph.keys() if str(k) not in needed]
+    for k in unneeded:
+        del c.graph[k]
+
+    log.info(f"Prune {len(unneeded) + len(dsk)} -> {len(dsk)} tasks")
+    return len(unneeded)
+
+
+def _nbytes(obj) -> int:
+    """Return the approximate size of `obj` in memory, in bytes."""
+    try:
+        # pandas objects, including genno.AttrSeries
+        result = obj.memory_usage(index=True, deep=True)
+        return int(getattr(result, "sum", lambda: result)())
+    except (AttributeError, TypeError):
+        pass
+
+    # numpy arrays, xarray objects including genno.SparseDataArray
+    return int(getattr(obj, "nbytes", sys.getsizeof(obj)))
+
+
+class _Profiled:
+    """Callable wrapping the callable of a task, to record data for :func:`profile`."""
+
+    __slots__ = ("key", "func", "records")
+
+    def __init__(self, key, func, records: list) -> None:
+        self.key = key
+        self.func = func
+        self.records = records
+
+    def __call__(self, *args, **kwargs):
+        tracemalloc.reset_peak()
+        mem0 = tracemalloc.get_traced_memory()[0]
+        t0 = perf_counter()
+        try:
+            return_value = self.func(*args, **kwargs)
+        finally:
+            time = perf_counter() - t0
+            mem1 = tracemalloc.get_traced_memory()[1]
+
+        self.records.append(
+            (
+                str(self.key),
+                getattr(self.func, "__name__", repr(self.func)),
+                time,
+                _nbytes(return_value),
+                len(return_value) if hasattr(return_value, "__len__") else None,
+                mem1 - mem0,
+            )
+        )
+        return return_value
+
+
+def profile(
+    c: Computer, key: "KeyLike | None" = None, path: Path | None = None
+) -> tuple[Any, pd.DataFrame]:
+    """Compute `key` in `c` while recording the time and memory used by each task.
+
+    Each task executed by :meth:`genno.Computer.get` is timed. Also recorded are the
+    size of the task's return value and the peak memory allocated while it runs, as
+    measured with :mod:`tracemalloc`. The latter slows execution, so this function
+    should be used only for diagnosis.
+
+    Parameters
+    ----------
+    path :
+        If given, the profile data are also written to this path in CSV format.
+
+    Returns
+    -------
+    tuple
+        1. the result of :py:`c.get(key)`.
+        2. :class:`pandas.DataFrame` with one row per task and the columns "key",
+           "operator", "time" (seconds), "nbytes" (size of the return value), "len"
+           (length of the return value, if any) and "memory" (peak memory allocated,
+           in bytes). Rows are sorted by descending "time".
+    """
+    records: list[tuple] = []
+
+    # Wrap the callable of each task
+    orig = {}
+    for k, task in list(c.graph.items()):
+        if k != "config" and isinstance(task, tuple) and task and callable(task[0]):
+            orig[k] = task
+            c.graph[k] = (_Profiled(k, task[0], records),) + task[1:]
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        result = c.get(key)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+        c.graph.update(orig)
+
+    data = (
+        pd.DataFrame(
+            records, columns=["key", "operator", "time", "nbytes", "len", "memory"]
+        )
+        .astype({"len": "Int64"})
+        .sort_values("time", ascending=False, ignore_index=True)
+    )
+
+    log.info(
+        f"{len(data)} tasks in {data['time'].sum():.3f} s; slowest:\n"
+        + data.head(10).to_string(index=False)
+    )
+    if path:
+        data.to_csv(path, index=False)
+        log.info(f"Wrote profile data to {path}")
+
+    return result, data
+
+
+def freeze(c: Computer, *keys: "KeyLike", dynamic: Iterable["KeyLike"]) -> int:
+    """Replace tasks in `c` with their results, if these do not depend on `dynamic`.
+
+    Tasks needed to compute any of `keys` that depend—directly or indirectly—on none of
+    the `dynamic` keys are computed once, and replaced with their results. For example,
+    with :py:`dynamic=["config", "scenario"]`, tasks that only use code lists or other
+    package data are frozen, while those that use model data or write files are not.
+    This avoids computing the former repeatedly when `c` is used many times, such as by
+    :func:`.report_batch`.
+
+    Results are reused as-is, so tasks using them **must not** modify them in place.
+
+    Returns
+    -------
+    int
+        the number of tasks replaced. If any static task refers to a missing key, no
+        tasks are replaced.
+
+    Raises
+    ------
+    Exception
+        any other exception raised by a static task.
+    """
+    from graphlib import TopologicalSorter
+
+    import dask
+    from dask.core import istask
+    from dask.optimization import cull
+    from genno.compat.dask import to_keylike
+
+    config = c.graph.get("config", dict())
+    c.graph["config"] = quote(config)
+    try:
+        dsk, dependencies = cull(c.graph, [str(k) for k in keys])
+    finally:
+        c.graph["config"] = config
+
+    # Identify keys that depend on any of `dynamic`, in topological order
+    is_dynamic = set(map(str, dynamic))
+    static = []
+    for k in TopologicalSorter(dependencies).static_order():
+        if str(k) in is_dynamic or is_dynamic & set(map(str, dependencies[k])):
+            is_dynamic.add(str(k))
+        elif istask(dsk[k]):
+            static.append(k)
+
+    if not static:
+        return 0
+
+    # Compute all static tasks at once
+    static_dsk = {
+        to_keylike(k): to_keylike(task)
+        for k, task in dsk.items()
+        if str(k) not in is_dynamic
+    }
+    try:
+        results = dask.get(static_dsk, list(map(to_keylike, static)))
+    except KeyError as e:  # Includes genno.MissingKeyError
+        log.warning(f"Could not freeze {len(static)} tasks: {e!r}")
+        return 0
+
+    # Keys in `dsk` are str; replace the tasks at the corresponding keys in `c`
+    keys_c = {str(k): k for k in c.graph}
+    for k, value in zip(static, results):
+        c.graph[keys_c[str(k)]] = quote(value)
+
+    log.info(f"Freeze {len(static)} of {len(dsk)} tasks")
+    return len(static)
+
+
+def rebind(rep: Reporter, scenario: "Scenario") -> None:
+    """Use the tasks in `rep` to report `scenario`.
+
+    `rep` **must** have been created with :meth:`.Reporter.from_scenario`, for a
+    scenario with the same structure as `scenario`: the same set, parameter, equation,
+    and variable names; and either both or neither with a solution. The "scenario" key
+    and the keys for the elements of each set are replaced, in the same way as
+    :meth:`~.Reporter.from_scenario`. All other tasks are unchanged.
+
+    Raises
+    ------
+    ValueError
+        if `scenario` has different items than the scenario in `rep`, or differs in
+        whether it has a solution.
+    """
+    from ixmp.report import common
+
+    existing = rep.graph["scenario"]
+    if existing.has_solution() != scenario.has_solution():
+        raise ValueError(
+            f"{scenario.url} and {existing.url} differ in having a solution"
+        )
+    for ix_type in ("set", "par", "equ", "var"):
+        method = f"{ix_type}_list"
+        if set(getattr(existing, method)()) != set(getattr(scenario, method)()):
+            raise ValueError(
+                f"{scenario.url} and {existing.url} have different {ix_type} items"
+            )
+
+    rep.graph["scenario"] = scenario
+
+    for name in scenario.set_list():
+        elements = scenario.set(name)
+        try:
+            elements = quote(elements.tolist())
+        except AttributeError:
+            pass  # pd.DataFrame for a multidimensional set; store as-is
+        rep.graph[common.RENAME_DIMS.get(name, name)] = elements
+
+
+def warm_cache() -> list[str]:
+    """Pre-populate the caches of structure-only reporting operators.
+
+    These are :func:`.gwp_factors` and :func:`.get_commodity_groups`; plus
+    :func:`.nodes_world_agg` for every node code list per :func:`.codelists`. Code
+    lists that cannot be loaded are logged and skipped.
+
+    Returns
+    -------
+    list of str
+        IDs of the node code lists for which the caches were populated.
+    """
+    from message_ix_models.model.structure import codelists
+
+    from .operator import get_commodity_groups, gwp_factors, nodes_world_agg
+
+    gwp_factors()
+    get_commodity_groups()
+
+    result = []
+    for regions in codelists("node"):
+        try:
+            # Signatures used by .model.buildings, .model.transport, .project.ssp
+            nodes_world_agg(dict(regions=regions))
+            nodes_world_agg(dict(regions=regions), dim="n", name=None)
+        except Exception as e:
+            log.warning(f"Could not warm cache for node/{regions}: {e!r}")
+        else:
+            result.append(regions)
+
+    log.info(f"Warmed cache for {len(result)} node code lists")
+    return result
@@ -8,7 +8,7 @@ from message_ix import make_df
 from message_ix.testing import make_dantzig
 
 from message_ix_models import Spec
-from message_ix_models.model.build import apply_spec
+from message_ix_models.model.build import apply_spec, diff_spec
 
 if TYPE_CHECKING:
     from message_ix import Scenario
@@ -130,3 +130,51 @@ def test_apply_spec4(request, caplog, scenario: "Scenario", spec: Spec):
 
     # Nothing logged for the already-existing region ID
     assert not any("already defined" in message for message in caplog.messages)
+
+
+def test_diff_spec(scenario: "Scenario", spec: Spec) -> None:
+    spec.require.set["node"].append("seattle")
+    spec.remove.set["node"].extend(["new-york", "not-a-node"])
+    spec.add.set["node"].extend(["seattle", "vienna", "vienna"])
+    spec.add.set["year"].append(1964)
+
+    result = diff_spec(scenario, spec)
+
+    # Only sets mentioned in `spec`, basic sets first
+    assert ["node", "year"] == sorted(result)
+    # Only present elements are removed; only absent elements are added, once
+    assert dict(remove=["new-york"], add=["vienna"]) == result["node"]
+    assert dict(remove=[], add=[1964]) == result["year"]
+
+    # Missing required element raises ValueError
+    spec.require.set["node"].append("vienna")
+    with pytest.raises(ValueError, match="Missing elements of set 'node'"):
+        diff_spec(scenario, spec)
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_apply_spec_batch(caplog, scenario: "Scenario", spec: Spec, fast) -> None:
+    """Apply a spec with batch=True."""
+    spec.remove.set["node"] = ["new-york", "not-a-node"]
+    spec.add.set["technology"] = ["t0", "t1"]
+    spec.add.set["cat_tec"] = [["type_tec_a", "t0"]]
+    spec.add.set["type_tec"] = ["type_tec_a"]
+
+    result = apply_spec(scenario, spec, batch=True, fast=fast)
+
+    # Report contains the changes actually made
+    assert ["new-york"] == result["node"]["remove"]
+    assert ["t0", "t1"] == result["technology"]["add"]
+
+    # Changes are applied
+    assert "new-york" not in scenario.set("node").tolist()
+    assert {"t0", "t1"} <= set(scenario.set("technology"))
+    assert [("type_tec_a", "t0")] == list(
+        scenario.set("cat_tec").itertuples(index=False, name=None)
+    )
+
+    if not fast:
+        assert_logs(caplog, "  1 rows in 'demand'")
+
+    # Parameter data are not retrieved for sets with no elements to remove
+    assert not any("Remove data with technology" in m for m in caplog.messages)
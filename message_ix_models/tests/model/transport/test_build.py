@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Literal
 
 import genno
 import ixmp
+import pandas as pd
 import pytest
 from message_ix.testing import make_dantzig
 from pytest import mark, param
@@ -296,3 +297,126 @@ def test_make_spec(regions_arg, regions_exp, years):
     nodes = get_codes(f"node/{regions_exp}")
     expected = list(map(str, nodes[nodes.index("World")].child))
     assert expected == spec["require"].set["node"]
+
+
+def test_reuse_structure(test_context: Context) -> None:
+    from genno.testing import assert_qty_equal
+
+    from message_ix_models.model.bare import get_spec
+    from message_ix_models.model.transport import Config, key
+
+    test_context.update(regions="R12", years="B")
+
+    def computer(code: str) -> genno.Computer:
+        config = Config.from_context(
+            test_context, options=dict(code=code, reuse_structure=True)
+        )
+        config.base_model_info = get_spec(test_context)["add"]
+
+        c = genno.Computer()
+        for m in "ixmp.report", "message_ix.report", "message_ix_models.report":
+            c.require_compat(f"{m}.operator")
+        c.require_compat("message_ix_models.model.transport.operator")
+        c.add("context", test_context)
+        c.add("scenario", None)
+        c.graph["config"]["transport"] = config
+
+        build.add_structure(c)
+        return c
+
+    build._STRUCTURE.clear()
+    c1 = computer("SSP1")
+    c2 = computer("SSP2")
+
+    # Structure is computed once, and the results reused
+    assert 1 == len(build._STRUCTURE)
+    assert_qty_equal(c1.get(key.bcast_y.all), c2.get(key.bcast_y.all))
+    # …but each computer has its own copy
+    assert c1.graph[key.bcast_y.all] is not c2.graph[key.bcast_y.all]
+
+    # Tasks that depend on the configuration are not replaced
+    assert {"scenario": "SSP(2024).1"} == c1.get("indexers:scenario")
+    assert {"scenario": "SSP(2024).2"} == c2.get("indexers:scenario")
+
+    # Number of stored structures is limited; the least recently used are discarded
+    build._STRUCTURE.clear()
+    for i in range(build._STRUCTURE_MAX):
+        build._STRUCTURE[f"foo {i}"] = {}
+    computer("SSP1")
+    assert build._STRUCTURE_MAX == len(build._STRUCTURE)
+    assert "foo 0" not in build._STRUCTURE
+
+
+@build.get_computer.minimum_version
+def test_get_computer_task_module(test_context: Context) -> None:
+    """:func:`.get_computer` records the module or step that added each task."""
+    from message_ix_models.model.transport import key
+
+    test_context.update(regions="R12", years="B")
+
+    # Minimal configuration with a single module
+    options = dict(code="SSP2", modules=["groups"])
+    c = build.get_computer(test_context, visualize=False, options=options)
+
+    # Tasks are labelled with the step or module that added them
+    origin = c.graph["config"]["task module"]
+    assert {"structure", "exogenous", "groups", "debug"} == set(origin.values())
+    assert "structure" == origin[genno.Key(key.bcast_y.all)]
+
+    # Tasks added before the steps are not labelled
+    assert {"context", "scenario"}.isdisjoint(map(str, origin))
+
+
+@build.get_computer.minimum_version
+def test_get_computer_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, test_context: Context
+) -> None:
+    """Cached results are reused when only the target scenario differs."""
+    from message_ix_models.util import cache as util_cache
+
+    # Store every result, and record the number of stored results used
+    N = []
+    cache_tasks = util_cache.cache_tasks
+
+    def _cache_tasks(*args, **kwargs) -> int:
+        N.append(cache_tasks(*args, **(kwargs | dict(min_time=0))))
+        return N[-1]
+
+    monkeypatch.setattr(util_cache, "cache_tasks", _cache_tasks)
+
+    test_context.update(regions="R12", years="B")
+    test_context.core.cache_path = tmp_path
+    options = dict(code="SSP2", modules=["groups"], cache_size=2**30)
+
+    test_context.core.dest_scenario = dict(model="foo", scenario="bar")
+    c = build.get_computer(test_context, visualize=False, options=options)
+    assert 0 == N[-1]
+    # Compute and store results for some tasks that do not depend on the scenario
+    c.get("groups::iea to transport")
+
+    # A different target scenario → stored results are used
+    test_context.core.dest_scenario = dict(model="foo", scenario="baz")
+    build.get_computer(test_context, visualize=False, options=options)
+    assert 0 < N[-1]
+
+
+def test_profile(test_context: Context) -> None:
+    c = genno.Computer()
+    c.add("context", test_context)
+    c.add("x:i", genno.Quantity([1.0, 2.0], coords={"i": ["a", "b"]}))
+    c.add("y:i", "mul", "x:i", "x:i")
+    c.add("z", "sum", "y:i", dimensions=["i"])
+    c.graph["config"]["task module"] = {
+        genno.Key("y:i"): "ldv",
+        genno.Key("z"): "debug",
+    }
+
+    # Function runs and returns the result
+    assert 5.0 == build.profile(c, "z").item()
+
+    # Files are written with the cost of tasks by module
+    df = pd.read_csv(test_context.get_local_path("transport", "profile-module.csv"))
+    assert {"ldv", "debug"} == set(df["module"])
+    assert {"module", "tasks", "time", "nbytes", "memory"} <= set(df.columns)
+    df = pd.read_csv(test_context.get_local_path("transport", "profile-task.csv"))
+    assert 2 == len(df)
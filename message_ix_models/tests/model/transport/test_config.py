@@ -60,6 +60,17 @@ class TestConfig:
         c.ssp = input
         assert expected == c.ssp
 
+    def test_fingerprint(self, c: Config) -> None:
+        fp = c.fingerprint()
+
+        # Settings that do not affect the build data do not change the fingerprint
+        c2 = Config(fast=False, cache_size=2**30, profile=True, workers=4)
+        assert fp == c2.fingerprint()
+
+        # Other settings do
+        assert fp != Config(ssp=SSP_2024["3"]).fingerprint()
+        assert fp != Config(navigate_scenario="act").fingerprint()
+
     @pytest.mark.parametrize("input, expected", FUTURES)
     def test_futures_scenario0(self, input, expected):
         """Set Transport Futures scenario through the constructor."""
@@ -1,4 +1,8 @@
+import pandas as pd
+import pytest
+
 from message_ix_models.model.transport import factor
+from message_ix_models.project.ssp import SSP_2024
 
 
 class TestFactor:
@@ -45,3 +49,37 @@ class TestFactor:
         # )
 
         assert {"n", "t", "y"} == set(result.dims)
+
+    @pytest.mark.parametrize("name", list(factor.COMMON))
+    @pytest.mark.parametrize("scenario", list(SSP_2024))
+    def test_quantify_memoized(self, name, scenario) -> None:
+        """:meth:`.Factor.quantify` gives the same result as applying each layer."""
+        coords: dict[str, list] = dict(n=["R12_AFR", "R12_NAM"], y=[2020, 2025, 2030])
+        if name in {"ldv ev inv_cost", "ldv fuel economy", "rail inv_cost"}:
+            # Factors with a technology dimension
+            coords.update(
+                t=["ELC_100", "HFC_ptrp", "PHEV_ptrp", "Hspeed_rai", "rail_pub"]
+            )
+        f = factor.COMMON[name]
+
+        # Expected result: apply each layer in sequence
+        kw = dict(coords, scenario=scenario)
+        exp = f.layers[0].quantify(kw)
+        for layer in f.layers[1:]:
+            exp = layer.apply(exp, kw)
+
+        factor._quantify.cache_clear()
+        result = f.quantify(**coords, scenario=scenario)
+
+        # Result is identical
+        assert set(exp.dims) == set(result.dims)
+        pd.testing.assert_series_equal(
+            exp.to_series().reorder_levels(result.dims).sort_index(),
+            result.to_series().sort_index(),
+            check_names=False,
+        )
+
+        # Layer quantifications are reused for identical coords
+        f.quantify(**coords, scenario=scenario)
+        info = factor._quantify.cache_info()
+        assert len(f.layers) == info.hits == info.misses
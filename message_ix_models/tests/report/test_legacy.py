@@ -1,5 +1,7 @@
 import logging
 import sys
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
@@ -38,3 +40,187 @@ def test_legacy_report(test_context, loaded_snapshot):
     # scenario.timeseries()[
     #     "model", "scenario", "region", "variable", "year", "value", "unit"
     # ].to_csv(f"test_legacy_report-{scenario.scenario}.csv", index=False)
+
+
+def test_prefetch(test_context) -> None:
+    from message_ix.testing import make_dantzig
+    from pandas.testing import assert_frame_equal
+
+    from message_ix_models.report.legacy.postprocess import PostProcess, Prefetch
+
+    scenario = make_dantzig(test_context.get_platform())
+
+    pp = PostProcess(scenario, prefetch=True)
+    assert isinstance(pp.ds, Prefetch)
+    ds = pp.ds
+
+    # Other methods are passed through
+    assert scenario.set("node").tolist() == ds.set("node").tolist()
+
+    tec = "transport_from_seattle"
+    filters: dict | None
+    for filters in (
+        None,
+        {"technology": [tec]},
+        {"technology": tec},  # Single label
+        {"technology": [tec, "canning_plant"], "node_dest": ["new-york", "chicago"]},
+        {"technology": [tec], "year_act": ["1963"]},  # Label types are converted
+        {"technology": []},  # Empty result
+        {"technology": ["not-a-technology"]},
+    ):
+        assert_frame_equal(scenario.par("output", filters), ds.par("output", filters))
+
+    # Data were retrieved once
+    assert {("par", "output")} == set(ds._data)
+
+    # Invalid dimension
+    with pytest.raises(KeyError):
+        ds.par("output", {"foo": ["bar"]})
+
+
+def _fill_year_act_vtg_reference(df):
+    """Reference implementation of :func:`.pp_utils._fill_year_act_vtg`.
+
+    This is the loop formerly in :func:`.pp_utils._retr_io_data`.
+    """
+    import pandas as pd
+
+    tmp = df[df.year_act == df.year_vtg]
+    for reg in df.node_loc.unique():
+        for t in df[df.node_loc == reg].technology.unique():
+            tmp_df = df[(df.node_loc == reg) & (df.technology == t)]
+            yr_miss = [
+                y
+                for y in tmp_df.year_act.unique()
+                if y
+                not in tmp[
+                    (tmp.node_loc == reg) & (tmp.technology == t)
+                ].year_vtg.unique()
+            ]
+            tmp_df = tmp_df[tmp_df.year_act.isin(yr_miss)]
+            for y in yr_miss:
+                tmp_df2 = tmp_df[tmp_df.year_act == y]
+                tmp_df2 = tmp_df2[tmp_df2.year_vtg == tmp_df2.year_vtg.max()]
+                tmp_df2.year_vtg = tmp_df2.year_act
+                tmp = pd.concat([tmp, tmp_df2], sort=True)
+    return tmp.reset_index().drop("index", axis=1)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fill_year_act_vtg(seed) -> None:
+    import numpy as np
+    import pandas as pd
+    from pandas.testing import assert_frame_equal
+
+    from message_ix_models.report.legacy.pp_utils import _fill_year_act_vtg
+
+    rng = np.random.default_rng(seed)
+
+    # Random input/output-like data, with technologies having different lifetimes
+    years = list(range(2020, 2070, 10))
+    data = []
+    for node in ("R1", "R2", "R3"):
+        for tec, lifetime in zip("abcd", rng.integers(1, 4, size=4)):
+            for yv in years:
+                for ya in filter(lambda y: yv <= y < yv + 10 * lifetime, years):
+                    # Randomly omit some rows, including diagonal rows
+                    if rng.random() < 0.3:
+                        continue
+                    for mode in ("M1", "M2"):
+                        data.append(
+                            (node, tec, yv, ya, mode, "c", "l", rng.random(), "GWa")
+                        )
+    columns = "node_loc technology year_vtg year_act mode commodity level value unit"
+    df = pd.DataFrame(data, columns=columns.split()).sample(frac=1.0, random_state=seed)
+
+    assert_frame_equal(_fill_year_act_vtg_reference(df), _fill_year_act_vtg(df))
+
+
+@pytest.mark.snapshot
+@pytest.mark.parametrize("param", ("input", "output"))
+def test_fill_year_act_vtg_snapshot(loaded_snapshot, param) -> None:
+    """Regression test of :func:`._fill_year_act_vtg` on a snapshot."""
+    from pandas.testing import assert_frame_equal
+
+    from message_ix_models.report.legacy.pp_utils import _fill_year_act_vtg
+
+    df = loaded_snapshot.par(param)
+
+    assert_frame_equal(_fill_year_act_vtg_reference(df), _fill_year_act_vtg(df))
+
+
+def _table_a(tec):
+    from message_ix_models.report.legacy import default_tables
+
+    ds = default_tables.pp.ds
+    return ds.par("output", {"technology": [tec]}).assign(table="a")
+
+
+def _table_b():
+    from message_ix_models.report.legacy import default_tables
+
+    # Other methods of the scenario are available
+    return default_tables.pp.ds.set("technology")
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_run_tables(monkeypatch, test_context, jobs) -> None:
+    from message_ix.testing import make_dantzig
+    from pandas.testing import assert_frame_equal, assert_series_equal
+
+    from message_ix_models.report.legacy import default_tables
+    from message_ix_models.report.legacy.parallel import run_tables
+    from message_ix_models.report.legacy.postprocess import PostProcess
+
+    scenario = make_dantzig(test_context.get_platform())
+    pp = PostProcess(scenario)
+    monkeypatch.setattr(default_tables, "pp", pp)
+
+    tecs = ["canning_plant", "transport_from_seattle", "transport_from_san-diego"]
+    tasks: dict[Any, tuple[Callable, dict]] = {
+        i: (_table_a, dict(tec=t)) for i, t in enumerate(tecs)
+    }
+    tasks["b"] = (_table_b, {})
+
+    result = run_tables(pp, tasks, jobs)
+
+    # Results are in the same order as `tasks`
+    assert list(tasks) == list(result)
+    for i, tec in enumerate(tecs):
+        expected = scenario.par("output", {"technology": [tec]}).assign(table="a")
+        assert_frame_equal(expected, result[i])
+    assert_series_equal(scenario.set("technology"), result["b"])
+
+    # `pp` in this process is unchanged
+    assert pp.ds is scenario
+
+
+def _table_pid(barrier) -> int:
+    import os
+
+    # Wait until another worker process also runs this function
+    barrier.wait(timeout=120)
+    return os.getpid()
+
+
+def test_run_tables_workers(test_context) -> None:
+    """:func:`.run_tables` actually uses more than one worker process."""
+    import os
+    from multiprocessing import Manager
+
+    from message_ix.testing import make_dantzig
+
+    from message_ix_models.report.legacy.parallel import run_tables
+    from message_ix_models.report.legacy.postprocess import PostProcess
+
+    pp = PostProcess(make_dantzig(test_context.get_platform()))
+
+    with Manager() as manager:
+        barrier = manager.Barrier(2)
+        result = run_tables(
+            pp, {i: (_table_pid, dict(barrier=barrier)) for i in (0, 1)}, 2
+        )
+
+    # Tables ran concurrently in 2 distinct processes, neither of them this one
+    assert 2 == len(set(result.values()))
+    assert os.getpid() not in result.values()
@@ -11,6 +11,7 @@ import pandas.testing as pdt
 import pytest
 import xarray as xr
 from genno import Computer, Quantity
+from genno.testing import assert_qty_equal
 from ixmp.testing import assert_logs
 from message_ix.testing import make_dantzig
 
@@ -20,14 +21,18 @@ from message_ix_models.report.operator import (
     compound_growth,
     filter_ts,
     from_url,
+    get_commodity_groups,
     get_ts,
     gwp_factors,
     latest_reporting,
     make_output_path,
     model_periods,
+    nodes_world_agg,
     remove_ts,
     share_curtailment,
+    store_ts_incremental,
     summarize,
+    write_ts,
 )
 
 
@@ -132,11 +137,74 @@ def test_get_remove_ts(caplog, scenario):
     assert 3 == len(scenario.timeseries())
 
 
+def test_store_ts_incremental(caplog, scenario) -> None:
+    def data(*values, unit="kg", region="World"):
+        return pd.DataFrame(
+            [[region, "Foo", unit, y, v] for y, v in zip((2020, 2030, 2040), values)],
+            columns=["region", "variable", "unit", "year", "value"],
+        )
+
+    # Data for other variables are not affected
+    N = len(scenario.timeseries())
+
+    # Initial data are added, including for another region
+    store_ts_incremental(scenario, data(1.0, 2.0, 3.0), data(4.0, region="DantzigLand"))
+    assert N + 4 == len(scenario.timeseries())
+
+    # Only changed and new data are added
+    with assert_logs(caplog, "1 rows unchanged; add 1; remove 0"):
+        store_ts_incremental(scenario, data(1.0, 2.5))
+
+    # Existing data for other regions and years are kept
+    result = scenario.timeseries(variable="Foo").sort_values(["region", "year"])
+    assert [4.0, 1.0, 2.5, 3.0] == result["value"].tolist()
+
+    # Nothing is changed; the scenario is not checked out
+    caplog.clear()
+    store_ts_incremental(scenario, data(1.0, 2.5))
+    assert "2 rows unchanged; add 0; remove 0" in caplog.messages[-1]
+
+    # Data with different units replace existing data for the same region and years
+    with assert_logs(caplog, "0 rows unchanged; add 2; remove 2"):
+        store_ts_incremental(scenario, data(1.0, 2.5, unit="t"))
+    result = scenario.timeseries(variable="Foo").sort_values(["region", "year"])
+    assert ["kg", "t", "t", "kg"] == result["unit"].tolist()
+    assert N + 4 == len(scenario.timeseries())
+
+
 def test_gwp_factors():
     result = gwp_factors()
 
     assert ("gwp metric", "e", "e equivalent") == result.dims
 
+    # Result is memoized, but each call returns a copy
+    assert result is not gwp_factors()
+    assert_qty_equal(result, gwp_factors())
+
+
+@pytest.mark.parametrize(
+    "func, args",
+    (
+        (get_commodity_groups, ()),
+        (nodes_world_agg, (dict(regions="R12"),)),
+    ),
+)
+def test_memoized_copy(func, args) -> None:
+    """Memoized operators return objects that callers can modify."""
+    result = func(*args)
+    dim, groups = next(iter(result.items()))
+    group = next(iter(groups))
+    expected = list(groups[group])
+
+    # Modify the result at every level
+    groups[group].append("foo")
+    groups.pop(group)
+    result["bar"] = {}
+
+    # The next result is unaffected
+    assert [dim] == list(func(*args))
+    assert expected == func(*args)[dim][group]
+
 
 @pytest.fixture(scope="module")
 def context_with_reporting_data(session_context: Context) -> Iterator[Context]:
@@ -288,3 +356,52 @@ def test_summarize(args) -> None:
  0 other items""",
         result,
     )
+
+
+@pytest.fixture
+def ts_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ["m", "s", n, v, "EJ/yr", y, i + 0.5]
+            for i, (n, v, y) in enumerate(
+                (n, v, y)
+                for n in ("R12_AFR", "R12_NAM")
+                for v in ("Final Energy|Solids", "Final Energy|Gases", "Emissions|CO2")
+                for y in (2020, 2030)
+            )
+        ],
+        columns=["model", "scenario", "region", "variable", "unit", "year", "value"],
+    )
+
+
+@pytest.mark.parametrize("partition", [None, "region", "variable"])
+@pytest.mark.parametrize("suffix", ["csv", "feather", "parquet", "xlsx"])
+def test_write_ts(tmp_path, ts_data, suffix, partition) -> None:
+    path = tmp_path.joinpath(f"foo.{suffix}")
+
+    # Operator runs
+    assert path == write_ts(ts_data, path, partition=partition)
+
+    # Data round-trip
+    result = getattr(pd, f"read_{'excel' if suffix == 'xlsx' else suffix}")(path)
+    if partition is None or suffix == "xlsx":
+        pdt.assert_frame_equal(ts_data, result)
+    else:
+        # Same data, but possibly in a different order
+        assert len(ts_data) == len(result)
+        pdt.assert_frame_equal(ts_data, result.sort_values("value", ignore_index=True))
+
+    # Empty data can be written
+    write_ts(ts_data.iloc[:0, :], path, partition=partition)
+
+
+def test_write_ts_max_rows(caplog, tmp_path, ts_data) -> None:
+    path = tmp_path.joinpath("foo.xlsx")
+
+    # Nothing written when data exceed `max_rows`
+    assert write_ts(ts_data, path, max_rows=10) is None
+    assert not path.exists()
+    assert "Skip writing 12 > max_rows = 10 rows" in caplog.messages[-1]
+
+    with pytest.raises(NotImplementedError):
+        write_ts(ts_data, tmp_path.joinpath("foo.txt"))
@@ -2,7 +2,7 @@
 
 import re
 from collections.abc import Hashable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
@@ -24,6 +24,7 @@ from message_ix_models.tools import iamc
 from message_ix_models.util import package_data_path
 
 if TYPE_CHECKING:
+    from genno import Computer
     from message_ix import Reporter
 
 # Minimal reporting configuration for testing
@@ -261,6 +262,97 @@ def test_collapse(input, exp):
     pdt.assert_frame_equal(util.collapse(df_in), df_exp)
 
 
+@pytest.mark.parametrize(
+    "exact, expected", [(False, "Hard Solid"), (True, "Hard Coal")]
+)
+def test_collapse_exact(monkeypatch, exact, expected) -> None:
+    """:py:`exact=True` is passed to :func:`.collapse` from config and
+    :class:`.IAMCConversion`."""
+    from genno import Computer, Key, Quantity
+
+    from message_ix_models.report import iamc as handle_iamc
+    from message_ix_models.report import key
+
+    monkeypatch.setitem(util.REPLACE_DIMS, "t", {"Coal$": "Solid"})
+
+    c = Computer()
+    c.add(key.all_iamc, "concat")
+    idx = pd.MultiIndex.from_product(
+        [["R12_AFR"], ["coal", "hard coal"], [2020]], names=["n", "t", "y"]
+    )
+    c.add("x:n-t-y", Quantity(pd.Series([1.0, 2.0], index=idx), units="kg"))
+
+    # Using the handler for the "iamc:" configuration section
+    handle_iamc(
+        c,
+        dict(variable="X", base="x:n-t-y", var=["X", "t"], collapse=dict(exact=exact)),
+    )
+    # Using IAMCConversion
+    util.IAMCConversion(
+        base=Key("x:n-t-y"), var_parts=["Y", "t"], unit="kg", exact=exact
+    ).add_tasks(c)
+
+    for k, prefix in (("X::iamc", "X"), ("Y 0::iamc", "Y")):
+        result = c.get(k).as_pandas()
+        assert {f"{prefix}|Solid", f"{prefix}|{expected}"} == set(result["variable"])
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_collapse_replace(exact) -> None:
+    """Replacements in :func:`.collapse` give the same result as pandas."""
+    replacements = {
+        "a": "b",
+        "b": "c",
+        "^Foo$": "Bar",
+        "^Bar$": "Baz",
+        "Coal$": "Solids|Coal",
+        r"(x)y": r"\1z",
+        "^Qux$": r"\g<0> 2",
+    }
+    df = pd.DataFrame(
+        {"t": ["ab", "a", "b", "ba", "Foo", "Bar", "Coal", "Hard Coal", "xy", "Qux"]}
+    )
+    df = pd.concat([df, pd.DataFrame({"t": [None, 3]})] * 2, ignore_index=True)
+
+    # Expected result from pandas
+    exp = df.replace(
+        dict(
+            t={
+                ("^Coal$" if exact and k == "Coal$" else k): v
+                for k, v in replacements.items()
+            }
+        ),
+        regex=True,
+    )
+
+    result = util._replace(df["t"], replacements, exact)
+    pdt.assert_series_equal(exp["t"], result)
+
+
+def test_store_write_ts(tmp_path) -> None:
+    from genno import Computer, Key
+
+    c = Computer()
+    c.require_compat("message_ix_models.report.operator")
+    c.configure(output_dir=tmp_path, write_ts=dict(formats=["csv", "parquet"]))
+    c.add("foo::iamc", pd.DataFrame)
+
+    # Keys are added according to the configuration, overridden by keyword arguments
+    k = Key("foo::iamc")
+    assert "foo::iamc+all" == util.store_write_ts(c, k, partition="region")
+    assert {k + "csv", k + "parquet"} <= set(c.graph)
+    assert k + "xlsx" not in c.graph
+    assert "region" == c.graph[k + "parquet"][0].keywords["partition"]
+
+    # Files are written
+    c.get(k + "file")
+    assert {"foo.csv", "foo.parquet"} == {p.name for p in tmp_path.iterdir()}
+
+    # Option to store time series data incrementally
+    util.store_write_ts(c, Key("bar::iamc"), incremental=True)
+    assert "store_ts_incremental" == c.graph["bar::iamc+store"][0].__name__
+
+
 def simulated_solution_reporter(snapshot_id: int = 0) -> "Reporter":
     """Reporter with a simulated solution for `snapshot_id`."""
     from message_ix import Reporter
@@ -312,6 +404,82 @@ def test_add_simulated_solution(test_context, test_data_path):
     assert np.isclose(79.76478, value.item())
 
 
+@pytest.fixture
+def sim_cache(tmp_path, test_context):
+    """Use a temporary directory for :func:`.report.sim._cached`."""
+    path = tmp_path.joinpath("cache")
+    test_context.core.cache_path = path
+    test_context.core.cache_skip = False
+    yield path.joinpath("report-sim")
+
+
+def test_data_from_file(monkeypatch, tmp_path, sim_cache) -> None:
+    from message_ix_models.report import sim
+    from message_ix_models.report.sim import data_from_file
+
+    path = tmp_path.joinpath("ACT.csv.gz")
+    pd.DataFrame(
+        [["R11_AFR", "t", 2020, 2020, "M1", "year", 1.0, 0, 0, 0, 1]],
+        columns="node tec year_vtg year_act mode time lvl m lo up scale".split(),
+    ).to_csv(path, index=False)
+
+    kw: dict[str, Any] = dict(name="ACT", dims="nl t yv ya m h".split())
+    result0 = data_from_file(path, **kw)
+
+    # Data were cached
+    assert 1 == len(list(sim_cache.iterdir()))
+
+    # Data from the cache are identical
+    result1 = data_from_file(path, **kw)
+    assert result0.to_series().equals(result1.to_series())
+
+    # Modified file is read again
+    pd.read_csv(path).assign(lvl=2.0).to_csv(path, index=False)
+    result2 = data_from_file(path, **kw)
+    assert 2 == len(list(sim_cache.iterdir()))
+    assert [2.0] == result2.to_series().tolist()
+
+    # Least recently used files are deleted to limit the total size
+    size = max(p.stat().st_size for p in sim_cache.iterdir())
+    monkeypatch.setattr(sim, "CACHE_MAX_SIZE", size)
+    pd.read_csv(path).assign(lvl=3.0).to_csv(path, index=False)
+    result3 = data_from_file(path, **kw)
+    assert 1 == len(list(sim_cache.iterdir()))
+    assert result3.to_series().equals(data_from_file(path, **kw).to_series())
+
+
+def test_reporter_from_excel(tmp_path, sim_cache) -> None:
+    from message_ix_models.report.sim import reporter_from_excel
+
+    path = tmp_path.joinpath("scenario.xlsx")
+    with pd.ExcelWriter(path) as ew:
+        sheets = dict(
+            ix_type_mapping=pd.DataFrame(
+                [[n, "set"] for n in ("commodity", "node", "year")]
+                + [["demand", "par"]],
+                columns=["item", "ix_type"],
+            ),
+            commodity=pd.DataFrame(dict(commodity=["coal", "gas"])),
+            node=pd.DataFrame(dict(node=["World"])),
+            year=pd.DataFrame(dict(year=[2020, 2030])),
+            demand=pd.DataFrame(
+                [["World", "gas", "final", 2020, "year", 1.0, "GWa"]],
+                columns="node commodity level year time value unit".split(),
+            ),
+        )
+        for name, df in sheets.items():
+            df.to_excel(ew, sheet_name=name, index=False)
+
+    rep0 = reporter_from_excel(path)
+    assert ["coal", "gas"] == rep0.get("c")
+    exp = rep0.get("demand:n-c-l-y-h")
+
+    # A second Reporter uses the cached data; the file is not opened
+    rep1 = reporter_from_excel(path)
+    pdt.assert_series_equal(exp.to_series(), rep1.get("demand").to_series())
+    assert "_file" not in rep1.graph["scenario"].__dict__
+
+
 def test_prepare_reporter(test_context):
     rep = simulated_solution_reporter()
     N = len(rep.graph)
@@ -323,6 +491,215 @@ def test_prepare_reporter(test_context):
     assert 14299 <= len(rep.graph) - N
 
 
+def test_prepare_reporter_prune(test_context) -> None:
+    from message_ix_models.report.key import all_iamc
+
+    test_context.report.update(key=all_iamc, prune=True)
+    rep, key = prepare_reporter(test_context, reporter=simulated_solution_reporter())
+
+    # Only tasks needed for `key`, and "config" and "scenario", remain
+    assert len(rep.graph) < 14299
+    assert {"config", "scenario"} <= set(rep.graph)
+    assert key in rep.graph
+
+    # Tasks not needed for `key` are removed
+    assert "message::default" not in rep.graph
+
+
+def _computer() -> "Computer":
+    from genno import Computer
+
+    c = Computer()
+    c.add("a", 1)
+    c.add("b", lambda a: a + 1, "a")
+    c.add("c", lambda b: list(range(b)), "b")
+    c.add("d", lambda a: 2 * a, "a")
+    c.add("e", pd.Series, "c")
+    return c
+
+
+def test_prune() -> None:
+    c = _computer()
+
+    # Tasks not needed for "c" are removed
+    assert 2 == util.prune(c, "c")
+    assert {"a", "b", "c", "config"} == set(c.graph)
+
+    # The remaining tasks give the same result
+    assert [0, 1] == c.get("c")
+
+
+def test_profile(tmp_path) -> None:
+    c = _computer()
+    path = tmp_path.joinpath("profile.csv")
+
+    result, data = util.profile(c, "e", path=path)
+
+    # Result is the same as with Computer.get()
+    pdt.assert_series_equal(c.get("e"), result)
+
+    # Data were recorded for the 3 executed tasks; "a" is a literal value
+    assert {"b", "c", "e"} == set(data["key"])
+    assert data["time"].is_monotonic_decreasing
+    assert [2, 2] == data.set_index("key").loc[["c", "e"], "len"].tolist()
+    assert (0 < data["nbytes"]).all()
+
+    # Data were written to file
+    pdt.assert_frame_equal(data, pd.read_csv(path), check_dtype=False)
+
+    # Graph is restored
+    assert "<lambda>" == c.graph["b"][0].__name__
+
+
+def test_freeze() -> None:
+    c = _computer()
+    c.add("f", lambda scenario, d: d, "scenario", "d")
+    c.add("scenario", "s0")
+
+    # Tasks that depend on "scenario", directly or indirectly, are not replaced
+    assert 0 == util.freeze(c, "f", dynamic=["a"])
+
+    # Tasks that do not depend on "scenario" are replaced with their results
+    assert 4 == util.freeze(c, "e", "f", dynamic=["scenario"])
+    assert callable(c.graph["f"][0])
+
+    # Frozen results are not recomputed
+    c.add("a", 2)
+    assert [0, 1] == c.get("e").tolist()
+    assert 2 == c.get("f")
+
+    # Task at a Key is replaced, not duplicated
+    k = c.add("g:x", lambda d: d, "d")
+    N = len(c.graph)
+    assert 1 == util.freeze(c, k, dynamic=["scenario"])
+    assert N == len(c.graph) and 2 == c.graph[k]
+
+    # Other exceptions in static tasks are raised
+    c.add("h", lambda d: d / 0, "d")
+    with pytest.raises(ZeroDivisionError):
+        util.freeze(c, "h", dynamic=["scenario"])
+
+
+def test_rebind(test_context) -> None:
+    from message_ix import Reporter
+    from message_ix.testing import make_dantzig
+
+    s0 = make_dantzig(test_context.get_platform())
+    rep = Reporter.from_scenario(s0)
+
+    s1 = s0.clone(scenario="rebind 1")
+    with s1.transact():
+        s1.add_set("node", "foo")
+
+    util.rebind(rep, s1)
+
+    # Scenario and set elements are replaced
+    assert s1 is rep.get("scenario")
+    assert "foo" in rep.get("n")
+
+    # Scenario with different items cannot be used
+    s2 = s0.clone(scenario="rebind 2")
+    with s2.transact():
+        s2.init_par("foo", idx_sets=["node"])
+
+    with pytest.raises(ValueError, match="different par items"):
+        util.rebind(rep, s2)
+
+
+def test_report_batch(monkeypatch, request, tmp_path, test_context) -> None:
+    from copy import deepcopy
+
+    import message_ix_models.report
+
+    # Count calls to prepare_reporter()
+    calls = []
+
+    def wrapped(*args, **kwargs):
+        calls.append(args)
+        return prepare_reporter(*args, **kwargs)
+
+    s0 = testing.bare_res(request, test_context, solved=False)
+    scenarios = [s0, s0.clone(scenario=f"{s0.scenario} 1")]
+
+    contexts = []
+    for s in scenarios:
+        ctx = deepcopy(test_context)
+        ctx.set_scenario(s)
+        ctx.report.update(from_file="global.yaml", key="y0", output_dir=tmp_path)
+        contexts.append(ctx)
+
+    with monkeypatch.context() as m:
+        m.setattr(message_ix_models.report, "prepare_reporter", wrapped)
+        message_ix_models.report.report_batch(contexts)
+
+    # The Reporter was prepared once
+    assert 1 == len(calls)
+
+    # Output directory was set for each scenario
+    assert contexts[0].report.output_dir != contexts[1].report.output_dir
+
+
+def test_report_batch_solution(monkeypatch, request, tmp_path, test_context) -> None:
+    """:func:`.report_batch` with scenarios that differ in having a solution."""
+    from copy import deepcopy
+
+    from message_ix import Scenario
+
+    import message_ix_models.report
+
+    calls = []
+
+    def wrapped(*args, **kwargs):
+        calls.append(args)
+        return prepare_reporter(*args, **kwargs)
+
+    s0 = testing.bare_res(request, test_context, solved=False)
+    scenarios = [s0] + [s0.clone(scenario=f"{s0.scenario} {i}") for i in (1, 2)]
+
+    contexts = []
+    for s in scenarios:
+        ctx = deepcopy(test_context)
+        ctx.set_scenario(s)
+        ctx.report.update(
+            from_file="global.yaml",
+            key="duration_period",
+            output_dir=tmp_path,
+            cli_output=tmp_path.joinpath("out.csv"),
+        )
+        contexts.append(ctx)
+
+    with monkeypatch.context() as m:
+        m.setattr(message_ix_models.report, "prepare_reporter", wrapped)
+        # Only the scenario with name ending " 1" appears to have a solution
+        m.setattr(Scenario, "has_solution", lambda self: self.scenario.endswith(" 1"))
+        message_ix_models.report.report_batch(contexts)
+
+    # The Reporter was prepared for every scenario
+    assert 3 == len(calls)
+
+    # Output was written to a distinct file for each scenario
+    paths = {ctx.report.cli_output for ctx in contexts}
+    assert 3 == len(paths) and all(p.exists() for p in paths)
+
+
+def test_warm_cache(mix_models_cli, test_context) -> None:
+    from message_ix_models.report.operator import _nodes_world_agg
+
+    _nodes_world_agg.cache_clear()
+
+    result = util.warm_cache()
+
+    # Caches are populated for node code lists
+    assert "R12" in result
+    assert 2 * len(result) == _nodes_world_agg.cache_info().currsize
+
+    # GWP factors are cached on disk
+    assert 1 == len(list(test_context.core.cache_path.glob("_gwp_factors-*")))
+
+    # Command runs without reporting any scenario
+    mix_models_cli.assert_exit_0(["report", "--warm-cache"])
+
+
 def test_compare(test_context, snapshot_id: int = 1) -> None:
     """Compare the output of genno-based and legacy reporting."""
     from message_ix_models.report.key import all_iamc
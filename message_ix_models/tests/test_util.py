@@ -11,24 +11,29 @@ from iam_units import registry
 from ixmp.testing import assert_logs
 from message_ix import Scenario, make_df
 from message_ix.testing import make_dantzig
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.testing import MARK
 from message_ix_models.util import (
     MESSAGE_DATA_PATH,
     MESSAGE_MODELS_PATH,
+    add_par_data,
     as_codes,
     broadcast,
     check_support,
+    compact,
     convert_units,
     copy_column,
     ffill,
+    iter_broadcast,
     load_package_data,
     load_private_data,
     local_data_path,
+    make_io,
     make_source_tech,
     maybe_query,
+    merge_data,
     package_data_path,
     path_fallback,
     private_data_path,
@@ -42,6 +47,47 @@ from message_ix_models.util import (
 _actual_package_data = Path(__file__).parents[1].joinpath("data")
 
 
+def test_add_par_data(caplog, test_context) -> None:
+    mp = test_context.get_platform()
+    scenario = make_dantzig(mp)
+
+    base = make_df(
+        "demand",
+        commodity="cases",
+        level="consumption",
+        year=1963,
+        time="year",
+        value=1.0,
+        unit="case",
+    )
+    nodes = ["new-york", "chicago", "topeka"]
+
+    # Data for a parameter can be an iterable of chunks
+    data = {"demand": iter_broadcast(base, chunksize=2, node=nodes)}
+
+    # Function runs on a checked-in `scenario`
+    with caplog.at_level(logging.INFO, logger="message_ix_models"):
+        assert 3 == add_par_data(scenario, data, chunksize=1)
+
+    # Rows are counted and the rate is logged
+    assert "3 rows in 'demand'" in caplog.messages
+    assert re.match(r"Added 3 rows; [\d\.]+ s, \d+ rows/s", caplog.messages[-1])
+
+    # Data were committed
+    s = Scenario(mp, scenario.model, scenario.scenario, version=scenario.version)
+    assert (1.0 == s.par("demand", filters=dict(node=nodes))["value"]).all()
+
+    # Invalid data raise an exception; changes are discarded
+    data = {"demand": base.assign(node="not-a-node", value=2.0)}
+    with pytest.raises(Exception):
+        add_par_data(scenario, data)
+    assert not (2.0 == scenario.par("demand")["value"]).any()
+
+    # `scenario` is not left checked out
+    scenario.check_out()
+    scenario.discard_changes()
+
+
 def test_as_codes():
     """Forward reference to a child is silently dropped."""
     data = dict(
@@ -110,6 +156,41 @@ def test_broadcast(caplog):
         base.pipe(broadcast, labels, d=["d0"])
 
 
+def test_broadcast_order() -> None:
+    base = make_df("input", technology="t", value=[1.1, 2.2])
+    labels = pd.DataFrame(dict(commodity=["c0", "c1"], level=["l0", "l1"]))
+    mode = pd.Categorical(["m0", "m1"])
+
+    result = base.pipe(broadcast, labels, node_loc=["n0", "n1", "n2"], mode=mode)
+
+    # Dimensions given as keyword arguments are first, in reverse order
+    assert ["mode", "node_loc"] == list(result.columns[:2])
+    assert set(base.columns) == set(result.columns)
+    assert pd.RangeIndex(2 * 2 * 3 * 2).equals(result.index)
+
+    # Rows of `base` vary fastest, then `labels`, then keyword arguments in order
+    expected = pd.DataFrame(
+        [
+            (m, n, c, lv, v)
+            for m in ("m0", "m1")
+            for n in ("n0", "n1", "n2")
+            for c, lv in (("c0", "l0"), ("c1", "l1"))
+            for v in (1.1, 2.2)
+        ],
+        columns=["mode", "node_loc", "commodity", "level", "value"],
+    )
+    assert_frame_equal(expected.astype({"mode": "category"}), result[expected.columns])
+
+    # iter_broadcast() gives the same result in pieces
+    chunks = list(
+        iter_broadcast(
+            base, labels, chunksize=5, node_loc=["n0", "n1", "n2"], mode=mode
+        )
+    )
+    assert [5, 5, 5, 5, 4] == list(map(len, chunks))
+    assert_frame_equal(result, pd.concat(chunks))
+
+
 @pytest.mark.parametrize(
     "data",
     (
@@ -145,6 +226,63 @@ def test_check_support(test_context):
         check_support(*args)
 
 
+@MARK["ixmp#595"]
+@MARK["ixmp#600"]
+def test_compact(test_mp) -> None:
+    # make_io() with compact=True
+    data = make_io(
+        ("coal", "primary", "GWa"),
+        ("electr", "secondary", "GWa"),
+        0.4,
+        technology="t",
+        compact=True,
+    )
+    for column in "commodity level technology unit".split():
+        assert isinstance(data["input"][column].dtype, pd.CategoricalDtype)
+    # Empty columns are unchanged
+    assert data["input"]["node_loc"].isna().all()
+
+    # Categories for "commodity" include all codes from the code list
+    assert {"coal", "electr", "uranium"} <= set(
+        data["input"]["commodity"].cat.categories
+    )
+
+    # broadcast() converts labels to categorical if `df` has categorical columns
+    df = data["input"].pipe(broadcast, node_loc=["n0", "n1"]).pipe(same_node)
+    assert isinstance(df["node_loc"].dtype, pd.CategoricalDtype)
+    # node_loc and node_origin share categories
+    assert df["node_loc"].dtype == df["node_origin"].dtype
+
+    # New labels extend the shared categories; merge_data() preserves categoricals
+    base = {"input": df}
+    merge_data(base, make_io(("c_new", "l", "-"), ("c", "l", "-"), 1.0, compact=True))
+    assert 3 == len(base["input"])
+    assert isinstance(base["input"]["commodity"].dtype, pd.CategoricalDtype)
+
+    # Same for make_source_tech() and add_par_data()
+    s = Scenario(test_mp, model="model", scenario="scenario", version="new")
+    s.add_set("node", ["World", "node0", "node1"])
+    for name in "commodity level mode technology".split():
+        s.add_set(name, _MST_COMMON[name])
+    s.add_set("time", "time")
+    s.add_horizon([1, 2, 3])
+    for unit in ("-", "unit"):
+        s.platform.add_unit(unit)
+
+    data = make_source_tech(s, _MST_COMMON, compact=True, **_MST_VALUES)
+    for df in data.values():
+        assert isinstance(df["technology"].dtype, pd.CategoricalDtype)
+    # Empty units are replaced without losing the categorical dtype
+    data["var_cost"]["unit"] = pd.Categorical([""] * len(data["var_cost"]))
+
+    assert 4 * 6 == add_par_data(s, data)
+    assert isinstance(data["var_cost"]["unit"].dtype, pd.CategoricalDtype)
+    assert {"-"} == set(s.par("var_cost")["unit"])
+
+    # compact() is idempotent and can be applied to a dict of data frames
+    assert data is compact(data)
+
+
 def test_convert_units(recwarn):
     """:func:`.convert_units` works."""
     # Common arguments
@@ -312,6 +450,60 @@ def test_maybe_query():
     assert 2 == len(maybe_query(s, "bar == 'c'"))
 
 
+@pytest.mark.parametrize(
+    "on_duplicate, expected",
+    (
+        (None, [1.0, 2.0, 3.0, 4.0, 1.0]),
+        ("first", [1.0, 2.0, 4.0]),
+        ("last", [1.0, 3.0, 4.0]),
+        ("sum", [1.0, 5.0, 4.0]),
+        ("error", None),
+    ),
+)
+def test_merge_data(on_duplicate, expected) -> None:
+    def _df(nodes, values, unit="GWa"):
+        return make_df(
+            "demand",
+            node=nodes,
+            commodity="c",
+            level="l",
+            year=2020,
+            time="year",
+            value=values,
+            unit=unit,
+        )
+
+    base = {"demand": _df(["n1", "n2"], [1.0, 2.0])}
+    # "n2" conflicts with `base`; "n1" is an exact duplicate
+    others = ({"demand": _df(["n2", "n3"], [3.0, 4.0])}, {"demand": _df("n1", 1.0)})
+
+    if on_duplicate == "error":
+        # Conflicting rows are reported
+        with pytest.raises(ValueError, match="2 rows in 'demand' with conflicting"):
+            merge_data(base, *others, on_duplicate=on_duplicate)
+    else:
+        merge_data(base, *others, on_duplicate=on_duplicate)
+        assert expected == base["demand"]["value"].tolist()
+
+    if on_duplicate == "sum":
+        # Values with different units cannot be summed
+        with pytest.raises(ValueError, match="conflicting units"):
+            merge_data(base, {"demand": _df("n3", 1.0, "t")}, on_duplicate="sum")
+    elif on_duplicate is not None:
+        # Exact duplicates do not raise, even with on_duplicate="error"
+        merge_data(base, *others[1:], on_duplicate="error")
+
+    if on_duplicate is not None:
+        # Data without all the key columns are rejected
+        other = {"demand": _df("n4", 1.0).drop(columns="time")}
+        with pytest.raises(ValueError, match=r"missing key column\(s\) \['time'\]"):
+            merge_data({}, other, on_duplicate=on_duplicate)
+
+    # Invalid value is rejected even if there are no duplicates
+    with pytest.raises(ValueError, match="on_duplicate='frist'"):
+        merge_data({}, {"demand": _df("n4", 1.0)}, on_duplicate="frist")  # type: ignore
+
+
 def test_local_data_path(tmp_path_factory, session_context):
     assert tmp_path_factory.getbasetemp().joinpath(
         "data0", "foo", "bar"
@@ -433,3 +625,36 @@ def test_strip_par_data(caplog, test_context):
     )
     # Nothing was actually removed
     assert N == len(s.par("output"))
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_strip_par_data_multi(caplog, test_context, dry_run) -> None:
+    """:func:`.strip_par_data` with a sequence of elements."""
+    s = make_dantzig(test_context.get_platform(), solve=False)
+    s.check_out()
+
+    N = len(s.par("output"))
+    dump: dict[str, pd.DataFrame] = dict()
+    elements = ["new-york", "topeka", "not-a-node"]
+    # "output" has 2 dimensions indexed by "node"; rows with any of the elements in
+    # either dimension are selected
+    expected = s.par("output", filters=dict(node_dest=elements[:2]))
+
+    # No elements → no data are retrieved or removed
+    assert 0 == strip_par_data(s, "node", [], dry_run=dry_run, dump=dump)
+    assert {} == dump
+
+    total = strip_par_data(s, "node", elements, dry_run=dry_run, dump=dump)
+
+    assert len(expected) == len(dump["output"])
+    assert {"demand", "output"} <= set(dump)
+    assert total == sum(map(len, dump.values()))
+    assert_logs(caplog, "Remove data with node in ['new-york', 'topeka', 'not-a-node']")
+
+    if dry_run:
+        # Nothing was actually removed
+        assert N == len(s.par("output"))
+    else:
+        assert N - len(dump["output"]) == len(s.par("output"))
+        assert not {"new-york", "topeka"} & set(s.set("node"))
+        assert_logs(caplog, "Remove 2 element(s) from set 'node'")
@@ -5,9 +5,17 @@ import pytest
 from message_ix import make_df
 
 from message_ix_models import Workflow, testing
-from message_ix_models.workflow import WorkflowStep, make_click_command, solve
+from message_ix_models.workflow import (
+    PROFILE_COLUMNS,
+    WorkflowStep,
+    make_click_command,
+    solve,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
     from message_ix import Scenario
 
     from message_ix_models import Context
@@ -156,6 +164,11 @@ def test_workflow(
     # Scenario was solved
     assert s.has_solution()
 
+    # Time spent in solve() is recorded, without replacing the method of the class
+    assert wf.profile is not None
+    assert 0 < wf.profile.loc["B solved", "solve"]
+    assert "solve" not in vars(s)
+
     # Log messages reflect workflow steps executed
     start_index = 1 if caplog.messages[0].startswith("Cull") else 0
     # Expression for the model name:
@@ -209,3 +222,144 @@ def test_workflow(
   - None""",
         wf.describe("B"),
     )
+
+
+def test_workflow_run_parallel(
+    caplog, request: "pytest.FixtureRequest", test_context: "Context", wf: "Workflow"
+) -> None:
+    from concurrent.futures import Executor, Future
+
+    class SerialExecutor(Executor):
+        """Execute in the calling thread, sharing the in-memory test database."""
+
+        def submit(self, fn, /, *args, **kwargs):
+            f: Future = Future()
+            f.set_result(fn(*args, **kwargs))
+            return f
+
+    wf.graph.pop("_base_platform")
+
+    # Two branches that both depend on "B"
+    wf.add_step("C", "B", changes_a, clone=True, target="foo/C")
+    wf.add_step("D", "B", changes_b, clone=True, target="foo/D", value=200.0)
+    wf.add("all", ["C", "D"])
+
+    # Steps are returned in dependency order
+    steps = wf.iter_steps("all")
+    assert {"base", "A", "B", "C", "D"} == set(steps)
+    assert steps.index("A") < steps.index("B") < min(steps.index(k) for k in "CD")
+
+    result = wf.run("all", executor=SerialExecutor())
+
+    # Results of both branches are returned
+    assert ["foo/C", "foo/D"] == [f"{s.model}/{s.scenario}" for s in result]
+    assert 1 == len(result[0].par("technical_lifetime"))
+    assert [200.0] == result[1].par("technical_lifetime")["value"].tolist()
+
+    # Time and memory usage per step are stored and logged
+    assert wf.profile is not None
+    assert {"base", "A", "B", "C", "D"} == set(wf.profile.index)
+    assert "Time (s) and memory (MiB) per step:" in caplog.text
+
+    # Steps in the graph are restored
+    assert "changes_b" == wf.graph["D"][0].action.__name__
+
+
+def test_workflow_resume(caplog, test_context: "Context", wf: "Workflow") -> None:
+    wf.graph.pop("_base_platform")
+
+    # Workflow runs
+    s0 = wf.run("B")
+    assert not any(m.startswith("Skip") for m in caplog.messages)
+
+    # Time and memory usage are recorded for each step
+    profile = wf.profile
+    assert profile is not None
+    assert ["base", "A", "B"] == profile.index.tolist()
+    assert set(PROFILE_COLUMNS) == set(profile.columns)
+    assert (profile["wall"] >= profile["action"]).all()
+    assert 0 == profile.loc["base", "action"]
+    assert 0 < profile.loc["A", "action"]
+
+    # Fingerprint differs according to step and base scenario
+    step_a, step_b = wf.graph["A"][0], wf.graph["B"][0]
+    assert step_a.fingerprint(s0) != step_b.fingerprint(s0)
+
+    # Without resume=True, steps are executed again
+    caplog.clear()
+    wf.run("B")
+    assert not any(m.startswith("Skip") for m in caplog.messages)
+
+    # With resume=True, steps with identical fingerprints are skipped
+    test_context.core.resume = True
+    caplog.clear()
+    s1 = wf.run("B")
+    for name in "changes_a", "changes_b":
+        assert re.search(rf"Skip <Step {name}\(\)>; target exists: .*#1", caplog.text)
+    assert "Execute" not in caplog.text
+    assert s0.url == s1.url
+
+    # Changing the keyword arguments to a step causes it to be run again
+    wf.graph["B"][0].kwargs.update(value=200.0)
+    caplog.clear()
+    s2 = wf.run("B")
+    assert "Execute <function changes_b" in caplog.text
+    assert [200.0] == s2.par("technical_lifetime")["value"].tolist()
+
+
+@pytest.fixture
+def file_platforms(tmp_path: "Path") -> "Iterator[list[str]]":
+    """Names of 2 platforms, each connected to a file-based database."""
+    import ixmp
+
+    names = [f"{__name__}-{i}" for i in range(2)]
+    for name in names:
+        ixmp.config.add_platform(name, "jdbc", "hsqldb", tmp_path.joinpath(name))
+    ixmp.config.save()  # Make the platforms available to other processes
+
+    yield names
+
+    for name in names:
+        ixmp.config.remove_platform(name)
+    ixmp.config.save()
+
+
+def test_workflow_run_parallel_spawn(
+    test_context: "Context", file_platforms: list[str]
+) -> None:
+    """:meth:`.run_parallel` with worker processes started by "spawn"."""
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    import ixmp
+    from message_ix.testing import make_dantzig
+
+    wf = Workflow(test_context)
+
+    # Two independent branches, each on a separate platform, so that steps in different
+    # processes do not open the same file-based database concurrently
+    for i, name in enumerate(file_platforms):
+        mp = ixmp.Platform(name)
+        url = make_dantzig(mp).url
+        mp.close_db()
+
+        wf.add_step(f"base{i}", None, target=f"ixmp://{name}/{url}")
+        wf.add_step(f"X{i}", f"base{i}", changes_a, clone=True, target="foo/X")
+    wf.add("all", ["X0", "X1"])
+
+    result = wf.run(
+        "all", executor=ProcessPoolExecutor(2, mp_context=get_context("spawn"))
+    )
+
+    # Each branch produced a scenario on its own platform
+    assert file_platforms == [s.platform.name for s in result]
+    assert all("test_tech" in s.set("technology").tolist() for s in result)
+    assert wf.profile is not None
+    assert {"base0", "base1", "X0", "X1"} == set(wf.profile.index)
+    for s in result:
+        s.platform.close_db()
+
+    # Steps with actions that cannot be pickled are not submitted
+    wf.add_step("Y", "base0", lambda c, s: s, clone=True, target="foo/Y")
+    with pytest.raises(TypeError, match="Step 'Y' cannot be run in another process"):
+        wf.run("Y", parallel=2)
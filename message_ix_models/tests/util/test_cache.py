@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 from copy import deepcopy
 
 import pytest
@@ -9,9 +10,23 @@ from ixmp.testing import assert_logs
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.util import cache, cached
+from message_ix_models.util.cache import cache_tasks
 
 log = logging.getLogger(__name__)
 
+#: Number of times each function used in :func:`test_cache_tasks` has executed.
+COUNT: Counter = Counter()
+
+
+def _double(x):
+    COUNT["double"] += 1
+    return [v * 2 for v in x]
+
+
+def _total(x, *others):
+    COUNT["total"] += 1
+    return sum(x)
+
 
 class TestEncoder:
     def test_sdmx(self):
@@ -123,3 +138,65 @@ def test_cached(caplog, test_context, tmp_path) -> None:
 
     with pytest.raises(TypeError, match="Object of type Foo is not JSON serializable"):
         func1(arg=Foo())
+
+
+def test_cache_tasks(monkeypatch, tmp_path) -> None:
+    from genno import Computer, quote
+
+    from message_ix_models.util import cache as util_cache
+
+    def computer(values=[1, 2, 3]):
+        c = Computer()
+        c.add("x", quote(values))
+        c.add("y:i", _double, "x")
+        c.add("z", _total, "y:i")
+        # Depends on an excluded key
+        c.add("scenario", quote("foo"))
+        c.add("w", _total, "y:i", "scenario")
+        return c
+
+    COUNT.clear()
+    path = tmp_path.joinpath("cache")
+    kw = dict(path=path, max_size=2**20, min_time=0)
+
+    # No stored results on first run
+    c = computer()
+    assert 0 == cache_tasks(c, "z", "w", **kw)
+    assert 12 == c.get("z") == c.get("w")
+    assert dict(double=2, total=2) == COUNT
+    # Results are stored for "y:i" and "z", but not "w"
+    assert 2 == len(list(path.glob("*.pkl")))
+
+    # Stored results are used by an identical graph
+    COUNT.clear()
+    c = computer()
+    assert 2 == cache_tasks(c, "z", "w", **kw)
+    assert 12 == c.get("z")
+    assert 0 == COUNT["double"] == COUNT["total"]
+    # Task depending on "scenario" is computed
+    assert 12 == c.get("w")
+    assert 1 == COUNT["total"]
+
+    # Different input data → results are not used
+    COUNT.clear()
+    c = computer([1, 2])
+    assert 0 == cache_tasks(c, "z", **kw)
+    assert 6 == c.get("z")
+    assert dict(double=1, total=1) == COUNT
+
+    # A different value for a leaf → results are not used
+    assert 0 == cache_tasks(computer(), "z", leaves={"x": "foo"}, **kw)
+
+    # A change to the source of the module of a task callable → results are not used
+    with monkeypatch.context() as m:
+        m.setattr(util_cache, "_module_token", lambda name: f"{name} modified")
+        assert 0 == cache_tasks(computer(), "z", **kw)
+
+    # Least recently used files are evicted
+    assert 4 == len(list(path.glob("*.pkl")))
+    kw.update(max_size=0)
+    cache_tasks(computer(), "z", **kw)
+    assert 0 == len(list(path.glob("*.pkl")))
+
+    # No temporary files remain
+    assert [] == list(path.glob("*.tmp"))
@@ -1,6 +1,6 @@
 import pytest
 
-from message_ix_models.util.genno import append
+from message_ix_models.util.genno import append, get_parallel
 
 
 def test_append() -> None:
@@ -30,3 +30,53 @@ def test_append() -> None:
     c.graph["key"] = object()
     with pytest.raises(TypeError):
         append(c, "key", "baz")
+
+
+def test_get_parallel() -> None:
+    import threading
+
+    from genno import ComputationError, Computer
+
+    c = Computer()
+    c.add("scenario", object())
+    c.add("x", 1)
+
+    threads: dict[str, set] = {"a": set(), "b": set()}
+
+    def a(x: int, i: int) -> int:
+        threads["a"].add(threading.current_thread().name)
+        return x + i
+
+    def b(s: object, value: int) -> int:
+        threads["b"].add(threading.current_thread().name)
+        return 2 * value
+
+    for i in range(8):
+        c.add(f"a{i}", a, "x", i)
+        c.add(f"b{i}", b, "scenario", f"a{i}")
+    c.add("all", [f"b{i}" for i in range(8)])
+
+    # Same result as Computer.get(), in the same order
+    expected = c.get("all")
+    threads["b"].clear()
+    assert expected == get_parallel(c, "all", workers=4)
+
+    # Tasks that depend on "scenario" run in the current thread
+    assert {threading.current_thread().name} == threads["b"]
+
+    # Key that does not depend on "scenario"
+    assert 4 == get_parallel(c, "a3", workers=4)
+
+    # "config" is restored
+    assert {} == c.graph["config"]
+
+    # Without `key`, the default key is used
+    with pytest.raises(ValueError, match="no default key"):
+        get_parallel(c, workers=4)
+    c.default_key = "a3"
+    assert 4 == get_parallel(c, workers=4)
+
+    # Exceptions are wrapped as from Computer.get()
+    c.add("a0", a, "x")
+    with pytest.raises(ComputationError):
+        get_parallel(c, "all", workers=4)
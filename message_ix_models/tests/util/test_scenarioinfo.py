@@ -173,6 +173,45 @@ class TestScenarioInfo:
         assert 1963 == info.y0
         assert [1963, 1964, 1965] == info.Y
 
+    def test_cache(self, tmp_path, test_context) -> None:
+        """ScenarioInfo can be stored in and loaded from a local cache."""
+        mp = test_context.get_platform()
+        scenario = make_dantzig(mp, multi_year=True)
+        info = ScenarioInfo(scenario)
+        url = f"ixmp://{mp.name}/{scenario.url}"
+
+        # Not cached yet
+        with pytest.raises(FileNotFoundError):
+            ScenarioInfo.from_cache(url, tmp_path)
+
+        # Store to the cache
+        path = info.to_cache(tmp_path)
+        assert path.joinpath("info.json").exists()
+
+        # Load from the cache
+        result = ScenarioInfo.from_cache(url, tmp_path)
+
+        assert dict(info) == dict(result)
+        assert mp.name == result.platform_name
+        assert (info.y0, info.Y, info.N) == (result.y0, result.Y, result.N)
+        assert info.is_message_macro == result.is_message_macro
+        assert set(info.set) == set(result.set)
+        for name, value in info.set.items():
+            if isinstance(value, pd.DataFrame):
+                assert_frame_equal(value, result.set[name])
+            else:
+                assert value == result.set[name]
+        assert_frame_equal(info.yv_ya, result.yv_ya)
+        assert_frame_equal(info.par["duration_period"], result.par["duration_period"])
+
+        # Default cache location
+        info.to_cache()
+        assert info.N == ScenarioInfo.from_cache(url).N
+
+        # Version is required
+        with pytest.raises(ValueError, match="without version"):
+            ScenarioInfo.from_cache(f"ixmp://{mp.name}/m/s")
+
     def test_from_url(self):
         si = ScenarioInfo.from_url("m/s#123")
         assert "m" == si.model
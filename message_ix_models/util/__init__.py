@@ -1,14 +1,23 @@
 import logging
 from collections import ChainMap, defaultdict
-from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 from datetime import datetime
 from functools import partial, singledispatch
 from hashlib import blake2s
 from itertools import count
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import message_ix
+import numpy as np
 import pandas as pd
 import pint
 
@@ -57,12 +66,14 @@ __all__ = [
     "broadcast",
     "cached",
     "check_support",
+    "compact",
     "convert_units",
     "copy_column",
     "datetime_now_with_tz",
     "eval_anno",
     "ffill",
     "identify_nodes",
+    "iter_broadcast",
     "iter_keys",
     "load_package_data",
     "load_private_data",
@@ -91,18 +102,34 @@ log = logging.getLogger(__name__)
 
 
 def add_par_data(
-    scenario: message_ix.Scenario, data: "ParameterData", dry_run: bool = False
+    scenario: message_ix.Scenario,
+    data: "ParameterData | Mapping[str, Iterable[pd.DataFrame]]",
+    dry_run: bool = False,
+    *,
+    chunksize: int | None = None,
 ) -> int:
     """Add `data` to `scenario`.
 
+    If `scenario` is not already checked out, it is checked out, and all of `data` is
+    committed at once. If any error occurs, these changes are discarded.
+
     Parameters
     ----------
     data
         Any mapping with keys that are valid :mod:`message_ix` parameter names, and
-        values that are pd.DataFrame or other arguments valid for
-        :meth:`message_ix.Scenario.add_par`.
+        values that are either :class:`pandas.DataFrame`, or iterables of data frames
+        (for instance, from :func:`iter_broadcast`). The latter are consumed and added
+        one at a time, without constructing the full data for the parameter.
     dry_run : optional
         Only show what would be done.
+    chunksize : optional
+        If given, add data in pieces of at most this many rows. This reduces the peak
+        memory used to convert data for :meth:`message_ix.Scenario.add_par`.
+
+    Returns
+    -------
+    int
+        Total number of rows in `data`.
 
     See also
     --------
@@ -110,29 +137,106 @@ def add_par_data(
     """
     # TODO optionally add units automatically
     # TODO allow units column entries to be pint.Unit objects
+    from ixmp.util import maybe_check_out, maybe_commit
+
+    checked_out = False if dry_run else maybe_check_out(scenario)
 
     total = 0
+    t0 = perf_counter()
 
-    for par_name, values in data.items():
-        N = values.shape[0]
-        log.info(f"{N} rows in {repr(par_name)}")
-        log.debug("\n" + values.to_string(max_rows=5))
+    try:
+        for par_name, values in data.items():
+            total += _add_par_chunks(scenario, par_name, values, dry_run, chunksize)
+    except Exception:
+        if checked_out:
+            scenario.discard_changes()
+        raise
 
-        total += N
+    if not dry_run:
+        log.info(f"Added {total} rows; {_rate(total, t0)}")
+
+    maybe_commit(scenario, checked_out, f"Add {total} rows of parameter data")
+
+    return total
+
+
+def _add_par_chunks(
+    scenario: message_ix.Scenario,
+    name: str,
+    values: pd.DataFrame | Iterable[pd.DataFrame],
+    dry_run: bool,
+    chunksize: int | None,
+) -> int:
+    """Add `values` for parameter `name` to `scenario`; return the number of rows."""
+    if isinstance(values, pd.DataFrame):
+        # Number of rows is known in advance
+        log.info(f"{len(values)} rows in {repr(name)}")
+        chunks: Iterable[pd.DataFrame] = [values]
+    else:
+        chunks = values
+
+    # Only format data for log messages if they will be shown
+    debug = log.isEnabledFor(logging.DEBUG)
+
+    N = 0
+    t0 = perf_counter()
+    for i, chunk in enumerate(_iter_chunks(chunks, chunksize)):
+        if debug and i == 0:
+            log.debug("\n" + chunk.to_string(max_rows=5))
+
+        N += len(chunk)
 
         if dry_run:
             continue
 
-        # Work around iiasa/ixmp#425
-        values["unit"] = values["unit"].str.replace("^$", "-", regex=True)
-
         try:
-            scenario.add_par(par_name, values)
+            scenario.add_par(name, _fill_empty_unit(chunk))
         except Exception:  # pragma: no cover
-            print(values.head())
+            print(chunk.head())
             raise
 
-    return total
+        if chunksize is not None:
+            log.info(f"  {N} rows; {_rate(N, t0)}")
+
+    if not isinstance(values, pd.DataFrame):
+        log.info(f"{N} rows in {repr(name)}")
+    elif debug and not dry_run:
+        log.debug(f"  {_rate(N, t0)}")
+
+    return N
+
+
+def _fill_empty_unit(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace empty strings in the "unit" column of `df` with "-".
+
+    This works around `iiasa/ixmp#425 <https://github.com/iiasa/ixmp/issues/425>`_.
+    """
+    unit = df["unit"]
+    empty = unit == ""
+    if not empty.any():
+        return df
+    elif isinstance(unit.dtype, pd.CategoricalDtype) and "-" not in unit.cat.categories:
+        # Preserve the categorical dtype
+        unit = unit.cat.add_categories(["-"])
+    return df.assign(unit=unit.mask(empty, "-"))
+
+
+def _iter_chunks(
+    chunks: Iterable[pd.DataFrame], chunksize: int | None
+) -> Iterator[pd.DataFrame]:
+    """Iterate over `chunks`, splitting any longer than `chunksize` rows."""
+    for chunk in chunks:
+        if chunksize is None or len(chunk) <= chunksize:
+            yield chunk
+        else:
+            for start in range(0, len(chunk), chunksize):
+                yield chunk.iloc[start : start + chunksize]
+
+
+def _rate(N: int, start: float) -> str:
+    """Format the rate of processing `N` rows since `start`."""
+    t = perf_counter() - start
+    return f"{t:.1f} s, {N / t if t else 0:.0f} rows/s"
 
 
 def aggregate_codes(df: pd.DataFrame, dim: str, codes):  # pragma: no cover
@@ -162,6 +266,11 @@ def broadcast(
     :func:`broadcast` returns one copy for each element in the cartesian product of the
     dimension labels given by `kwargs`.
 
+    The result is allocated once, by computing for every row the positions in `df`,
+    `labels`, and each of `kwargs` from which to take values. Categorical (or other)
+    dtypes of `df`, `labels`, and `kwargs` values are preserved. To produce the same
+    result in pieces, without allocating the whole, use :func:`iter_broadcast`.
+
     Parameters
     ----------
     labels : pandas.DataFrame
@@ -201,6 +310,18 @@ def broadcast(
     6   m1   node B          t    1.1
     7   m1   node B          t    2.2
     """
+    factors, columns = _broadcast_factors(df, labels, kwargs)
+    return _broadcast_rows(df, factors, columns, 0, _broadcast_len(df, factors))
+
+
+def _broadcast_factors(
+    df: pd.DataFrame, labels: pd.DataFrame | None, kwargs: Mapping
+) -> tuple[list[pd.DataFrame], list]:
+    """Check arguments to :func:`broadcast`.
+
+    Returns a list with 1 data frame of labels for each factor of the product, and the
+    columns of the result.
+    """
 
     def _check_dim(d):
         try:
@@ -209,20 +330,27 @@ def broadcast(
         except KeyError:
             raise ValueError(f"Dimension {d} not among {list(df.columns)}")
 
+    factors = []
+
+    # If any columns of `df` are categorical, also convert the labels
+    maybe_compact = (
+        compact
+        if any(isinstance(dt, pd.CategoricalDtype) for dt in df.dtypes)
+        else lambda x: x
+    )
+
     # Broadcast using matched labels for 1+ dimensions from a data frame
     if labels is not None:
         # Check the dimensions
         for dim in labels.columns:
             _check_dim(dim)
-        # Concatenate 1 copy of `df` for each row in `labels`
-        df = pd.concat(
-            [df.assign(**row) for _, row in labels.iterrows()],
-            ignore_index=True,
-            sort=False,
-        )
+        factors.append(maybe_compact(labels.reset_index(drop=True)))
 
     # Next, broadcast other dimensions given as keyword arguments
+    kw_dims: list = []
     for dim, levels in kwargs.items():
+        if labels is not None and dim in labels.columns:
+            raise ValueError(f"Dimension {dim} was not empty\n\n{df.head()}")
         _check_dim(dim)
         if len(levels) == 0:
             log.debug(
@@ -230,17 +358,41 @@ def broadcast(
             )
             continue
 
-        # - Duplicate the data
-        # - Drop the existing column named 'dim'
-        # - Re-add the column from the constructed MultiIndex
-        # - Reindex for sequential row numbers
-        df = (
-            pd.concat([df] * len(levels), keys=levels, names=[dim], sort=False)
-            .drop(dim, axis=1)
-            .reset_index(dim)
-            .reset_index(drop=True)
+        if not isinstance(levels, (pd.Series, pd.Index, pd.Categorical, np.ndarray)):
+            levels = list(levels)
+        factors.append(
+            maybe_compact(pd.DataFrame({dim: pd.Series(levels).reset_index(drop=True)}))
         )
-    return df
+        kw_dims.insert(0, dim)
+
+    # Dimensions from `kwargs` first, most recent first; then others
+    return factors, kw_dims + [c for c in df.columns if c not in kw_dims]
+
+
+def _broadcast_len(df: pd.DataFrame, factors: list[pd.DataFrame]) -> int:
+    """Length of the result of :func:`broadcast`."""
+    return len(df) * int(np.prod([len(f) for f in factors]))
+
+
+def _broadcast_rows(
+    df: pd.DataFrame, factors: list[pd.DataFrame], columns: list, start: int, stop: int
+) -> pd.DataFrame:
+    """Return rows `start` to `stop` of the result of :func:`broadcast`.
+
+    Row `i` of the result contains row ``i % len(df)`` of `df`; the labels in the first
+    of `factors` at ``(i // len(df)) % len(factors[0])``; and so on.
+    """
+    i = np.arange(start, stop)
+    stride = max(len(df), 1)
+
+    result = df.take(i % stride).reset_index(drop=True)
+    for f in factors:
+        values = f.take((i // stride) % len(f)).reset_index(drop=True)
+        for dim in f.columns:
+            result[dim] = values[dim]
+        stride *= len(f)
+
+    return result[columns].set_axis(pd.RangeIndex(start, stop))
 
 
 def check_support(context, settings=dict(), desc: str = "") -> None:
@@ -267,6 +419,135 @@ def check_support(context, settings=dict(), desc: str = "") -> None:
             )
 
 
+#: Sets for which :func:`compact` initializes categories from :func:`.get_codes`.
+COMPACT_CODELISTS = ("commodity", "emission", "level", "technology")
+
+#: Shared :class:`pandas.CategoricalDtype` for each set, used by :func:`compact`.
+_CATEGORIES: dict[str, pd.CategoricalDtype] = {}
+
+
+def _compact_set(dim: str) -> str | None:
+    """Return the name of the set indexing `dim`, or :any:`None` to not compact."""
+    if dim in {"comment", "value"} or dim.startswith("year"):
+        return None
+    elif dim.startswith(("node_", "time_")):
+        return dim.split("_")[0]
+    return dim
+
+
+def _compact_dtype(name: str, values) -> pd.CategoricalDtype:
+    """Return the shared categorical dtype for set `name`, including all `values`.
+
+    If any of `values` are not among the existing categories, they are appended and the
+    extended dtype replaces the shared one.
+    """
+    try:
+        dtype = _CATEGORIES[name]
+    except KeyError:
+        categories: list[str] = []
+        if name in COMPACT_CODELISTS:
+            from message_ix_models.model.structure import get_codes
+
+            categories = [c.id for c in get_codes(name)]
+        dtype = pd.CategoricalDtype(categories)
+
+    new = pd.Index(pd.unique(np.asarray(values, dtype=object))).dropna()
+    new = new[~new.isin(dtype.categories)]
+    if len(new):
+        dtype = pd.CategoricalDtype(dtype.categories.append(new))
+
+    _CATEGORIES[name] = dtype
+    return dtype
+
+
+@singledispatch
+def compact(data: pd.DataFrame) -> pd.DataFrame:
+    """Convert string columns of `data` to compact, categorical dtypes.
+
+    Columns for MESSAGE dimensions such as "node_loc", "technology", "commodity",
+    "level", "mode", and "unit" are converted to :class:`pandas.CategoricalDtype`. The
+    categories are shared by all data frames processed in the same Python session, and
+    by all dimensions indexed by the same set: for instance, "node_loc" and "node_dest".
+    For the sets in :data:`COMPACT_CODELISTS`, the categories include all codes from
+    :func:`.get_codes`. Columns that are entirely empty, and "year_*" and "value"
+    columns, are not changed.
+
+    Because categories are shared, the results can be concatenated by
+    :func:`merge_data` and passed to :func:`add_par_data` while retaining the
+    categorical dtypes. :func:`broadcast` also preserves them.
+
+    :func:`make_io`, :func:`make_matched_dfs`, and :func:`make_source_tech` apply
+    :func:`compact` to their results if called with :py:`compact=True`. For data from
+    :func:`message_ix.make_df`, use :meth:`pandas.DataFrame.pipe`:
+
+    >>> make_df("output", technology="t", value=1.0).pipe(compact)
+    """
+    dtypes = {}
+    for column, dtype in data.dtypes.items():
+        name = _compact_set(str(column))
+        if name is None or not (
+            pd.api.types.is_object_dtype(dtype)
+            or isinstance(dtype, pd.CategoricalDtype)
+        ):
+            continue
+        elif data[column].isna().all():
+            continue
+        dtypes[column] = _compact_dtype(name, data[column])
+
+    return data.astype(dtypes) if dtypes else data
+
+
+@compact.register(dict)
+def _(data: "MutableParameterData") -> "MutableParameterData":
+    for key, df in data.items():
+        data[key] = compact(df)
+    return data
+
+
+#: Alias for use in functions with a `compact` argument.
+_compact = compact
+
+
+def _concat(dfs: Iterable[pd.DataFrame | None], **kwargs) -> pd.DataFrame:
+    """:func:`pandas.concat` that preserves categorical columns.
+
+    :func:`pandas.concat` returns :class:`object` dtype for any column that has
+    different categories in different `dfs`. Here, those columns are first converted to
+    a common dtype with the union of the categories.
+    """
+    _dfs = [df for df in dfs if df is not None]
+
+    # Categories for each categorical column in any of `dfs`
+    categories: dict[Any, list[pd.Index]] = defaultdict(list)
+    for df in _dfs:
+        for column, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                categories[column].append(dtype.categories)
+
+    for column, c in categories.items():
+        union = c[0].append(c[1:]).unique() if len(c) > 1 else c[0]
+        # Also include values from `dfs` in which `column` is not categorical
+        values = [
+            df[column]
+            for df in _dfs
+            if column in df.columns
+            and not isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+        if values:
+            new = pd.Index(pd.unique(pd.concat(values).to_numpy(dtype=object)))
+            new = new.dropna()
+            union = union.append(new[~new.isin(union)])
+        dtype = pd.CategoricalDtype(union)
+        _dfs = [
+            df.astype({column: dtype})
+            if column in df.columns and df[column].dtype != dtype
+            else df
+            for df in _dfs
+        ]
+
+    return pd.concat(_dfs, **kwargs)
+
+
 def copy_column(column_name):
     """For use with :meth:`pandas.DataFrame.assign`.
 
@@ -369,11 +650,38 @@ def iter_keys(base: "genno.Key") -> KeyIterator:
     return partial(next, map(lambda i: base + str(i), count()))
 
 
+def iter_broadcast(
+    df: pd.DataFrame,
+    labels: pd.DataFrame | None = None,
+    *,
+    chunksize: int = 1_000_000,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over pieces of the result of :func:`broadcast`.
+
+    Use this for cartesian products that are too large to hold in memory at once.
+    Concatenating the pieces gives the same result as :func:`broadcast`.
+
+    Parameters
+    ----------
+    chunksize :
+        Maximum number of rows in each piece.
+    labels, kwargs :
+        Passed to :func:`broadcast`.
+    """
+    factors, columns = _broadcast_factors(df, labels, kwargs)
+    N = _broadcast_len(df, factors)
+    for start in range(0, N, chunksize):
+        yield _broadcast_rows(df, factors, columns, start, min(start + chunksize, N))
+
+
 def make_io(
     src: tuple[str, str, str],
     dest: tuple[str, str, str],
     efficiency: float,
     on: Literal["input", "output"] = "input",
+    *,
+    compact: bool = False,
     **kwargs,
 ):
     """Return input and output data frames for a 1-to-1 technology.
@@ -389,6 +697,8 @@ def make_io(
     on : 'input' or 'output'
         If 'input', `efficiency` applies to the input, and the output, thus the activity
         level of the technology, is in dest[2] units. If 'output', the opposite.
+    compact : bool, optional
+        If :any:`True`, apply :func:`.compact` to the results.
     kwargs
         Passed to :func:`.make_df`.
 
@@ -397,7 +707,7 @@ def make_io(
     dict (str -> pd.DataFrame)
         Keys are 'input' and 'output'; values are data frames.
     """
-    return dict(
+    result = dict(
         input=message_ix.make_df(
             "input",
             commodity=src[0],
@@ -415,10 +725,13 @@ def make_io(
             **kwargs,
         ),
     )
+    return _compact(result) if compact else result
 
 
 def make_matched_dfs(
     base: MutableMapping | pd.DataFrame,
+    *,
+    compact: bool = False,
     **par_value: float | pint.Quantity | dict,
 ) -> "MutableParameterData":
     """Return data frames derived from `base` for multiple parameters.
@@ -435,6 +748,9 @@ def make_matched_dfs(
         :class:`float`, it overwrites the "value" column; if :class:`pint.Quantity`, its
         magnitude overwrites "value" and its units the "units" column, as a formatted
         string.
+    compact : bool, optional
+        If :any:`True`, apply :func:`.compact` to the results. Categorical columns in
+        `base` are preserved in any case.
 
     Returns
     -------
@@ -470,11 +786,15 @@ def make_matched_dfs(
         result[par] = (
             message_ix.make_df(par, **data).drop_duplicates().reset_index(drop=True)
         )
-    return result
+    return _compact(result) if compact else result
 
 
 def make_source_tech(
-    info: message_ix.Scenario | ScenarioInfo, common, **values
+    info: message_ix.Scenario | ScenarioInfo,
+    common,
+    *,
+    compact: bool = False,
+    **values,
 ) -> "MutableParameterData":
     """Return parameter data for a ‘source’ technology.
 
@@ -487,6 +807,8 @@ def make_source_tech(
     info : .Scenario or .ScenarioInfo
     common : dict
         Passed to :func:`.make_df`.
+    compact : bool, optional
+        If :any:`True`, apply :func:`.compact` to the results.
     **values
         Values for 'capacity_factor' (optional; default 1.0), 'output', 'var_cost', and
         optionally 'technical_lifetime'.
@@ -508,20 +830,17 @@ def make_source_tech(
         log.debug("No technical_lifetime for source technology")
 
     # Create data for "output"
+    output = message_ix.make_df(
+        "output", value=values.pop("output"), year_act=info.Y, year_vtg=info.Y, **common
+    )
     result = dict(
-        output=message_ix.make_df(
-            "output",
-            value=values.pop("output"),
-            year_act=info.Y,
-            year_vtg=info.Y,
-            **common,
-        )
+        output=(_compact(output) if compact else output)
         .pipe(broadcast, node_loc=nodes_ex_world(info.N))
         .pipe(same_node)
     )
 
     # Add data for other parameters
-    result.update(make_matched_dfs(base=result["output"], **values))
+    result.update(make_matched_dfs(base=result["output"], compact=compact, **values))
 
     return result
 
@@ -538,15 +857,105 @@ def maybe_query(series: pd.Series, query: str | None) -> pd.Series:
     return series if query is None else series.to_frame().query(query)[0]
 
 
-def merge_data(base: "MutableParameterData", *others: "ParameterData") -> None:
+def merge_data(
+    base: "MutableParameterData",
+    *others: "ParameterData",
+    on_duplicate: Literal["first", "last", "sum", "error"] | None = None,
+) -> None:
     """Merge dictionaries of DataFrames together into `base`.
 
+    For each parameter, the data from `base` and all of `others` are concatenated once.
+
     For use with :mod:`genno`, see instead :func:`.report.operator.merge_data` that
     *returns* the merged data rather than updating the first argument.
+
+    Parameters
+    ----------
+    on_duplicate : optional
+        How to handle rows with the same key—that is, the same labels for each
+        dimension of the parameter, for instance the columns of :func:`.make_df`
+        excluding "value" and "unit". If :any:`None` (the default), all rows are kept.
+        Otherwise, rows that are exact duplicates are dropped, and for rows with the
+        same key but a different value or unit ("conflicts"):
+
+        - "first": keep the first row, in the order `base`, then `others`.
+        - "last": keep the last row.
+        - "sum": sum the values. Units must be the same.
+        - "error": raise :class:`ValueError`.
+
+    Raises
+    ------
+    ValueError
+        if `on_duplicate` is not one of the values above; if it is given and the data
+        for a MESSAGE or MACRO parameter lack any of its dimensions; if it is "error"
+        and there are conflicts; or if it is "sum" and there are conflicting units.
     """
+    if on_duplicate not in (None, "first", "last", "sum", "error"):
+        raise ValueError(f"on_duplicate={on_duplicate!r}")
+
+    # Collect all data for each parameter
+    data: dict[str, list[pd.DataFrame]] = defaultdict(list)
     for other in others:
         for par, df in other.items():
-            base[par] = pd.concat([base.get(par, None), df])
+            data[par].append(df)
+
+    for par, dfs in data.items():
+        df = _concat([base.get(par, None)] + dfs)
+        base[par] = (
+            df
+            if on_duplicate is None
+            else _deduplicate(par, df.reset_index(drop=True), on_duplicate)
+        )
+
+
+def _deduplicate(par: str, df: pd.DataFrame, on_duplicate: str) -> pd.DataFrame:
+    """Handle rows in `df` with duplicate keys for parameter `par`.
+
+    See :func:`merge_data`.
+    """
+    from message_ix.models import MACRO, MESSAGE
+
+    # Columns that form the key
+    try:
+        info = ChainMap(MESSAGE.items, MACRO.items)[par]
+    except KeyError:
+        dims = [c for c in df.columns if c not in ("unit", "value")]
+    else:
+        dims = list(info.dims or info.coords)
+        if missing := [d for d in dims if d not in df.columns]:
+            raise ValueError(f"Data for {par!r} missing key column(s) {missing}")
+    attrs = [c for c in ("unit", "value") if c in df.columns]
+
+    if not df.duplicated(subset=dims, keep=False).any():
+        return df  # No duplicate keys
+
+    # Drop exact duplicates, then identify rows with the same key
+    df = df.drop_duplicates(subset=dims + attrs).reset_index(drop=True)
+    conflict = df.duplicated(subset=dims, keep=False)
+    N = conflict.sum()
+
+    if N:
+        log.info(f"{N} rows in {par!r} with conflicting {'/'.join(attrs)}")
+
+    if N == 0:
+        return df
+    elif on_duplicate == "error":
+        raise ValueError(
+            f"{N} rows in {par!r} with conflicting {'/'.join(attrs)}:\n"
+            + df[conflict].sort_values(dims).to_string(max_rows=10)
+        )
+    elif on_duplicate in ("first", "last"):
+        return df.drop_duplicates(subset=dims, keep=on_duplicate).reset_index(drop=True)
+
+    # Sum values
+    if "unit" in attrs and df.duplicated(subset=dims + ["unit"], keep=False).sum() < N:
+        raise ValueError(f"Cannot sum {par!r} with conflicting units")
+    grouped = df.groupby(dims, dropna=False, observed=True, sort=False)
+    return (
+        grouped.agg({c: "sum" if c == "value" else "first" for c in attrs})
+        .reset_index()
+        .astype(df.dtypes.to_dict())[df.columns]
+    )
 
 
 def path_fallback(
@@ -810,7 +1219,7 @@ def show_versions() -> str:
 def strip_par_data(  # noqa: C901
     scenario: message_ix.Scenario,
     set_name: str,
-    element: str,
+    element: str | Sequence[str],
     dry_run: bool = False,
     dump: "MutableParameterData | None" = None,
 ) -> int:
@@ -818,6 +1227,14 @@ def strip_par_data(  # noqa: C901
 
     Parameters
     ----------
+    element : str or sequence of str
+        Element(s) to remove. If a sequence, each parameter indexed by `set_name` is
+        read at most once; rows containing any of the elements in any dimension indexed
+        by `set_name` are selected using :meth:`pandas.Series.isin` and removed with a
+        single call to :meth:`~.ixmp.Scenario.remove_par`. Then all the elements are
+        removed from `set_name` with a single call to
+        :meth:`~.ixmp.Scenario.remove_set`. This is much faster than calling
+        :func:`strip_par_data` once per element.
     dry_run : bool, optional
         If :data:`True`, only show what would be done.
     dump : dict, optional
@@ -833,6 +1250,9 @@ def strip_par_data(  # noqa: C901
     --------
     add_par_data
     """
+    if not isinstance(element, str):
+        return _strip_par_data_multi(scenario, set_name, element, dry_run, dump)
+
     par_list = scenario.par_list()
     no_data = set()  # Names of parameters with no data being stripped
     total = 0  # Total observations stripped
@@ -907,3 +1327,71 @@ def strip_par_data(  # noqa: C901
                 raise
 
     return total
+
+
+def _strip_par_data_multi(
+    scenario: message_ix.Scenario,
+    set_name: str,
+    elements: Sequence[str],
+    dry_run: bool,
+    dump: "MutableParameterData | None",
+) -> int:
+    """:func:`strip_par_data` for a sequence of `elements`."""
+    elements = list(map(str, elements))
+    if not elements:
+        return 0  # Nothing to do; avoid retrieving data with an empty filter
+
+    total = 0  # Total observations stripped
+
+    if dump is None:
+        pars: Iterable[str] = []  # Don't iterate over parameters unless dumping
+    else:
+        log.info(
+            f"Remove data with {set_name} in {elements!r}"
+            + (" (DRY RUN)" if dry_run else "")
+        )
+        # Iterate over parameters with ≥1 dimensions indexed by `set_name`
+        pars = set(scenario.items(indexed_by=set_name, par_data=False)) & set(
+            scenario.par_list()
+        )
+
+    for par_name in sorted(pars):
+        # Dimensions of `par_name` indexed by `set_name`
+        dims = [
+            dim
+            for dim, s in zip(scenario.idx_names(par_name), scenario.idx_sets(par_name))
+            if s == set_name
+        ]
+
+        # Read the parameter data once. If only 1 dimension is indexed by `set_name`,
+        # filter on the backend.
+        par_data = scenario.par(
+            par_name, filters={dims[0]: elements} if len(dims) == 1 else None
+        )
+        if len(dims) > 1:
+            # Select rows with any of `elements` in any of `dims`
+            par_data = par_data[par_data[dims].isin(elements).any(axis=1)]
+
+        if 0 == (N := len(par_data)):
+            continue
+
+        total += N
+        if dump is not None:
+            dump[par_name] = pd.concat([dump.get(par_name, None), par_data])
+        log.info(f"  {N} rows in {par_name!r}")
+
+        if not dry_run:
+            scenario.remove_par(par_name, key=par_data)
+
+    if dump is not None:
+        log.info(f"  {total} rows total")
+
+    if not dry_run:
+        # Remove only existing elements
+        existing = set(map(str, scenario.set(set_name)))
+        to_remove = [e for e in elements if e in existing]
+        log.info(f"Remove {len(to_remove)} element(s) from set {set_name!r}")
+        if to_remove:
+            scenario.remove_set(set_name, to_remove)
+
+    return total
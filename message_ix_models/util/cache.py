@@ -8,20 +8,33 @@ included in the computed cache key:
   string representation / ID.
 - :class:`ixmp.Platform`, :class:`xarray.Dataset`: ignored, with a warning logged.
 - :class:`.ScenarioInfo`: only the :attr:`~ScenarioInfo.set` entries are hashed.
+
+It also provides :func:`cache_tasks`, to cache the results of individual tasks in a
+:class:`genno.Computer`.
 """
 
 import json
 import logging
-from collections.abc import Callable
+import os
+import pickle
+import sys
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import is_dataclass
 from enum import Enum
-from types import FunctionType
+from functools import cache, partial
+from hashlib import blake2b
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from types import FunctionType, MethodType
+from typing import TYPE_CHECKING, Any
 
 import genno.caching
 import ixmp
+import pandas as pd
 import sdmx.model
 import xarray as xr
-from genno import Computer
+from genno import Computer, Key
 
 from message_ix_models.types import AnyQuantity
 
@@ -29,6 +42,9 @@ from ._dataclasses import asdict
 from .context import Context
 from .scenarioinfo import ScenarioInfo
 
+if TYPE_CHECKING:
+    from genno.types import KeyLike
+
 log = logging.getLogger(__name__)
 
 # Computer to store the config used by the decorator. See .util.config.Config.cache_path
@@ -121,3 +137,299 @@ def cached(func: Callable) -> Callable:
         )
 
     return cached_load
+
+
+class _Uncacheable(Exception):
+    """Raised by :func:`_token` for values that do not have a reliable hash."""
+
+
+def _path_token(path: Path) -> list:
+    """Token for `path`: its name, plus modification time and size, if it exists."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return [str(path), None, None]
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _data_token(obj: "pd.DataFrame | pd.Series | xr.DataArray") -> list:
+    """Token for pandas or xarray data, including :class:`genno.Quantity`."""
+    units = str(getattr(obj, "units", ""))
+    if isinstance(obj, xr.DataArray):
+        obj = obj.to_series()
+    labels = obj.columns if isinstance(obj, pd.DataFrame) else [obj.name]
+    values = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    return [
+        type(obj).__name__,
+        list(map(str, labels)),
+        list(map(str, obj.index.names)),
+        units,
+        blake2b(values.tobytes(), digest_size=20).hexdigest(),
+    ]
+
+
+@cache
+def _module_token(name: str) -> str | None:
+    """Token for the module `name`: a hash of the contents of its source file."""
+    try:
+        data = Path(sys.modules[name].__file__ or "").read_bytes()
+    except (AttributeError, KeyError, OSError):
+        return None
+    return blake2b(data, digest_size=20).hexdigest()
+
+
+def _func_token(func: Callable, digest: Mapping) -> Any:
+    """Token for the callable `func` of a task."""
+    if isinstance(func, partial):  # Includes genno.Operator
+        return [
+            _func_token(func.func, digest),
+            _token(list(func.args), digest),
+            _token(func.keywords, digest),
+        ]
+    elif isinstance(func, MethodType):
+        # Bound method, e.g. ExoDataSource.get: also the attributes of the instance
+        return [
+            _func_token(func.__func__, digest),
+            _token(getattr(func.__self__, "__dict__", func.__self__), digest),
+        ]
+
+    name = f"{func.__module__}.{getattr(func, '__qualname__', type(func).__name__)}"
+    if code := getattr(func, "__code__", None):
+        # Function or lambda: also the source of its module, its bytecode, and the
+        # values of any closure variables
+        closure = [c.cell_contents for c in getattr(func, "__closure__", None) or ()]
+        return [
+            name,
+            _module_token(func.__module__),
+            genno.caching.Encoder().default(code),
+            _token(closure, digest),
+        ]
+    elif isinstance(func, type) or not hasattr(func, "__dict__"):
+        return name  # Class or built-in function
+    else:
+        # Other callable instance
+        return [_func_token(type(func).__call__, digest), _token(vars(func), digest)]
+
+
+def _token(obj: Any, digest: Mapping) -> Any:
+    """Return a JSON-serializable token for `obj`, an item in a :mod:`dask` graph.
+
+    References to other keys are replaced with their entries in `digest`.
+
+    Raises
+    ------
+    _Uncacheable
+        if `obj` is or refers to a key with no digest, or to a :class:`ixmp.TimeSeries`.
+    """
+    from dask.core import istask, literal
+
+    try:
+        is_key = obj in digest
+    except TypeError:  # Unhashable
+        is_key = False
+
+    if is_key:
+        if digest[obj] is None:
+            raise _Uncacheable(obj)
+        return ["key", digest[obj]]
+    elif istask(obj):
+        if isinstance(obj[0], literal):
+            return ["literal", _token(obj[0].data, digest)]
+        return [_func_token(obj[0], digest)] + [_token(a, digest) for a in obj[1:]]
+    elif isinstance(obj, (list, tuple)):
+        return [_token(item, digest) for item in obj]
+    elif isinstance(obj, dict):
+        return [[repr(k), _token(v, digest)] for k, v in obj.items()]
+    else:
+        return _literal_token(obj, digest)
+
+
+def _literal_token(obj: Any, digest: Mapping) -> Any:
+    """Token for `obj`, a literal value in a :mod:`dask` graph."""
+    if isinstance(obj, (FunctionType, MethodType, partial)):
+        return _func_token(obj, digest)
+    elif isinstance(obj, Path):
+        return _path_token(obj)
+    elif isinstance(obj, (pd.DataFrame, pd.Series, xr.DataArray)):
+        return _data_token(obj)
+    elif isinstance(obj, Key):
+        return str(obj)
+    elif isinstance(obj, (ixmp.Platform, ixmp.TimeSeries)):
+        raise _Uncacheable(obj)
+    # Other values are encoded by hash_args()
+    return obj
+
+
+def _evict(path: Path, max_size: int, pattern: str = "*.pkl") -> int:
+    """Delete least-recently used files under `path` to limit their size to `max_size`.
+
+    Only files matching `pattern` are considered.
+
+    Returns
+    -------
+    int
+        the number of files deleted.
+    """
+    files = sorted(
+        ((p.stat(), p) for p in path.glob(pattern)), key=lambda sp: sp[0].st_mtime_ns
+    )
+    size = sum(stat.st_size for stat, _ in files)
+
+    N = 0
+    for stat, p in files:
+        if size <= max_size:
+            break
+        p.unlink(missing_ok=True)
+        size -= stat.st_size
+        N += 1
+
+    if N:
+        log.info(f"Evict {N} files from {path}")
+    return N
+
+
+def _load(path: Path) -> Any:
+    """Load a result stored by :class:`_Store`."""
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+class _Store:
+    """Callable wrapping the callable of a task, to store its result for reuse."""
+
+    __slots__ = ("func", "path", "min_time")
+
+    def __init__(self, func: Callable, path: Path, min_time: float) -> None:
+        self.func = func
+        self.path = path
+        self.min_time = min_time
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter()
+        result = self.func(*args, **kwargs)
+
+        # Results of tasks that are performed for their side effects, such as writing
+        # files, are not stored
+        if perf_counter() - start < self.min_time or isinstance(
+            result, (Path, type(None))
+        ):
+            return result
+
+        # Write to a uniquely-named temporary file, then rename, so that other threads
+        # or processes never see a partial file
+        with NamedTemporaryFile(dir=self.path.parent, suffix=".tmp", delete=False) as f:
+            tmp = Path(f.name)
+            try:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except (AttributeError, TypeError, pickle.PicklingError) as e:
+                log.debug(f"Not stored: {e!r}")
+                stored = False
+            else:
+                stored = True
+        if stored:
+            tmp.replace(self.path)
+        else:
+            tmp.unlink(missing_ok=True)
+
+        return result
+
+
+def cache_tasks(
+    c: Computer,
+    *keys: "KeyLike",
+    path: Path,
+    max_size: int,
+    leaves: Mapping[str, Any] = {},
+    exclude: Iterable[str] = ("scenario",),
+    min_time: float = 0.1,
+) -> int:
+    """Cache on disk the results of the tasks in `c` needed to compute `keys`.
+
+    Each task is identified by a hash of:
+
+    - its callable: the fully-qualified name and bytecode of the function, and the
+      contents of the source file of its module; for a :class:`functools.partial` or
+      bound method, also the arguments or instance attributes.
+    - its literal arguments. These are encoded in the same way as arguments to
+      :func:`cached`, except that paths to files also include their modification time
+      and size.
+    - the hashes of the tasks it depends on.
+
+    For the keys in `leaves`, the given value—for instance, a fingerprint of the
+    relevant configuration settings—is hashed instead of the actual task. Tasks that
+    depend, directly or indirectly, on any of `exclude`, or on values that cannot be
+    hashed, are not cached.
+
+    If a file in `path` contains the result for a task, the task is replaced with one
+    that loads the file. Tasks that were only needed to compute this result are then
+    not computed. Otherwise, the result is stored when the task is computed, if it
+    takes at least `min_time` seconds. Before this, the least recently used files in
+    `path` are deleted so that their total size does not exceed `max_size` bytes.
+
+    .. warning:: Changes to functions in *other* modules that are called in turn by
+       the callable of a task are not detected. The version of :mod:`message_ix_models`
+       is hashed with every task, but this does not change with every edit to the code.
+       After changing such functions, delete the files in `path`.
+
+    `leaves` **must** include every setting that may affect the results of tasks. If
+    not, stored results computed with other settings may be used.
+
+    Returns
+    -------
+    int
+        the number of tasks for which stored results are used.
+    """
+    from graphlib import TopologicalSorter
+
+    from dask.core import istask, literal, quote
+    from dask.optimization import cull
+
+    from message_ix_models import __version__
+
+    path.mkdir(parents=True, exist_ok=True)
+    _evict(path, max_size)
+
+    # Protect 'config' dict, as in genno.Computer.get()
+    config = c.graph.get("config", dict())
+    c.graph["config"] = quote(config)
+    try:
+        dsk, deps = cull(c.graph, [str(k) for k in keys])
+    finally:
+        c.graph["config"] = config
+
+    exclude = set(map(str, exclude))
+    leaves = {str(k): v for k, v in leaves.items()}
+
+    # Compute hashes for tasks in dependency order
+    digest: dict[Any, str | None] = dict()
+    for key in TopologicalSorter(deps).static_order():
+        try:
+            if str(key) in exclude:
+                raise _Uncacheable(key)
+            elif str(key) in leaves:
+                token = ["leaf", leaves[str(key)]]
+            else:
+                token = _token(dsk[key], digest)
+            digest[key] = genno.caching.hash_args(__version__, token)
+        except (_Uncacheable, RecursionError, TypeError, ValueError):
+            digest[key] = None
+
+    # Keys in `dsk` are str; replace the tasks at the corresponding keys in `c`
+    keys_c = {str(k): k for k in c.graph}
+
+    N = 0
+    for key, value in dsk.items():
+        h = digest[key]
+        if h is None or not istask(value) or isinstance(value[0], literal):
+            continue  # Not cacheable, or nothing to compute
+        p = path.joinpath(f"{h}.pkl")
+        if p.exists():
+            # Replace the task; mark the file as recently used
+            c.graph[keys_c[str(key)]] = (partial(_load, p),)
+            os.utime(p)
+            N += 1
+        else:
+            c.graph[keys_c[str(key)]] = (_Store(value[0], p, min_time),) + value[1:]
+
+    log.info(f"Use stored results for {N} of {len(dsk)} tasks")
+    return N
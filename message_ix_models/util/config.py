@@ -250,6 +250,11 @@ class Config:
     # Private reference to an ixmp.Platform
     _mp: "ixmp.Platform | None" = None
 
+    #: :any:`True` to skip :class:`.WorkflowStep` that have already been executed with
+    #: identical inputs, and for which the target scenario exists. See
+    #: :meth:`.WorkflowStep.fingerprint`.
+    resume: bool = False
+
     #: Keyword arguments—`model`, `scenario`, and optionally `version`—for the
     #: :class:`ixmp.Scenario` constructor, as given by the :program:`--model`/
     #: :program:`--scenario` or :program:`--url` CLI options.
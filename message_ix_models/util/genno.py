@@ -3,7 +3,7 @@
 Most code appearing here **should** be migrated upstream, to genno itself.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -25,6 +25,7 @@ __all__ = [
     "Collector",
     "Keys",
     "append",
+    "get_parallel",
     "update_computer",
 ]
 
@@ -109,6 +110,86 @@ def append(c: "Computer", key: "KeyLike", *items: Any) -> None:
             raise TypeError(type(c.graph[key]))
 
 
+def get_parallel(
+    c: "Computer",
+    key: "KeyLike | None" = None,
+    *,
+    workers: int,
+    serial: Sequence[str] = ("scenario",),
+) -> Any:
+    """Like :meth:`genno.Computer.get`, but compute independent tasks in parallel.
+
+    The tasks needed for `key` are divided into two parts:
+
+    1. Tasks that do not depend, directly or indirectly, on any of the `serial` keys.
+       These are computed concurrently with :func:`dask.threaded.get`, using up to
+       `workers` threads.
+    2. All other tasks. These are computed afterwards, one at a time, in the current
+       thread, using the results of (1).
+
+    With the default `serial`, tasks that read from or modify a
+    :class:`~message_ix.Scenario` never run concurrently with each other or with other
+    tasks.
+
+    If `workers` is 1 or less, :meth:`~genno.Computer.get` is used directly.
+
+    Raises
+    ------
+    ValueError
+        if `key` is not given and `c` has no :attr:`~genno.Computer.default_key`.
+    genno.ComputationError
+        if any task raises an exception.
+    """
+    from graphlib import TopologicalSorter
+
+    import dask
+    import dask.threaded
+    from dask.core import get_dependencies, literal
+    from genno import ComputationError, quote
+    from genno.compat.dask import cull
+
+    if workers <= 1:
+        return c.get(key)
+
+    if key is None:
+        if c.default_key is None:
+            raise ValueError("no key given and no default key set")
+        key = c.default_key
+    key = c.check_keys(key)[0]
+
+    # Same as genno.Computer.get()
+    c.graph["config"] = quote(c.graph.get("config", dict()))
+    try:
+        dsk, _ = cull(c.graph, key)
+        deps = {k: get_dependencies(dsk, k) for k in dsk}
+
+        # Identify keys that depend on any of the `serial` keys
+        dynamic = set(serial)
+        for k in TopologicalSorter(deps).static_order():
+            if deps.get(k, set()) & dynamic:
+                dynamic.add(k)
+
+        # Inputs to `dynamic` tasks, or `key` itself, that can be computed in parallel
+        targets = sorted(
+            {d for k in dynamic & set(dsk) for d in deps[k]} - dynamic
+            if str(key) in dynamic
+            else {str(key)}
+        )
+        static = {k: v for k, v in dsk.items() if k not in dynamic}
+        values = dask.threaded.get(static, targets, num_workers=workers)
+
+        if str(key) not in dynamic:
+            return values[0]
+
+        # Replace tasks with their results, then compute the remainder in sequence
+        dsk.update({k: (literal(v),) for k, v in zip(targets, values)})
+        return dask.get(cull(dsk, str(key))[0], str(key))
+    except Exception as exc:
+        raise ComputationError(exc) from None
+    finally:
+        c.graph["config"] = c.graph["config"][0].data
+
+
 def update_computer(a: "Computer", b: "Computer") -> None:
     """Update `a` with keys and tasks from `b`.
 
@@ -1,10 +1,12 @@
 """:class:`.ScenarioInfo` class."""
 
+import json
 import logging
 import re
 from collections import defaultdict
 from dataclasses import InitVar, dataclass, field
 from itertools import product
+from numbers import Integral
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -32,6 +34,9 @@ class ScenarioInfo:
     ScenarioInfo objects can also be used (for instance, by :func:`.apply_spec`) to
     describe the contents of a Scenario *before* it is created.
 
+    ScenarioInfo objects can be stored in a local cache with :meth:`to_cache` and
+    retrieved with :meth:`from_cache`, without connecting to a :class:`.Platform`.
+
     ScenarioInfo objects have the following convenience attributes:
 
     .. autosummary::
@@ -95,6 +100,11 @@ class ScenarioInfo:
         if not scenario_obj:
             return
 
+        # `scenario_obj` may be another ScenarioInfo or similar, without .platform
+        if platform := getattr(scenario_obj, "platform", None):
+            self.platform_name = platform.name
+        else:
+            self.platform_name = getattr(scenario_obj, "platform_name", None)
         self.model = scenario_obj.model
         self.scenario = scenario_obj.scenario
         self.version = (
@@ -124,6 +134,50 @@ class ScenarioInfo:
 
         self._yv_ya = scenario_obj.vintage_and_active_years()
 
+    @classmethod
+    def from_cache(cls, url: str, path: "Path | None" = None) -> "ScenarioInfo":
+        """Load an instance stored by :meth:`to_cache`.
+
+        This does not require or open any :class:`.Platform`.
+
+        Parameters
+        ----------
+        url : str
+            Scenario URL including the version, for instance
+            "ixmp://platform/model name/scenario name#123".
+        path : pathlib.Path, optional
+            Base directory of the cache. Default: :file:`scenarioinfo/` within
+            :attr:`.Config.cache_path`.
+
+        Raises
+        ------
+        FileNotFoundError
+            if no instance is cached for `url`.
+        """
+        result = cls.from_url(url)
+        cache_dir = result._cache_dir(path)
+
+        try:
+            meta = json.loads(cache_dir.joinpath("info.json").read_text())
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"No cached ScenarioInfo for {url!r} in {cache_dir}"
+            )
+
+        result.y0 = meta["y0"]
+        result.is_message_macro = meta["is_message_macro"]
+        result.set.update(meta["set"])
+        for kind, name in meta["frames"]:
+            df = pd.read_parquet(cache_dir.joinpath(f"{kind}-{name}.parquet"))
+            if kind == "set":
+                result.set[name] = df
+            elif kind == "par":
+                result.par[name] = df
+            else:
+                result._yv_ya = df
+
+        return result
+
     @classmethod
     def from_path(
         cls, path: "Path", model_pattern: str = ".*", scenario_pattern: str = ".*"
@@ -207,6 +261,73 @@ class ScenarioInfo:
 
         return reduce(lambda s, e: e[0].sub(e[1], s), self._path_re, self.url)
 
+    def _cache_dir(self, path: "Path | None") -> "Path":
+        """Return the cache directory for :meth:`from_cache` and :meth:`to_cache`."""
+        if self.version is None:
+            raise ValueError(f"Cannot cache ScenarioInfo without version: {self.url}")
+
+        if path is None:
+            from .context import Context
+
+            path = Context.get_instance(-1).get_cache_path("scenarioinfo")
+
+        return path.joinpath(self.platform_name or "_", self.path)
+
+    def to_cache(self, path: "Path | None" = None) -> "Path":
+        """Store the instance in a local cache.
+
+        The cache is a directory containing:
+
+        - :file:`info.json` with identifiers, :attr:`y0`, :attr:`is_message_macro`, and
+          the elements of 1-dimensional :attr:`set`. :class:`.Code` elements are stored
+          as their IDs.
+        - one Parquet file for each ≥2-dimensional :attr:`set`; each data frame in
+          :attr:`par`; and :attr:`yv_ya`.
+
+        Any existing cache for the same platform, model, scenario, and version is
+        overwritten.
+
+        Parameters
+        ----------
+        path : pathlib.Path, optional
+            See :meth:`from_cache`.
+
+        Returns
+        -------
+        pathlib.Path
+            The cache directory.
+        """
+        cache_dir = self._cache_dir(path)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        frames: dict[tuple[str, str], pd.DataFrame] = {("yv_ya", "yv_ya"): self.yv_ya}
+        frames.update({("par", k): v for k, v in self.par.items()})
+        sets = dict()
+        for name, value in self.set.items():
+            if isinstance(value, pd.DataFrame):
+                frames[("set", name)] = value
+            else:
+                sets[name] = [
+                    int(v) if isinstance(v, Integral) else str(getattr(v, "id", v))
+                    for v in value
+                ]
+
+        for (kind, name), df in frames.items():
+            df.reset_index(drop=True).to_parquet(
+                cache_dir.joinpath(f"{kind}-{name}.parquet")
+            )
+
+        meta = dict(
+            url=self.url,
+            y0=int(self.y0),
+            is_message_macro=self.is_message_macro,
+            set=sets,
+            frames=list(frames),
+        )
+        cache_dir.joinpath("info.json").write_text(json.dumps(meta))
+
+        return cache_dir
+
     def update(self, other: "ScenarioInfo"):
         """Update with the set elements of `other`."""
         for name, data_list in other.set.items():
@@ -1,15 +1,33 @@
 """Tools for modeling workflows."""
 
+import json
 import logging
+import os
 import re
-from collections.abc import Callable, Mapping
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import partial
+from hashlib import blake2s
+from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Literal, overload
 
+import pandas as pd
 from genno import Computer
 from ixmp.util import parse_url
 
+try:
+    import resource
+except ImportError:  # pragma: no cover — Windows
+    resource = None  # type: ignore [assignment]
+
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from click import Command
+    from ixmp import Platform
     from ixmp.types import PlatformInfo, TimeSeriesIdentifiers
     from message_ix import Scenario
 
@@ -53,6 +71,10 @@ class WorkflowStep:
     #: Keyword arguments passed to :attr:`action`.
     kwargs: dict
 
+    #: Time and memory usage from the most recent execution of the step. See
+    #: :data:`PROFILE_COLUMNS`.
+    profile: dict[str, float]
+
     #: Target platform name and additional options.
     platform_info: "PlatformInfo | dict"
 
@@ -73,11 +95,32 @@ class WorkflowStep:
         self.action = action
         self.clone = clone
         self.kwargs = kwargs
+        self.profile = dict()
 
     def __call__(
         self, context: "Context", scenario: "Scenario | None" = None
     ) -> "Scenario":
-        """Execute the workflow step."""
+        """Execute the workflow step.
+
+        If :attr:`.Config.resume` is :any:`True` and a record exists for the same
+        :meth:`fingerprint`, the step is skipped and the recorded target scenario is
+        returned. Otherwise, after the step completes successfully, a record is written
+        to a file in :file:`{local_data}/workflow/`.
+
+        Time and memory usage are stored in :attr:`profile`.
+        """
+        self.profile = dict.fromkeys(PROFILE_COLUMNS, 0.0)
+        start = _usage()
+        try:
+            return self._execute(context, scenario)
+        finally:
+            end = _usage()
+            self.profile.update({k: end[k] - start[k] for k in ("wall", "cpu")})
+            self.profile.update(
+                {k: v for k, v in end.items() if k.startswith("max_rss")}
+            )
+
+    def _execute(self, context: "Context", scenario: "Scenario | None") -> "Scenario":
         if scenario is None:
             # No base scenario
             if self.action:
@@ -98,6 +141,13 @@ class WorkflowStep:
         if context.dest_scenario:
             log.info(f"  with context.dest_scenario={context.dest_scenario}")
 
+        # Identify a record of a prior execution of the step on the same base
+        fp = self.fingerprint(s) if scenario is not None else None
+        path = context.get_local_path("workflow", f"{fp}.json") if fp else None
+        if path and context.core.resume and (s_prior := _load_prior(path, s)):
+            log.info(f"Skip {self!r}; target exists: {s_prior.url}")
+            return s_prior
+
         if self.clone is not False:
             # Clone to target model/scenario name
             log.info("Clone to {model}/{scenario}".format(**self.scenario_info))
@@ -109,10 +159,11 @@ class WorkflowStep:
                 if isinstance(self.clone, dict)
                 else dict(keep_solution=False)
             )
-            s = s.clone(**clone_kw)
+            with self._timed("clone"):
+                s = s.clone(**clone_kw)
 
         if not self.action:
-            return s
+            return _record(path, s)
 
         log.info(f"Execute {self.action!r}")
 
@@ -121,7 +172,8 @@ class WorkflowStep:
 
         try:
             # Invoke the callback
-            result = self.action(context, s, **self.kwargs)
+            with self._timed("action"), self._timed_solve(s):
+                result = self.action(context, s, **self.kwargs)
         except Exception:  # pragma: no cover
             s.platform.close_db()  # Avoid locking the scenario
             raise
@@ -130,7 +182,78 @@ class WorkflowStep:
             log.info(f"…nothing returned, workflow will continue with {s.url}")
             result = s
 
-        return result
+        return _record(path, result)
+
+    @contextmanager
+    def _timed(self, key: str) -> Iterator[None]:
+        """Add the wall time of the body of the context manager to :attr:`profile`."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.profile[key] += perf_counter() - start
+
+    @contextmanager
+    def _timed_solve(self, scenario: "Scenario") -> Iterator[None]:
+        """Time calls to :meth:`~ixmp.Scenario.solve` on `scenario` by :attr:`action`.
+
+        Only the method of `scenario` itself is wrapped; other instances, including
+        clones made by :attr:`action`, are not affected.
+        """
+        original = scenario.solve
+
+        def solve(*args, **kwargs):
+            with self._timed("solve"):
+                return original(*args, **kwargs)
+
+        scenario.solve = solve  # type: ignore [method-assign]
+        try:
+            yield
+        finally:
+            del scenario.solve
+
+    def fingerprint(self, base: "Scenario") -> str:
+        """Return a fingerprint for executing the step on `base`.
+
+        The fingerprint is a hash of:
+
+        - the fully-qualified name of :attr:`action`,
+        - :attr:`kwargs`, :attr:`clone`, and the target identifiers,
+        - the platform name, URL (including version), and creation date of `base`, and
+        - the version of :mod:`message_ix_models`.
+
+        If any of these differ, the step is executed again, even if
+        :attr:`.Config.resume` is :any:`True`.
+        """
+        from message_ix_models import __version__
+
+        func = self.action.func if isinstance(self.action, partial) else self.action
+        try:
+            cre_date = str(
+                base.platform.scenario_list(
+                    default=False, model=base.model, scen=base.scenario
+                )
+                .query(f"version == {base.version}")["cre_date"]
+                .iloc[0]
+            )
+        except Exception:  # Not supported by the backend
+            cre_date = ""
+
+        data = dict(
+            action=f"{func.__module__}.{func.__qualname__}" if func else "load",
+            kwargs=repr(sorted(self.kwargs.items())),
+            clone=repr(self.clone),
+            target=repr([self.platform_info, self.scenario_info]),
+            base=f"{base.platform.name}/{base.url}",
+            base_cre_date=cre_date,
+            message_ix_models=__version__,
+        )
+        if isinstance(self.action, partial):
+            data.update(
+                args=repr(self.action.args), keywords=repr(self.action.keywords)
+            )
+
+        return blake2s(json.dumps(data, sort_keys=True).encode()).hexdigest()
 
     def __repr__(self):
         action = f"{self.action.__name__}()" if self.action else "load"
@@ -140,6 +263,77 @@ class WorkflowStep:
         return f"<Step {action}{dest}>"
 
 
+#: Contents of :attr:`WorkflowStep.profile` and :attr:`Workflow.profile`:
+#:
+#: - "wall", "cpu": wall and CPU time of the step, in seconds. CPU time includes that
+#:   of subprocesses, for instance GAMS.
+#: - "clone", "action", "solve": wall time spent cloning the base scenario, in
+#:   :attr:`WorkflowStep.action`, and in :meth:`ixmp.Scenario.solve` of the step's
+#:   scenario (as part of the action), in seconds.
+#: - "max_rss", "max_rss_children": peak resident set size of the process executing the
+#:   step, and of its largest subprocess, in MiB, as of the end of the step. These are
+#:   not available on Windows.
+PROFILE_COLUMNS = (
+    "wall",
+    "cpu",
+    "clone",
+    "action",
+    "solve",
+    "max_rss",
+    "max_rss_children",
+)
+
+
+def _usage() -> dict[str, float]:
+    """Return current time and memory usage of the process and its children."""
+    t = os.times()
+    result = dict(
+        wall=perf_counter(),
+        cpu=t.user + t.system + t.children_user + t.children_system,
+    )
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux, bytes on macOS
+        scale = 2**20 if sys.platform == "darwin" else 2**10
+        for key, who in ("max_rss", "SELF"), ("max_rss_children", "CHILDREN"):
+            usage = resource.getrusage(getattr(resource, f"RUSAGE_{who}"))
+            result[key] = usage.ru_maxrss / scale
+    return result
+
+
+def _load_prior(path: Path, base: "Scenario") -> "Scenario | None":
+    """Load the scenario recorded in the file at `path`, if both exist."""
+    from ixmp import Platform
+    from message_ix import Scenario
+
+    try:
+        info = json.loads(path.read_text())
+        mp = (
+            base.platform
+            if info["platform"] == base.platform.name
+            else Platform(name=info["platform"])
+        )
+        return Scenario(
+            mp, model=info["model"], scenario=info["scenario"], version=info["version"]
+        )
+    except Exception as e:
+        log.debug(f"No prior result at {path}: {e!r}")
+        return None
+
+
+def _record(path: Path | None, s: "Scenario") -> "Scenario":
+    """Record identifiers of `s` in the file at `path`; return `s`."""
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        info = dict(
+            platform=s.platform.name,
+            model=s.model,
+            scenario=s.scenario,
+            version=s.version,
+        )
+        path.write_text(json.dumps(info))
+    return s
+
+
 class Workflow(Computer):
     """Workflow for operations on multiple :class:`Scenarios <message_ix.Scenario>`.
 
@@ -149,9 +343,17 @@ class Workflow(Computer):
         Context object with settings common to the entire workflow.
     """
 
+    #: Time and memory usage of each step executed by the most recent call to
+    #: :meth:`run`. One row per step; columns given by :data:`PROFILE_COLUMNS`.
+    profile: pd.DataFrame | None = None
+
+    #: Platforms used to load the scenarios produced by :meth:`run_parallel`, by name.
+    _platforms: dict[str, "Platform"]
+
     def __init__(self, context: "Context") -> None:
         super().__init__()
         self.add_single("context", context)
+        self._platforms = dict()
 
     def add_step(
         self,
@@ -198,15 +400,165 @@ class Workflow(Computer):
         # Add to the Computer; return the name of the added step
         return str(self.add_single(name, step, "context", base, strict=True))
 
-    def run(self, name: str) -> Any:
+    def run(
+        self, name: str, parallel: int = 1, executor: "Executor | None" = None
+    ) -> Any:
         """Run all workflow steps necessary to produce `name`.
 
         Parameters
         ----------
         name: str
             Identifier of step to run.
+        parallel : int, optional
+            If greater than 1, execute up to this many steps concurrently, each in a
+            separate process. See :meth:`run_parallel`.
+        executor : concurrent.futures.Executor, optional
+            Executor for concurrent execution. Implies :meth:`run_parallel`.
+
+        Time and memory usage of each step are stored as :attr:`profile`, and logged.
+        """
+        if parallel > 1 or executor is not None:
+            result = self.run_parallel(name, parallel, executor)
+        else:
+            result = self.get(name)
+            self.profile = pd.DataFrame.from_dict(
+                {k: self.graph[k][0].profile for k in self.iter_steps(name)},
+                orient="index",
+                columns=PROFILE_COLUMNS,
+            )
+
+        profile = self.profile
+        assert profile is not None  # Set by either branch above
+        log.info(f"Time (s) and memory (MiB) per step:\n{profile.to_string()}")
+        return result
+
+    def iter_steps(self, name: str | list[str]) -> list[str]:
+        """Return the names of all steps needed to produce `name`, in order.
+
+        Every step appears after the step that produces its base scenario. `name` may
+        be a single step name or a list of names.
+        """
+        from dask.core import get_dependencies
+
+        result: list[str] = []
+
+        def _visit(key):
+            if key in result:
+                return
+            for dep in sorted(get_dependencies(self.graph, key)):
+                _visit(dep)
+            if isinstance(self.graph[key], tuple) and isinstance(
+                self.graph[key][0], WorkflowStep
+            ):
+                result.append(key)
+
+        for n in [name] if isinstance(name, str) else name:
+            _visit(n)
+        return result
+
+    def run_parallel(
+        self, name: str, parallel: int = 2, executor: "Executor | None" = None
+    ) -> Any:
+        """Run steps to produce `name`, executing independent steps concurrently.
+
+        Each step is submitted to `executor` as soon as the step producing its base
+        scenario has completed. Each step receives its own copy of the "context" and
+        opens its own :class:`~ixmp.Platform` connection; the base scenario is loaded
+        using the platform name, model name, scenario name, and version produced by the
+        preceding step. This means that:
+
+        - With a :class:`~concurrent.futures.ProcessPoolExecutor`, including the
+          default, every :attr:`WorkflowStep.action` must be importable by name in a
+          new process: a function defined at the top level of a module, not a
+          :py:`lambda` or a function defined inside another function. Other steps are
+          not submitted if any action does not satisfy this.
+        - Changes made by an action to its :class:`.Context` argument are not seen by
+          subsequent steps.
+        - The scenarios must be stored on a Platform that supports concurrent access
+          from multiple processes; for instance, *not* a local, file-based HyperSQL
+          database.
+
+        The time and memory usage of each step are stored as :attr:`profile`.
+
+        Parameters
+        ----------
+        parallel : int
+            Number of worker processes, if `executor` is not given.
+        executor : concurrent.futures.Executor, optional
+            If not given, a :class:`~concurrent.futures.ProcessPoolExecutor` is used.
+
+        Returns
+        -------
+        Any
+            The same as :meth:`run`. Scenarios from completed steps are (re)loaded from
+            their respective platforms.
+
+        Raises
+        ------
+        TypeError
+            if `executor` is a :class:`~concurrent.futures.ProcessPoolExecutor` and the
+            action of any step cannot be pickled.
         """
-        return self.get(name)
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from multiprocessing import get_context
+
+        context = self.graph["context"]
+        todo = self.iter_steps(name)
+        result: dict[str, dict] = {}  # Identifiers of scenarios produced by each step
+        profile: dict[str, dict[str, float]] = {}
+        futures: dict = {}
+
+        if executor is None:
+            # Use "spawn" to avoid forking the parent process with a running JVM
+            executor = ProcessPoolExecutor(parallel, mp_context=get_context("spawn"))
+
+        if isinstance(executor, ProcessPoolExecutor):
+            # Check that all steps can be sent to worker processes before submitting any
+            _check_pickle({k: self.graph[k][0] for k in todo})
+
+        with executor:
+            while todo or futures:
+                # Submit all steps for which the base scenario is available
+                for key in list(todo):
+                    step, _, base = self.graph[key]
+                    if base is not None and base not in result:
+                        continue
+                    todo.remove(key)
+                    log.info(f"Submit step {key!r}")
+                    f = executor.submit(
+                        _run_step, step, deepcopy(context), result.get(base)
+                    )
+                    futures[f] = key
+
+                if not futures:
+                    raise RuntimeError(f"Unable to schedule steps {todo!r}")
+
+                # Wait for ≥1 step to complete
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for f in done:
+                    key = futures.pop(f)
+                    try:
+                        result[key], profile[key] = f.result()
+                    except Exception:
+                        for other in futures:
+                            other.cancel()
+                        log.error(f"Step {key!r} failed")
+                        raise
+                    log.info(f"Step {key!r} completed in {profile[key]['wall']:.1f} s")
+
+        self.profile = pd.DataFrame.from_dict(
+            profile, orient="index", columns=PROFILE_COLUMNS
+        )
+
+        # Temporarily replace each completed step with a task that loads its result.
+        # Steps may use different platforms, so these are not retrieved via "context".
+        original = {k: self.graph[k] for k in result}
+        try:
+            for key, info in result.items():
+                self.graph[key] = (partial(_load_scenario, info, self._platforms),)
+            return self.get(name)
+        finally:
+            self.graph.update(original)
 
     def truncate(self, name: str) -> None:
         """Truncate the workflow at the step `name`.
@@ -285,7 +637,13 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
         displayed.
       - :program:`--from`: Truncate the workflow at any step(s) whose names are a full
         match for this regular expression.
+      - :program:`--parallel`: Run up to this many independent steps concurrently,
+        using :meth:`.Workflow.run_parallel`.
+      - :program:`--resume`: Skip steps that were already run with identical inputs
+        and for which the target scenario exists. See :attr:`.Config.resume`.
 
+    - when run with :program:`--go`, writes :attr:`.Workflow.profile` to files
+      :file:`{slug}-workflow-profile.csv` and :file:`.json`.
     - uses the :attr:`~.Computer.default_key` (if any) of the :class:`.Workflow`
       returned by `wf_callback`, if the user does not provide :program:`TARGET` on the
       command-line.
@@ -298,7 +656,7 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
     name : str
         Descriptive workflow name used in the :program:`--help` text.
     slug : str
-        File name fragment for writing the workflow diagram; the path
+        File name fragment for writing the workflow diagram and profile; the path
         :file:`{slug}-workflow.svg` is used.
     kwargs : optional
         Passed to :func:`click.command`, for instance to define additional parameters
@@ -317,9 +675,29 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
     @click.option(
         "--from", "truncate_step", help="Truncate workflow at matching step(s)."
     )
+    @click.option(
+        "--resume",
+        is_flag=True,
+        help="Skip steps already run with identical inputs.",
+    )
+    @click.option(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N independent steps concurrently.",
+    )
     @click.argument("target_step", metavar="TARGET", required=False)
     @click.pass_obj
-    def _func(context, go, truncate_step, target_step: str | None, **kwargs):
+    def _func(
+        context,
+        go,
+        truncate_step,
+        resume,
+        parallel,
+        target_step: str | None,
+        **kwargs,
+    ):
         from importlib import import_module
 
         from message_ix_models.util import show_versions
@@ -381,11 +759,79 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
             wf.visualize(path, key=target_step, rankdir="LR")
             return
 
-        wf.run(target_step)
+        context.core.resume = resume
+        wf.run(target_step, parallel=parallel)
+
+        # Write time and memory usage of each step
+        path = context.get_local_path(f"{slug}-workflow-profile.csv")
+        log.info(f"Write workflow profile to {path} and {path.with_suffix('.json')}")
+        assert wf.profile is not None
+        wf.profile.to_csv(path, index_label="step")
+        wf.profile.to_json(path.with_suffix(".json"), orient="index", indent=2)
 
     return _func
 
 
+def _check_pickle(steps: Mapping[str, WorkflowStep]) -> None:
+    """Raise :class:`TypeError` if any of `steps` cannot be pickled.
+
+    Used by :meth:`.Workflow.run_parallel`.
+    """
+    import pickle
+
+    for key, step in steps.items():
+        try:
+            pickle.dumps(step)
+        except (AttributeError, TypeError, pickle.PicklingError) as e:
+            raise TypeError(
+                f"Step {key!r} cannot be run in another process; its action must be "
+                "a function defined at the top level of a module"
+            ) from e
+
+
+def _load_scenario(info: dict, platforms: dict[str, "Platform"]) -> "Scenario":
+    """Load the scenario identified by `info`, as returned by :func:`_run_step`.
+
+    :class:`~ixmp.Platform` instances are reused from, or stored in, `platforms`, so
+    the caller must keep a reference to it for as long as the scenario is used.
+    """
+    from ixmp import Platform
+    from message_ix import Scenario
+
+    if info["platform"] not in platforms:
+        platforms[info["platform"]] = Platform(name=info["platform"])
+
+    return Scenario(
+        platforms[info["platform"]],
+        model=info["model"],
+        scenario=info["scenario"],
+        version=info["version"],
+    )
+
+
+def _run_step(
+    step: WorkflowStep, context: "Context", base: dict | None
+) -> tuple[dict, dict[str, float]]:
+    """Execute `step` on the scenario identified by `base`.
+
+    Used by :meth:`.Workflow.run_parallel`, possibly in a separate process. Returns
+    identifiers for the resulting scenario and :attr:`.WorkflowStep.profile`.
+    """
+    platforms: dict[str, "Platform"] = dict()
+    scenario = None if base is None else _load_scenario(base, platforms)
+
+    s = step(context, scenario)
+    result = dict(
+        platform=s.platform.name, model=s.model, scenario=s.scenario, version=s.version
+    )
+
+    # Release database connections, e.g. locks on file-based databases
+    for p in {id(x.platform): x.platform for x in filter(None, [s, scenario])}.values():
+        p.close_db()
+
+    return result, step.profile
+
+
 def solve(context: "Context", scenario: "Scenario", **kwargs) -> "Scenario":
     scenario.solve(**kwargs)
     return scenario